@@ -53,6 +53,10 @@ vdb_manager.db_manager = db
 
 logger.info("✅ 데이터베이스 매니저 초기화 완료")
 
+# 2단계 검색용 회의 centroid 인덱스를 백그라운드에서 미리 로드 (첫 챗봇 요청이 기다리지 않도록)
+if config.COARSE_RETRIEVAL_ENABLED:
+    vdb_manager.warm_centroid_index()
+
 
 # ==================== Context Processor ====================
 @app.context_processor
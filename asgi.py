@@ -0,0 +1,35 @@
+"""
+Minute AI - ASGI 진입점
+LLM 호출이 포함된 엔드포인트(챗봇, 문단 요약, 회의록 생성)는 비동기 핸들러로 처리하고,
+나머지 라우트(페이지, 업로드, 회의 관리 등)는 기존 Flask 앱으로 전달합니다.
+
+- routes/async_api.py : 비동기 핸들러 (Gemini 응답 대기 중 스레드를 점유하지 않음)
+- Flask 앱 : a2wsgi 스레드 풀에서 실행 (ASGI_WSGI_WORKERS)
+- 로그인 세션은 Flask 서명 쿠키를 그대로 읽어 공유
+
+실행 방법:
+    uvicorn asgi:application --host 0.0.0.0 --port 5050
+"""
+from a2wsgi import WSGIMiddleware
+
+from config import config
+from app import app
+from routes.async_api import async_router
+from utils.asgi_support import AsgiRequest, load_flask_session
+
+# Flask 앱 (비동기 핸들러가 없는 경로 처리)
+flask_application = WSGIMiddleware(app, workers=config.ASGI_WSGI_WORKERS)
+
+
+async def application(scope, receive, send):
+    """ASGI 앱 - 비동기 라우트와 일치하면 직접 처리, 아니면 Flask로 전달"""
+    if scope['type'] == 'http':
+        matched = async_router.match(scope['method'], scope['path'])
+        if matched:
+            handler, path_params = matched
+            request = AsgiRequest(scope, receive, path_params)
+            request.session = load_flask_session(app, request)
+            await handler(request, send, **path_params)
+            return
+
+    await flask_application(scope, receive, send)
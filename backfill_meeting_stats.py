@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+회의 통계(meeting_stats) 백필 스크립트
+meeting_stats 테이블이 추가되기 전에 업로드된 회의의 통계를 계산합니다.
+
+실행 방법:
+    python backfill_meeting_stats.py          # 통계가 없는 회의만 계산
+    python backfill_meeting_stats.py --force  # 모든 회의 통계 재계산
+"""
+
+import sys
+
+from config import config
+from utils.db_manager import DatabaseManager
+
+
+def main():
+    force = "--force" in sys.argv[1:]
+
+    print("=" * 70)
+    print("📊 회의 통계 백필 시작" + (" (전체 재계산)" if force else ""))
+    print("=" * 70)
+
+    db = DatabaseManager(str(config.DATABASE_PATH))
+    count = db.backfill_meeting_stats(force=force)
+
+    print(f"✅ {count}개 회의의 통계를 계산했습니다.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+BM25 인덱스 벤치마크 스크립트
+합성 한국어 청크로 인덱스 구축 시간, 쿼리 지연 시간, 증분 추가/삭제 시간을 측정합니다.
+
+실행 방법:
+    python benchmark_bm25.py                 # 100,000개 청크
+    python benchmark_bm25.py --docs 20000    # 청크 수 지정
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from utils.bm25_index import BM25Index
+
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히"
+PARTICLES = ["은", "는", "이", "가", "을", "를", "에서", "으로", "에게", "와", "과", "도", ""]
+
+
+def build_vocabulary(rng, size=20000):
+    """2~4음절 합성 단어 사전 생성"""
+    return [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+
+def make_chunk(rng, vocabulary, target_chars=1000):
+    """조사가 붙은 합성 단어와 숫자로 약 target_chars 길이의 청크 생성"""
+    words = []
+    length = 0
+    while length < target_chars:
+        if rng.random() < 0.05:
+            word = f"{rng.randint(1, 2025)}년"
+        else:
+            # 지프 분포에 가깝게 앞쪽 단어를 더 자주 사용
+            word = vocabulary[int(rng.paretovariate(1.1)) % len(vocabulary)] + rng.choice(PARTICLES)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+
+def percentile(values, p):
+    return float(np.percentile(values, p)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 인덱스 벤치마크")
+    parser.add_argument("--docs", type=int, default=100_000, help="청크 수")
+    parser.add_argument("--meetings", type=int, default=2_000, help="회의 수")
+    parser.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = build_vocabulary(rng)
+
+    print("=" * 70)
+    print(f"📊 BM25 벤치마크: 청크 {args.docs:,}개, 회의 {args.meetings:,}개")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    texts = [make_chunk(rng, vocabulary) for _ in range(args.docs)]
+    doc_ids = [f"doc_{i}" for i in range(args.docs)]
+    meeting_ids = [f"meeting_{i % args.meetings}" for i in range(args.docs)]
+    print(f"📝 합성 데이터 생성: {time.perf_counter() - start:.1f}초")
+
+    # 1. 대량 구축 (delta에 적재 후 1회 병합)
+    index = BM25Index()
+    start = time.perf_counter()
+    batch_size = 5000
+    for i in range(0, args.docs, batch_size):
+        index.add_documents(doc_ids[i:i + batch_size], texts[i:i + batch_size],
+                            meeting_ids[i:i + batch_size], merge=False)
+    index.merge()
+    build_seconds = time.perf_counter() - start
+    print(f"🏗️ 인덱스 구축: {build_seconds:.1f}초 ({args.docs / build_seconds:,.0f} 청크/초), "
+          f"postings {len(index._post_docs):,}개, 어휘 {len(index._vocab):,}개")
+
+    # 2. 쿼리 지연 시간 (전체 / 회의 10개로 제한)
+    queries = [' '.join(rng.sample(vocabulary[:2000], rng.randint(1, 3))) for _ in range(args.queries)]
+    for label, scope in [("전체", None), ("회의 10개", [f"meeting_{i}" for i in range(10)])]:
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, k=20, meeting_ids=scope)
+            latencies.append(time.perf_counter() - start)
+        print(f"🔍 쿼리 ({label}): p50 {percentile(latencies, 50):.1f}ms, p95 {percentile(latencies, 95):.1f}ms")
+
+    # 3. 증분 추가 / 삭제
+    new_texts = [make_chunk(rng, vocabulary) for _ in range(20)]
+    start = time.perf_counter()
+    index.add_documents([f"new_{i}" for i in range(20)], new_texts, ["meeting_new"] * 20)
+    print(f"➕ 회의 1개(청크 20개) 추가: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    removed = index.remove_meeting("meeting_new")
+    print(f"🗑️ 회의 1개(청크 {removed}개) 삭제: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+LLM 엔드포인트 동시 요청 부하 테스트 스크립트
+동시 요청 수를 늘려 가며 처리량, 지연 시간(p50/p95/p99), 실패 수를 측정합니다.
+같은 조건으로 Flask 개발 서버와 ASGI 서버를 각각 측정해 비교합니다.
+
+    python app.py                                   # Flask (요청당 스레드)
+    uvicorn asgi:application --port 5050            # ASGI (LLM 대기는 이벤트 루프)
+
+실행 방법 (로그인한 브라우저의 session 쿠키 값 사용):
+    python benchmark_llm_endpoints.py --cookie <session> --concurrency 10,50,200
+    python benchmark_llm_endpoints.py --cookie <session> --endpoint chat_stream --meeting-id <id>
+    python benchmark_llm_endpoints.py --cookie <session> --endpoint summarize --meeting-id <id> --requests 100
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+import numpy as np
+
+
+def build_request(args):
+    """엔드포인트별 요청 (path, json)"""
+    if args.endpoint == "chat":
+        return "/api/chat", {"query": args.query, "meeting_id": args.meeting_id}
+    if args.endpoint == "chat_stream":
+        return "/api/chat/stream", {"query": args.query, "meeting_id": args.meeting_id}
+    if not args.meeting_id:
+        raise SystemExit(f"❌ {args.endpoint} 엔드포인트는 --meeting-id가 필요합니다.")
+    if args.endpoint == "summarize":
+        return f"/api/summarize/{args.meeting_id}", None
+    return f"/api/generate_minutes/{args.meeting_id}", None
+
+
+async def send_one(client, path, payload):
+    """
+    요청 1건 실행 (SSE는 스트림이 끝날 때까지 읽음)
+
+    Returns:
+        tuple: (성공 여부, 전체 지연 시간(초), 첫 바이트 지연 시간(초))
+    """
+    started = time.perf_counter()
+    first_byte = None
+    async with client.stream("POST", path, json=payload) as response:
+        async for chunk in response.aiter_bytes():
+            if first_byte is None and chunk:
+                first_byte = time.perf_counter() - started
+        ok = response.status_code == 200
+    return ok, time.perf_counter() - started, first_byte
+
+
+async def run_level(args, concurrency):
+    """동시 요청 수 한 단계 측정"""
+    path, payload = build_request(args)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, first_bytes = [], []
+    failures = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        cookies={"session": args.cookie},
+        timeout=args.timeout,
+        limits=limits
+    ) as client:
+
+        async def worker():
+            nonlocal failures
+            async with semaphore:
+                try:
+                    ok, latency, first_byte = await send_one(client, path, payload)
+                except httpx.HTTPError:
+                    failures += 1
+                    return
+                if not ok:
+                    failures += 1
+                    return
+                latencies.append(latency)
+                if first_byte is not None:
+                    first_bytes.append(first_byte)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "ok": len(latencies),
+        "failures": failures,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "latencies": latencies,
+        "first_bytes": first_bytes
+    }
+
+
+def percentile(values, p):
+    return float(np.percentile(values, p)) * 1000 if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 엔드포인트 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:5050", help="서버 주소")
+    parser.add_argument("--cookie", required=True, help="로그인 세션 쿠키(session) 값")
+    parser.add_argument("--endpoint", choices=["chat", "chat_stream", "summarize", "minutes"], default="chat",
+                        help="측정할 엔드포인트")
+    parser.add_argument("--meeting-id", default=None, help="회의 ID (summarize/minutes 필수, chat은 단일 회의 질문)")
+    parser.add_argument("--query", default="이번 회의에서 결정된 사항을 정리해줘", help="챗봇 질문")
+    parser.add_argument("--concurrency", default="10,50,200", help="동시 요청 수 (쉼표로 여러 단계)")
+    parser.add_argument("--requests", type=int, default=200, help="단계별 요청 수")
+    parser.add_argument("--timeout", type=float, default=300.0, help="요청 타임아웃 (초)")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    print("=" * 70)
+    print(f"📊 부하 테스트: {args.url} {args.endpoint}, 단계별 {args.requests}건")
+    print("=" * 70)
+    print(f"{'동시 요청':>8} {'성공':>6} {'실패':>6} {'처리량(req/s)':>14} "
+          f"{'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10} {'첫 바이트 p50(ms)':>18}")
+
+    for concurrency in levels:
+        result = asyncio.run(run_level(args, concurrency))
+        print(f"{result['concurrency']:>8} {result['ok']:>6} {result['failures']:>6} {result['throughput']:>14.2f} "
+              f"{percentile(result['latencies'], 50):>10.0f} {percentile(result['latencies'], 95):>10.0f} "
+              f"{percentile(result['latencies'], 99):>10.0f} {percentile(result['first_bytes'], 50):>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
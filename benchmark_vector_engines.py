@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+벡터 엔진 벤치마크 스크립트
+플랫 인덱스(float16 / int8)와 Chroma(HNSW)의 recall@k 및 p50/p99 검색 지연 시간을 비교합니다.
+정답(ground truth)은 float32 전수 코사인 검색 결과입니다.
+
+실행 방법:
+    python benchmark_vector_engines.py                         # 5,000개 청크, 1536차원
+    python benchmark_vector_engines.py --docs 20000 --dim 768
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from utils.flat_vector_store import FlatIndex
+
+
+def make_corpus(rng, docs, dim, meetings, clusters=50):
+    """클러스터 구조를 가진 합성 임베딩 생성 (실제 회의 청크처럼 주제별로 뭉친 분포)"""
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    assignment = rng.integers(0, clusters, size=docs)
+    vectors = centers[assignment] + 0.6 * rng.standard_normal((docs, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    meeting_ids = [f"meeting_{i % meetings}" for i in range(docs)]
+    return vectors, meeting_ids
+
+
+def exact_top_k(vectors, query, k, rows=None):
+    """float32 전수 검색 정답"""
+    candidates = np.arange(len(vectors)) if rows is None else rows
+    scores = vectors[candidates] @ query
+    return set(candidates[np.argsort(-scores)[:k]].tolist())
+
+
+def summarize(label, latencies, recalls):
+    latencies = np.asarray(latencies) * 1000
+    print(f"   {label:<22} recall {np.mean(recalls):.3f}   "
+          f"p50 {np.percentile(latencies, 50):6.2f}ms   p99 {np.percentile(latencies, 99):6.2f}ms")
+
+
+def run_flat(dtype, vectors, meeting_ids, queries, scopes, truths, k, workdir):
+    index = FlatIndex(f"{workdir}/flat_{dtype}", dtype=dtype)
+    ids = [str(i) for i in range(len(vectors))]
+    metadatas = [{'meeting_id': m} for m in meeting_ids]
+
+    start = time.perf_counter()
+    for i in range(0, len(ids), 5000):
+        index.add(ids[i:i + 5000], vectors[i:i + 5000], metadatas=metadatas[i:i + 5000])
+    build_seconds = time.perf_counter() - start
+
+    latencies, recalls = [], []
+    for query, scope, truth in zip(queries, scopes, truths):
+        where = {'meeting_id': scope} if scope else None
+        start = time.perf_counter()
+        results = index.query(query, k=k, where=where)
+        latencies.append(time.perf_counter() - start)
+        recalls.append(len({int(r[0]) for r in results} & truth) / len(truth))
+    return build_seconds, latencies, recalls
+
+
+def run_chroma(vectors, meeting_ids, queries, scopes, truths, k):
+    import chromadb
+
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection(name="benchmark", metadata={"hnsw:space": "cosine"})
+    ids = [str(i) for i in range(len(vectors))]
+    metadatas = [{'meeting_id': m} for m in meeting_ids]
+
+    start = time.perf_counter()
+    for i in range(0, len(ids), 5000):
+        collection.add(ids=ids[i:i + 5000], embeddings=vectors[i:i + 5000].tolist(), metadatas=metadatas[i:i + 5000])
+    build_seconds = time.perf_counter() - start
+
+    latencies, recalls = [], []
+    for query, scope, truth in zip(queries, scopes, truths):
+        where = {'meeting_id': scope} if scope else None
+        start = time.perf_counter()
+        results = collection.query(query_embeddings=[query.tolist()], n_results=k, where=where)
+        latencies.append(time.perf_counter() - start)
+        recalls.append(len({int(i) for i in results['ids'][0]} & truth) / len(truth))
+    return build_seconds, latencies, recalls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벡터 엔진 벤치마크")
+    parser.add_argument("--docs", type=int, default=5_000, help="청크 수")
+    parser.add_argument("--dim", type=int, default=1536, help="임베딩 차원")
+    parser.add_argument("--meetings", type=int, default=100, help="회의 수")
+    parser.add_argument("--queries", type=int, default=300, help="쿼리 수")
+    parser.add_argument("--k", type=int, default=10, help="top-k")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors, meeting_ids = make_corpus(rng, args.docs, args.dim, args.meetings)
+    meeting_array = np.array(meeting_ids)
+
+    # 쿼리: 임의 문서 근처의 벡터, 절반은 단일 회의로 제한
+    picks = rng.integers(0, args.docs, size=args.queries)
+    queries = vectors[picks] + 0.3 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    scopes = [meeting_ids[p] if i % 2 else None for i, p in enumerate(picks)]
+    truths = [
+        exact_top_k(vectors, q, args.k, None if scope is None else np.flatnonzero(meeting_array == scope))
+        for q, scope in zip(queries, scopes)
+    ]
+
+    print("=" * 70)
+    print(f"📊 벡터 엔진 벤치마크: 청크 {args.docs:,}개, {args.dim}차원, 회의 {args.meetings}개, top-{args.k}")
+    print("   (쿼리의 절반은 meeting_id 필터 적용)")
+    print("=" * 70)
+
+    workdir = tempfile.mkdtemp(prefix="vector_bench_")
+    try:
+        for dtype in ("float16", "int8"):
+            build_seconds, latencies, recalls = run_flat(dtype, vectors, meeting_ids, queries, scopes, truths,
+                                                         args.k, workdir)
+            summarize(f"flat ({dtype})", latencies, recalls)
+            print(f"   {'':<22} 구축 {build_seconds:.2f}초")
+
+        try:
+            build_seconds, latencies, recalls = run_chroma(vectors, meeting_ids, queries, scopes, truths, args.k)
+            summarize("chroma (hnsw)", latencies, recalls)
+            print(f"   {'':<22} 구축 {build_seconds:.2f}초")
+        except ImportError:
+            print("   ⚠️ chromadb가 설치되지 않아 Chroma 비교를 건너뜁니다.")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 import os
 import logging
 from pathlib import Path
-from typing import Set, Optional
+from typing import Set, Optional, Dict
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -30,6 +30,11 @@ class Config:
     DEBUG: bool = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     PORT: int = int(os.getenv('FLASK_PORT', '5050'))
 
+    # ==================== ASGI 서버 설정 ====================
+    # uvicorn asgi:application 실행 시 Flask 라우트(업로드, 페이지 등)를 처리하는 스레드 수
+    # (챗봇/요약/회의록 생성은 비동기 핸들러에서 처리되어 스레드를 사용하지 않음)
+    ASGI_WSGI_WORKERS: int = int(os.getenv('ASGI_WSGI_WORKERS', '16'))
+
     # ==================== Firebase 설정 ====================
     FIREBASE_API_KEY: str = os.getenv('FIREBASE_API_KEY', '')
     FIREBASE_AUTH_DOMAIN: str = os.getenv('FIREBASE_AUTH_DOMAIN', '')
@@ -51,14 +56,93 @@ class Config:
     # ==================== STT 설정 ====================
     DEFAULT_TIME_INCREMENT_SECONDS: float = 5.0
 
+    # ==================== 회의록 생성 설정 ====================
+    MINUTES_PROMPT_TOKEN_BUDGET: int = int(os.getenv('MINUTES_PROMPT_TOKEN_BUDGET', '32000'))  # 회의록 프롬프트 토큰 예산 (템플릿 포함)
+    MINUTES_SUMMARY_MAX_SHARE: float = 0.3  # 문단 요약이 쓸 수 있는 최대 예산 비율 (나머지는 스크립트)
+    MINUTES_PRECOMPUTE_DEFAULT: bool = os.getenv('MINUTES_PRECOMPUTE_DEFAULT', 'false').lower() == 'true'  # 업로드 후 회의록 미리 생성 (사용자 설정이 없을 때 기본값)
+    MINUTES_PRECOMPUTE_WORKERS: int = 2  # 회의록 백그라운드 생성 스레드 수
+
     # ==================== 청킹(Chunking) 설정 ====================
     CHUNK_SIZE: int = 1000  # 텍스트 청크 최대 크기
     CHUNK_OVERLAP: int = 200  # 청크 중복 크기
     TIME_GAP_THRESHOLD_SECONDS: int = 60  # 화자 변경 인식 기준 (초)
 
+    # ==================== 임베딩 백엔드 설정 ====================
+    EMBEDDING_BACKEND: str = os.getenv('EMBEDDING_BACKEND', 'openai')  # openai 또는 hashed_ngram (로컬)
+    LOCAL_EMBEDDING_DIM: int = int(os.getenv('LOCAL_EMBEDDING_DIM', '1024'))  # 로컬 백엔드 임베딩 차원
+
+    # ==================== 벡터 엔진 설정 ====================
+    VECTOR_ENGINE: str = os.getenv('VECTOR_ENGINE', 'chroma')  # chroma 또는 flat (메모리 매핑 NumPy 인덱스)
+    FLAT_INDEX_FOLDER = DATABASE_FOLDER / "flat_index"
+    FLAT_INDEX_DTYPE: str = os.getenv('FLAT_INDEX_DTYPE', 'float16')  # float16 또는 int8
+    FLAT_INDEX_COMPACT_RATIO: float = 0.25  # 삭제된 행 비율이 이 값을 넘으면 압축
+
+    # ==================== 인덱스 버전 / 재인덱싱 설정 ====================
+    VECTOR_INDEX_STATE_PATH = DATABASE_FOLDER / "vector_index_state.db"  # 인덱스 버전 포인터 및 체크포인트
+    REINDEX_BATCH_MEETINGS: int = 20  # 재인덱싱 시 한 번에 임베딩할 회의 수 (배치 단위로 체크포인트 기록)
+
+    # ==================== 임베딩 캐시 설정 ====================
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv('EMBEDDING_CACHE_ENABLED', 'True').lower() == 'true'
+    EMBEDDING_CACHE_PATH = DATABASE_FOLDER / "embedding_cache.db"
+    EMBEDDING_CACHE_DTYPE: str = os.getenv('EMBEDDING_CACHE_DTYPE', 'float32')  # float32 또는 float16
+    QUERY_EMBEDDING_CACHE_SIZE: int = 256  # 최근 쿼리 임베딩 LRU 캐시 크기
+
+    # ==================== 회의 텍스트 캐시 설정 ====================
+    ASSEMBLED_TEXT_CACHE_PATH = DATABASE_FOLDER / "assembled_text_cache.db"  # 회의별 결합 청크/요약 텍스트
+    ASSEMBLED_TEXT_CACHE_SIZE: int = 256  # 메모리 LRU 최대 회의 수 (초과분은 SQLite에서 조회)
+
+    # ==================== 회의 컨텍스트 캐시 설정 ====================
+    # 단일 회의 챗봇에서 회의 전사/요약을 한 번만 업로드하고 이후 질문은 캐시를 참조
+    MEETING_CONTEXT_CACHE: str = os.getenv('MEETING_CONTEXT_CACHE', 'off')  # off, gemini, local
+    MEETING_CONTEXT_CACHE_TTL: int = 3600  # 컨텍스트 캐시 유효 시간 (초)
+    MEETING_CONTEXT_CACHE_MIN_TOKENS: int = 1024  # 이보다 짧은 회의는 캐시 없이 일반 검색 사용 (Gemini 최소 캐시 크기)
+    MEETING_CONTEXT_CACHE_MAX_TOKENS: int = 200000  # 이보다 긴 회의는 캐시 없이 일반 검색 사용
+
     # ==================== 검색 설정 ====================
-    SEARCH_RESULTS_PER_COLLECTION: int = 3  # 컬렉션당 검색 결과 수
     SEARCH_MULTIPLIER: int = 10  # 검색 결과 배수
+    CHAT_RETRIEVER_TYPE: str = os.getenv('CHAT_RETRIEVER_TYPE', 'similarity')  # similarity, mmr, self_query, hybrid 등
+    HYBRID_CANDIDATES: int = 50  # 하이브리드 검색 시 BM25/벡터 각각의 후보 수
+    HYBRID_RRF_K: int = 60  # Reciprocal Rank Fusion 상수
+    VECTOR_FILTER_MAX_IDS: int = 1000  # 벡터 검색 meeting_id $in 필터 최대 ID 수 (초과 시 배치 검색)
+    COARSE_RETRIEVAL_ENABLED: bool = os.getenv('COARSE_RETRIEVAL_ENABLED', 'true').lower() == 'true'  # 회의 centroid로 후보 회의를 먼저 선택
+    COARSE_CANDIDATE_MEETINGS: int = 20  # 1단계에서 선택할 후보 회의 수
+    MEETING_CENTROIDS_MAX: int = 3  # 회의당 최대 centroid 수
+    CHUNKS_PER_CENTROID: int = 10  # centroid 1개당 최소 청크 수
+    SELF_QUERY_CACHE_SIZE: int = 1024  # SelfQuery 구조화 쿼리 캐시 최대 항목 수
+    SELF_QUERY_CACHE_TTL: int = 3600  # SelfQuery 구조화 쿼리 캐시 유효 시간 (초)
+    ANSWER_CACHE_ENABLED: bool = os.getenv('ANSWER_CACHE_ENABLED', 'true').lower() == 'true'  # 챗봇 시맨틱 답변 캐시
+    # 캐시 답변을 재사용할 최소 질문 유사도 (코사인, 임베딩 백엔드별)
+    # hashed_ngram은 글자 겹침 기반이라 조사 하나만 달라도 0.9 안팎 → 거의 같은 문장만 재사용
+    ANSWER_CACHE_THRESHOLDS: Dict[str, float] = {'openai': 0.95, 'hashed_ngram': 0.97}
+    ANSWER_CACHE_SCOPES: int = 256  # 답변 캐시 최대 검색 범위(접근 가능한 회의 집합) 수
+    ANSWER_CACHE_ENTRIES_PER_SCOPE: int = 64  # 검색 범위별 최대 캐시 질문 수
+    ANSWER_CACHE_TTL: int = 86400  # 캐시 답변 유효 시간 (초)
+    CONTEXT_CANDIDATES_PER_COLLECTION: int = 8  # 컨텍스트 패킹 전 컬렉션당 검색 후보 수
+    CONTEXT_TOKEN_BUDGET: int = int(os.getenv('CONTEXT_TOKEN_BUDGET', '3000'))  # 답변 생성 컨텍스트 토큰 예산
+    CONTEXT_DEDUP_THRESHOLD: float = 0.6  # 이미 선택된 문서와 겹침 비율이 이 이상이면 중복으로 제외
+    CONTEXT_SHINGLE_SIZE: int = 5  # 중복 판단용 문자 shingle 길이
+    BATCH_QUESTIONS_MAX: int = 20  # 회의 일괄 질문 API 최대 질문 수
+    BATCH_CONTEXT_TOKEN_BUDGET: int = int(os.getenv('BATCH_CONTEXT_TOKEN_BUDGET', '8000'))  # 일괄 질문 공유 컨텍스트 토큰 예산
+    BATCH_FANOUT_WORKERS: int = 4  # 일괄 답변에서 빠진 질문을 개별 생성할 때 최대 동시 호출 수
+    TRANSCRIPT_SEARCH_LIMIT: int = 20  # 전사 키워드 검색 기본 결과 수
+    TRANSCRIPT_SEARCH_LIMIT_MAX: int = 100  # 전사 키워드 검색 최대 결과 수
+
+    # ==================== 챗봇 대화 메모리 설정 ====================
+    CONVERSATION_MEMORY_ENABLED: bool = os.getenv('CONVERSATION_MEMORY_ENABLED', 'true').lower() == 'true'  # 후속 질문용 대화 기록
+    CONVERSATION_REWRITE_ENABLED: bool = os.getenv('CONVERSATION_REWRITE_ENABLED', 'true').lower() == 'true'  # 후속 질문을 독립 질문으로 재작성해 검색
+    CONVERSATION_MAX: int = 1000  # 메모리에 유지할 최대 대화 수
+    CONVERSATION_TTL: int = 3600  # 마지막 질문 이후 대화 유지 시간 (초)
+    CONVERSATION_RECENT_TOKEN_BUDGET: int = 800  # 원문으로 유지할 최근 대화 토큰 예산 (넘치면 오래된 대화부터 요약)
+    CONVERSATION_MAX_RECENT_TURNS: int = 4  # 원문으로 유지할 최대 대화 턴 수
+    CONVERSATION_SUMMARY_MAX_TOKENS: int = 300  # 오래된 대화 요약 최대 토큰 수
+
+    # ==================== 노트 목록 설정 ====================
+    NOTES_PAGE_SIZE: int = 50  # 노트 목록 기본 페이지 크기
+    NOTES_PAGE_SIZE_MAX: int = 200  # 노트 목록 최대 페이지 크기
+
+    # ==================== 전사 구간 조회 설정 ====================
+    TRANSCRIPT_PAGE_SIZE: int = 200  # 구간 조회 기본 세그먼트 수
+    TRANSCRIPT_PAGE_SIZE_MAX: int = 1000  # 구간 조회 최대 세그먼트 수
 
     # ==================== 관리자 설정 ====================
     ADMIN_EMAILS: list = os.getenv('ADMIN_EMAILS', '').split(',') if os.getenv('ADMIN_EMAILS') else []
@@ -91,10 +175,13 @@ class Config:
         required_vars = [
             ('FLASK_SECRET_KEY', cls.SECRET_KEY),
             ('FIREBASE_API_KEY', cls.FIREBASE_API_KEY),
-            ('OPENAI_API_KEY', cls.OPENAI_API_KEY),
             ('GOOGLE_API_KEY', cls.GOOGLE_API_KEY),
         ]
 
+        # 로컬 임베딩 백엔드 사용 시 OpenAI 키는 선택 사항
+        if cls.EMBEDDING_BACKEND == 'openai':
+            required_vars.insert(2, ('OPENAI_API_KEY', cls.OPENAI_API_KEY))
+
         missing = [name for name, value in required_vars if not value]
 
         return (len(missing) == 0, missing)
@@ -149,6 +236,10 @@ class Config:
         print(f"   Google API Key:   {mask_key(cls.GOOGLE_API_KEY, show_secrets)}")
         print()
 
+        print(f"🧮 임베딩 백엔드: {cls.EMBEDDING_BACKEND}")
+        print(f"🗄️ 벡터 엔진: {cls.VECTOR_ENGINE}" + (f" ({cls.FLAT_INDEX_DTYPE})" if cls.VECTOR_ENGINE == "flat" else ""))
+        print()
+
         # 관리자 설정
         admin_count = len([e for e in cls.ADMIN_EMAILS if e.strip()])
         print(f"👑 관리자 이메일: {admin_count}개 설정됨")
@@ -115,8 +115,57 @@ def init_database():
     conn.commit()
     print("✅ meeting_shares 테이블 생성 완료")
 
-    # 6. Admin 사용자 생성
-    print("\n6️⃣ Admin 사용자 생성...")
+    # 6. meetings 테이블 (회의 단위 목록)
+    print("\n6️⃣ meetings 테이블 생성...")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meetings (
+            meeting_id TEXT PRIMARY KEY,
+            title TEXT,
+            meeting_date TEXT,
+            audio_file TEXT,
+            owner_id INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        INSERT OR IGNORE INTO meetings (meeting_id, title, meeting_date, audio_file, owner_id)
+        SELECT meeting_id, MAX(title), MAX(meeting_date), MIN(audio_file), MIN(owner_id)
+        FROM meeting_dialogues
+        WHERE meeting_id NOT IN (SELECT meeting_id FROM meetings)
+        GROUP BY meeting_id
+    """)
+    conn.commit()
+    print("✅ meetings 테이블 생성 완료")
+
+    # meeting_stats 테이블 (회의별 통계, 값은 backfill_meeting_stats.py로 채움)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meeting_stats (
+            meeting_id TEXT PRIMARY KEY,
+            segment_count INTEGER NOT NULL,
+            duration_seconds REAL,
+            avg_confidence REAL,
+            total_chars INTEGER NOT NULL,
+            speaker_stats TEXT NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.commit()
+    print("✅ meeting_stats 테이블 생성 완료")
+
+    # user_settings 테이블 (사용자별 설정, NULL이면 서버 기본값 사용)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS user_settings (
+            user_id INTEGER PRIMARY KEY,
+            minutes_precompute INTEGER,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    """)
+    conn.commit()
+    print("✅ user_settings 테이블 생성 완료")
+
+    # 7. Admin 사용자 생성
+    print("\n7️⃣ Admin 사용자 생성...")
     admin_emails = os.getenv('ADMIN_EMAILS', '').split(',')
     admin_emails = [email.strip() for email in admin_emails if email.strip()]
 
@@ -135,18 +184,22 @@ def init_database():
         print("⚠️  ADMIN_EMAILS 환경변수가 설정되지 않았습니다")
         print("    .env 파일에 ADMIN_EMAILS=your@email.com 추가하세요")
 
-    # 7. 인덱스 생성 (성능 최적화)
-    print("\n7️⃣ 인덱스 생성...")
+    # 8. 인덱스 생성 (성능 최적화)
+    print("\n8️⃣ 인덱스 생성...")
     try:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_meeting_id ON meeting_dialogues(meeting_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_owner_id ON meeting_dialogues(owner_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_dialogues_meeting_time ON meeting_dialogues(meeting_id, start_time, segment_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_shares_meeting ON meeting_shares(meeting_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(meeting_date, meeting_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_owner_date ON meetings(owner_id, meeting_date, meeting_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_shares_user ON meeting_shares(shared_with_user_id, meeting_id)")
         conn.commit()
         print("✅ 인덱스 생성 완료")
     except Exception as e:
         print(f"⚠️  인덱스 생성 중 일부 에러: {e}")
 
-    # 8. 최종 확인
+    # 9. 최종 확인
     print("\n" + "=" * 70)
     print("📊 생성된 테이블 확인:")
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")
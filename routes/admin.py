@@ -11,6 +11,7 @@ from utils.db_manager import DatabaseManager
 from utils.vector_db_manager import vdb_manager
 from utils.stt import STTManager
 from utils.decorators import login_required, admin_required
+from services.reindex_service import reindex_service
 
 # Blueprint 생성
 admin_bp = Blueprint('admin', __name__)
@@ -413,3 +414,76 @@ def delete_vector_db_entry():
         import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": f"벡터 DB 삭제 중 오류 발생: {str(e)}"}), 500
+
+
+@admin_bp.route("/api/reindex", methods=["POST"])
+@login_required
+@admin_required
+def start_reindex():
+    """
+    벡터 인덱스 재구축 시작 API (관리자 전용)
+    현재 청킹 설정(CHUNK_SIZE 등)과 임베딩 모델로 새 버전 컬렉션을 백그라운드에서 구축하고,
+    완료되면 활성 버전을 교체합니다. 중단된 재구축이 있으면 체크포인트부터 재개합니다.
+
+    Returns:
+        JSON: 재인덱싱 상태
+    """
+    try:
+        status = reindex_service.start()
+        return jsonify({"success": True, "status": status}), 202
+    except RuntimeError as e:
+        return jsonify({"success": False, "error": str(e)}), 409
+
+
+@admin_bp.route("/api/reindex/status", methods=["GET"])
+@login_required
+@admin_required
+def reindex_status():
+    """
+    벡터 인덱스 재구축 진행 상태 및 버전 목록 API (관리자 전용)
+
+    Returns:
+        JSON: {'reindex': {...}, 'active_version': str, 'versions': [...]}
+    """
+    return jsonify({"success": True, **reindex_service.get_status()})
+
+
+@admin_bp.route("/api/embedding_cache/stats", methods=["GET"])
+@login_required
+@admin_required
+def embedding_cache_stats():
+    """
+    임베딩 캐시 적중률 통계 API (관리자 전용)
+
+    Returns:
+        JSON: {'documents': {...} 또는 null (캐시 비활성화 시), 'queries': {...}}
+    """
+    return jsonify({"success": True, **vdb_manager.get_embedding_cache_stats()})
+
+
+@admin_bp.route("/api/reindex/activate", methods=["POST"])
+@login_required
+@admin_required
+def activate_index_version():
+    """
+    인덱스 버전 수동 교체 API (관리자 전용, 이전 버전으로 롤백할 때 사용)
+
+    Request JSON:
+        {"version": "v2"}
+
+    Returns:
+        JSON: 교체 결과
+    """
+    data = request.get_json() or {}
+    version = data.get("version")
+
+    record = vdb_manager.index_versions.get_version(version) if version else None
+    if record is None:
+        return jsonify({"success": False, "error": "존재하지 않는 인덱스 버전입니다."}), 404
+    if record['status'] not in ('active', 'retired') or record['embedding_backend'] != vdb_manager.embedding_backend:
+        return jsonify({"success": False, "error": "완료된 현재 임베딩 백엔드의 버전만 활성화할 수 있습니다."}), 400
+    if reindex_service.is_running():
+        return jsonify({"success": False, "error": "재인덱싱이 진행 중입니다."}), 409
+
+    previous = vdb_manager.swap_index_version(version)
+    return jsonify({"success": True, "previous_version": previous, "active_version": version})
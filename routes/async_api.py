@@ -0,0 +1,305 @@
+"""
+비동기(ASGI) API 라우트
+LLM 호출이 포함된 엔드포인트를 이벤트 루프에서 처리합니다 (asgi.py에서 Flask 앱 앞에 연결).
+Gemini 응답을 기다리는 동안 스레드를 점유하지 않으므로 느린 요청 수백 개가 동시에 대기할 수 있습니다.
+
+- POST /api/chat
+- POST /api/chat/stream
+- POST /api/chat/batch
+- POST /api/summarize/<meeting_id>
+- POST /api/generate_minutes/<meeting_id>
+
+요청/응답 형식과 권한 체크는 같은 경로의 Flask 라우트와 동일합니다.
+로컬 DB 조회·임베딩처럼 블로킹되는 작업은 asyncio.to_thread로 실행합니다.
+"""
+import asyncio
+import logging
+from functools import wraps
+
+from config import config
+from utils.asgi_support import AsyncRouter, send_json, send_event_stream
+from utils.vector_db_manager import vdb_manager
+from utils.user_manager import can_access_meeting
+from routes.chat import chat_manager, resolve_accessible_meeting_ids, resolve_conversation_key
+from routes.summary import db, stt_manager
+from utils.validation import validate_batch_questions
+from utils.single_flight import single_flight, content_version
+
+logger = logging.getLogger(__name__)
+
+# 비동기 라우터 (asgi.py에서 요청 분기에 사용)
+async_router = AsyncRouter()
+
+
+def async_login_required(handler):
+    """@login_required의 비동기 버전 (API 전용 - 401 JSON 응답)"""
+    @wraps(handler)
+    async def decorated_function(request, send, **kwargs):
+        if 'user_id' not in request.session:
+            await send_json(send, {'error': '로그인이 필요합니다.', 'redirect': '/login'}, status=401)
+            return
+        await handler(request, send, **kwargs)
+
+    return decorated_function
+
+
+async def _check_meeting_access(send, user_id, meeting_id):
+    """회의 접근 권한 체크 (권한이 없으면 403 응답 후 False)"""
+    if await asyncio.to_thread(can_access_meeting, user_id, meeting_id):
+        return True
+    await send_json(send, {
+        "success": False,
+        "error": "접근 권한이 없습니다."
+    }, status=403)
+    return False
+
+
+@async_router.route("/api/chat", methods=("POST",))
+@async_login_required
+async def chat(request, send):
+    """챗봇 질의응답 (routes/chat.py chat()과 동일한 형식)"""
+    user_id = request.session['user_id']
+
+    try:
+        data = await request.json()
+        query = data.get('query')
+        meeting_id = data.get('meeting_id')  # Optional
+
+        if not query:
+            await send_json(send, {
+                "success": False,
+                "error": "질문을 입력해주세요."
+            }, status=400)
+            return
+
+        conversation_key, error = resolve_conversation_key(user_id, data.get('conversation_id'))
+        if not error:
+            accessible_meeting_ids, error = await asyncio.to_thread(resolve_accessible_meeting_ids, user_id, meeting_id)
+        if error:
+            message, status = error
+            await send_json(send, {"success": False, "error": message}, status=status)
+            return
+
+        result = await chat_manager.aprocess_query(
+            query=query,
+            accessible_meeting_ids=accessible_meeting_ids,
+            conversation_id=conversation_key
+        )
+
+        await send_json(send, result)
+
+    except Exception as e:
+        logger.error(f"❌ 챗봇 처리 실패: {e}", exc_info=True)
+        await send_json(send, {
+            "success": False,
+            "error": f"챗봇 처리 중 오류가 발생했습니다: {str(e)}"
+        }, status=500)
+
+
+@async_router.route("/api/chat/stream", methods=("POST",))
+@async_login_required
+async def chat_stream(request, send):
+    """챗봇 질의응답 SSE 스트리밍 (routes/chat.py chat_stream()과 동일한 이벤트 형식)"""
+    user_id = request.session['user_id']
+
+    data = await request.json()
+    query = data.get('query')
+    meeting_id = data.get('meeting_id')  # Optional
+
+    if not query:
+        await send_json(send, {
+            "success": False,
+            "error": "질문을 입력해주세요."
+        }, status=400)
+        return
+
+    conversation_key, error = resolve_conversation_key(user_id, data.get('conversation_id'))
+    if not error:
+        accessible_meeting_ids, error = await asyncio.to_thread(resolve_accessible_meeting_ids, user_id, meeting_id)
+    if error:
+        message, status = error
+        await send_json(send, {"success": False, "error": message}, status=status)
+        return
+
+    events = chat_manager.aprocess_query_stream(
+        query=query,
+        accessible_meeting_ids=accessible_meeting_ids,
+        conversation_id=conversation_key
+    )
+    # 클라이언트 연결이 끊기면 Gemini 스트림까지 취소
+    await send_event_stream(request.receive, send, events)
+
+
+@async_router.route("/api/chat/batch", methods=("POST",))
+@async_login_required
+async def chat_batch(request, send):
+    """회의 일괄 질문 (routes/chat.py chat_batch()와 동일한 형식)"""
+    user_id = request.session['user_id']
+
+    try:
+        data = await request.json()
+        meeting_id = data.get('meeting_id')
+
+        if not meeting_id:
+            await send_json(send, {
+                "success": False,
+                "error": "회의 ID가 필요합니다."
+            }, status=400)
+            return
+
+        questions, message = validate_batch_questions(data.get('questions'), config.BATCH_QUESTIONS_MAX)
+        if message:
+            await send_json(send, {"success": False, "error": message}, status=400)
+            return
+
+        _, error = await asyncio.to_thread(resolve_accessible_meeting_ids, user_id, meeting_id)
+        if error:
+            message, status = error
+            await send_json(send, {"success": False, "error": message}, status=status)
+            return
+
+        result = await chat_manager.aprocess_batch(questions, meeting_id)
+
+        await send_json(send, result)
+
+    except Exception as e:
+        logger.error(f"❌ 일괄 질문 처리 실패: {e}", exc_info=True)
+        await send_json(send, {
+            "success": False,
+            "error": f"일괄 질문 처리 중 오류가 발생했습니다: {str(e)}"
+        }, status=500)
+
+
+@async_router.route("/api/summarize/<meeting_id>", methods=("POST",))
+@async_login_required
+async def summarize(request, send, meeting_id):
+    """문단 요약 생성 (routes/summary.py summarize()와 동일한 형식)"""
+    user_id = request.session['user_id']
+
+    if not await _check_meeting_access(send, user_id, meeting_id):
+        return
+
+    try:
+        # 1. meeting_id로 회의록 내용 조회
+        rows = await asyncio.to_thread(db.get_meeting_by_id, meeting_id)
+        if not rows:
+            await send_json(send, {
+                "success": False,
+                "error": "해당 회의를 찾을 수 없습니다."
+            }, status=404)
+            return
+
+        # 2. title, transcript_text, meeting_date, audio_file 추출
+        title = rows[0]['title']
+        meeting_date = rows[0]['meeting_date']
+        audio_file = rows[0]['audio_file']
+        transcript_text = " ".join([row['segment'] for row in rows])
+
+        # 3. 비동기 Gemini 호출로 요약 생성
+        # 4. 생성한 내용을 'meeting_subtopic' DB에 저장 (임베딩 포함 - 스레드 풀에서 실행)
+        #    (Flask 라우트와 같은 키로 동시 요청을 합쳐 한 번만 생성/저장)
+        async def generate_and_save():
+            summary = await stt_manager.asubtopic_generate(title, transcript_text)
+            if summary:
+                await asyncio.to_thread(
+                    vdb_manager.add_meeting_as_subtopic,
+                    meeting_id=meeting_id,
+                    title=title,
+                    meeting_date=meeting_date,
+                    audio_file=audio_file,
+                    summary_content=summary
+                )
+            return summary
+
+        summary_content = await single_flight.ado(
+            ('summarize', meeting_id, content_version(title, transcript_text)),
+            generate_and_save
+        )
+
+        if not summary_content:
+            await send_json(send, {
+                "success": False,
+                "error": "요약 생성에 실패했습니다."
+            }, status=500)
+            return
+
+        await send_json(send, {
+            "success": True,
+            "message": "요약이 성공적으로 생성 및 저장되었습니다.",
+            "summary": summary_content
+        })
+
+    except Exception as e:
+        logger.error(f"❌ 요약 생성 실패: {e}", exc_info=True)
+        await send_json(send, {
+            "success": False,
+            "error": f"요약 처리 중 오류 발생: {str(e)}"
+        }, status=500)
+
+
+@async_router.route("/api/generate_minutes/<meeting_id>", methods=("POST",))
+@async_login_required
+async def generate_minutes(request, send, meeting_id):
+    """회의록 생성 (routes/summary.py generate_minutes()와 동일한 형식)"""
+    user_id = request.session['user_id']
+
+    if not await _check_meeting_access(send, user_id, meeting_id):
+        return
+
+    try:
+        # 1. meeting_id로 회의록 내용 조회
+        rows = await asyncio.to_thread(db.get_meeting_by_id, meeting_id)
+        if not rows:
+            await send_json(send, {
+                "success": False,
+                "error": "해당 회의를 찾을 수 없습니다."
+            }, status=404)
+            return
+
+        # 2. title, meeting_date, 발화 세그먼트 추출
+        title = rows[0]['title']
+        meeting_date = rows[0]['meeting_date']
+        transcript_segments = [row['segment'] for row in rows]
+
+        # 3. vector DB에서 문단 요약 가져오기 (없으면 스크립트만 사용)
+        #    청크 텍스트는 스크립트와 같은 내용이므로 프롬프트에 함께 넣지 않음
+        summary_content = await asyncio.to_thread(vdb_manager.get_summary_by_meeting_id, meeting_id)
+
+        # 4. 비동기 Gemini 호출로 회의록 생성
+        # 5. 생성된 회의록을 SQLite DB에 저장
+        #    (Flask 라우트와 같은 키로 동시 요청을 합쳐 한 번만 생성/저장)
+        async def generate_and_save():
+            minutes = await stt_manager.agenerate_minutes(
+                title,
+                transcript_segments,
+                summary_content,
+                meeting_date
+            )
+            if minutes:
+                await asyncio.to_thread(db.save_minutes, meeting_id, title, meeting_date, minutes)
+            return minutes
+
+        minutes_content = await single_flight.ado(
+            ('minutes', meeting_id, content_version(title, meeting_date, transcript_segments, summary_content)),
+            generate_and_save
+        )
+
+        if not minutes_content:
+            await send_json(send, {
+                "success": False,
+                "error": "회의록 생성에 실패했습니다."
+            }, status=500)
+            return
+
+        await send_json(send, {
+            "success": True,
+            "message": "회의록이 성공적으로 생성 및 저장되었습니다.",
+            "minutes": minutes_content
+        })
+
+    except Exception as e:
+        logger.error(f"❌ 회의록 생성 실패: {e}", exc_info=True)
+        await send_json(send, {
+            "success": False,
+            "error": f"회의록 생성 중 오류 발생: {str(e)}"
+        }, status=500)
@@ -1,13 +1,13 @@
 """
 인증 관련 라우트
-로그인, 로그아웃, 사용자 정보 조회
+로그인, 로그아웃, 사용자 정보/설정 조회
 """
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, session
 import logging
 
 from config import config
 from utils.firebase_auth import verify_id_token
-from utils.user_manager import get_or_create_user
+from utils.user_manager import get_or_create_user, get_user_settings, update_user_settings
 from utils.decorators import login_required
 
 logger = logging.getLogger(__name__)
@@ -135,3 +135,49 @@ def get_current_user():
             'profile_picture': session.get('profile_picture', '')
         }
     })
+
+
+@auth_bp.route("/api/me/settings", methods=["GET", "POST"])
+@login_required
+def user_settings():
+    """
+    현재 로그인한 사용자 설정 조회/변경
+
+    Request JSON (POST):
+        {
+            "minutes_precompute": true | false | null  (null이면 서버 기본값 사용)
+        }
+
+    Returns:
+        JSON: 사용자 설정
+            - minutes_precompute: 실제 적용되는 값
+            - minutes_precompute_override: 저장된 값 (null이면 서버 기본값을 따름)
+    """
+    user_id = session['user_id']
+
+    try:
+        if request.method == "GET":
+            return jsonify({'success': True, 'settings': get_user_settings(user_id)})
+
+        data = request.get_json(silent=True) or {}
+        if 'minutes_precompute' not in data:
+            return jsonify({
+                'success': False,
+                'error': '변경할 설정이 없습니다.'
+            }), 400
+
+        minutes_precompute = data['minutes_precompute']
+        if minutes_precompute is not None and not isinstance(minutes_precompute, bool):
+            return jsonify({
+                'success': False,
+                'error': 'minutes_precompute는 true, false 또는 null이어야 합니다.'
+            }), 400
+
+        return jsonify({'success': True, 'settings': update_user_settings(user_id, minutes_precompute)})
+
+    except Exception as e:
+        logger.error(f"❌ 사용자 설정 처리 실패: {e}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': f'설정 처리 중 오류가 발생했습니다: {str(e)}'
+        }), 500
@@ -2,14 +2,16 @@
 챗봇 관련 라우트
 AI 질의응답
 """
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
+import json
 import logging
 
 from config import config
 from utils.vector_db_manager import vdb_manager
 from utils.chat_manager import ChatManager
 from utils.decorators import login_required
-from utils.user_manager import can_access_meeting, get_user_accessible_meeting_ids
+from utils.user_manager import is_admin, can_access_meeting, get_user_accessible_meeting_ids
+from utils.validation import validate_batch_questions, validate_conversation_id
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,63 @@ logger = logging.getLogger(__name__)
 chat_bp = Blueprint('chat', __name__)
 
 # ChatManager 초기화 (similarity retriever 사용)
-chat_manager = ChatManager(vdb_manager, retriever_type="similarity")
+chat_manager = ChatManager(vdb_manager, retriever_type=config.CHAT_RETRIEVER_TYPE)
+
+
+def resolve_accessible_meeting_ids(user_id, meeting_id):
+    """
+    검색 범위(meeting_id 목록) 결정 및 권한 체크 (Flask / ASGI 라우트 공용)
+
+    Args:
+        user_id (int): 사용자 ID
+        meeting_id (str or None): 특정 회의 ID
+
+    Returns:
+        tuple: (accessible_meeting_ids, error)
+               - accessible_meeting_ids: 검색할 meeting_id 목록 (관리자는 None = 전체)
+               - error: 권한 없음/노트 없음 시 (에러 메시지, 상태 코드), 정상이면 None
+    """
+    if meeting_id:
+        # 특정 회의에 대한 질문
+        if not can_access_meeting(user_id, meeting_id):
+            return None, ("해당 회의에 접근 권한이 없습니다.", 403)
+
+        # 해당 회의에 대해서만 검색
+        return [meeting_id], None
+
+    # 전체 노트에서 검색 (사용자가 접근 가능한 노트만)
+    accessible_meeting_ids = get_user_accessible_meeting_ids(user_id)
+
+    if not accessible_meeting_ids:
+        return None, ("조회 가능한 노트가 없습니다.", 404)
+
+    # 관리자는 모든 노트에 접근 가능하므로 meeting_id 필터 없이 검색
+    if is_admin(user_id):
+        return None, None
+
+    return accessible_meeting_ids, None
+
+
+def resolve_conversation_key(user_id, conversation_id):
+    """
+    대화 기록 키 결정 (Flask / ASGI 라우트 공용)
+    다른 사용자의 대화 기록을 참조하지 않도록 사용자 ID와 묶어서 사용합니다.
+
+    Args:
+        user_id (int): 사용자 ID
+        conversation_id (str or None): 클라이언트가 보낸 대화 ID
+
+    Returns:
+        tuple: (conversation_key, error)
+               - conversation_key: ChatManager에 전달할 대화 키 (대화 ID가 없거나 대화 메모리 비활성화 시 None)
+               - error: 형식 오류 시 (에러 메시지, 상태 코드), 정상이면 None
+    """
+    is_valid, message = validate_conversation_id(conversation_id)
+    if not is_valid:
+        return None, (message, 400)
+    if not conversation_id or not config.CONVERSATION_MEMORY_ENABLED:
+        return None, None
+    return f"{user_id}:{conversation_id}", None
 
 
 @chat_bp.route("/api/chat", methods=["POST"])
@@ -29,7 +87,8 @@ def chat():
     Request JSON:
         {
             "query": "질문 내용",
-            "meeting_id": "특정 회의 ID (optional)"
+            "meeting_id": "특정 회의 ID (optional)",
+            "conversation_id": "대화 ID (optional, 같은 ID로 보내면 이전 대화를 참고해 후속 질문 처리)"
         }
 
     Returns:
@@ -48,31 +107,18 @@ def chat():
                 "error": "질문을 입력해주세요."
             }), 400
 
-        # 권한 체크
-        if meeting_id:
-            # 특정 회의에 대한 질문
-            if not can_access_meeting(user_id, meeting_id):
-                return jsonify({
-                    "success": False,
-                    "error": "해당 회의에 접근 권한이 없습니다."
-                }), 403
-
-            # 해당 회의에 대해서만 검색
-            accessible_meeting_ids = [meeting_id]
-        else:
-            # 전체 노트에서 검색 (사용자가 접근 가능한 노트만)
-            accessible_meeting_ids = get_user_accessible_meeting_ids(user_id)
-
-            if not accessible_meeting_ids:
-                return jsonify({
-                    "success": False,
-                    "error": "조회 가능한 노트가 없습니다."
-                }), 404
+        conversation_key, error = resolve_conversation_key(user_id, data.get('conversation_id'))
+        if not error:
+            accessible_meeting_ids, error = resolve_accessible_meeting_ids(user_id, meeting_id)
+        if error:
+            message, status = error
+            return jsonify({"success": False, "error": message}), status
 
         # 챗봇 쿼리 처리
         result = chat_manager.process_query(
             query=query,
-            accessible_meeting_ids=accessible_meeting_ids
+            accessible_meeting_ids=accessible_meeting_ids,
+            conversation_id=conversation_key
         )
 
         return jsonify(result)
@@ -83,3 +129,109 @@ def chat():
             "success": False,
             "error": f"챗봇 처리 중 오류가 발생했습니다: {str(e)}"
         }), 500
+
+
+@chat_bp.route("/api/chat/stream", methods=["POST"])
+@login_required
+def chat_stream():
+    """
+    챗봇 질의응답 (SSE 스트리밍)
+    검색 출처를 먼저 보내고, 답변은 생성되는 대로 조각 단위로 전송합니다.
+    클라이언트가 연결을 끊으면 답변 생성도 중단됩니다.
+
+    Request JSON:
+        {
+            "query": "질문 내용",
+            "meeting_id": "특정 회의 ID (optional)",
+            "conversation_id": "대화 ID (optional)"
+        }
+
+    Returns:
+        text/event-stream: data: {"event": "sources" | "token" | "done" | "error", ...}
+    """
+    user_id = session['user_id']
+
+    data = request.get_json() or {}
+    query = data.get('query')
+    meeting_id = data.get('meeting_id')  # Optional
+
+    if not query:
+        return jsonify({
+            "success": False,
+            "error": "질문을 입력해주세요."
+        }), 400
+
+    conversation_key, error = resolve_conversation_key(user_id, data.get('conversation_id'))
+    if not error:
+        accessible_meeting_ids, error = resolve_accessible_meeting_ids(user_id, meeting_id)
+    if error:
+        message, status = error
+        return jsonify({"success": False, "error": message}), status
+
+    def generate():
+        events = chat_manager.process_query_stream(
+            query=query,
+            accessible_meeting_ids=accessible_meeting_ids,
+            conversation_id=conversation_key
+        )
+        try:
+            for event in events:
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        finally:
+            # 연결 종료 시 Gemini 스트림까지 닫도록 명시적으로 종료
+            events.close()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@chat_bp.route("/api/chat/batch", methods=["POST"])
+@login_required
+def chat_batch():
+    """
+    한 회의에 대한 여러 질문 일괄 답변
+    질문 임베딩 1회, 회의 문서 조회 1회, 구조화된 답변 생성 1회로 처리합니다.
+
+    Request JSON:
+        {
+            "meeting_id": "회의 ID",
+            "questions": ["결정된 사항은?", "담당자와 마감일은?", ...]
+        }
+
+    Returns:
+        JSON: 질문별 답변 및 출처 ({"success", "results": [{"question", "answer", "sources"}, ...]})
+    """
+    user_id = session['user_id']
+
+    try:
+        data = request.get_json() or {}
+        meeting_id = data.get('meeting_id')
+
+        if not meeting_id:
+            return jsonify({
+                "success": False,
+                "error": "회의 ID가 필요합니다."
+            }), 400
+
+        questions, message = validate_batch_questions(data.get('questions'), config.BATCH_QUESTIONS_MAX)
+        if message:
+            return jsonify({"success": False, "error": message}), 400
+
+        _, error = resolve_accessible_meeting_ids(user_id, meeting_id)
+        if error:
+            message, status = error
+            return jsonify({"success": False, "error": message}), status
+
+        result = chat_manager.process_batch(questions, meeting_id)
+
+        return jsonify(result)
+
+    except Exception as e:
+        logger.error(f"❌ 일괄 질문 처리 실패: {e}", exc_info=True)
+        return jsonify({
+            "success": False,
+            "error": f"일괄 질문 처리 중 오류가 발생했습니다: {str(e)}"
+        }), 500
@@ -18,16 +18,20 @@ from utils.vector_db_manager import vdb_manager
 from utils.stt import STTManager
 from utils.decorators import login_required
 from utils.user_manager import (
+    is_admin,
     can_access_meeting,
     can_edit_meeting,
     get_user_meetings,
     get_shared_meetings,
     share_meeting,
     get_shared_users,
-    remove_share
+    remove_share,
+    get_user_settings
 )
-from utils.analysis import calculate_speaker_share
-from utils.validation import validate_title, parse_meeting_date
+from utils.analysis import speaker_share_from_stats
+from utils.validation import validate_title, parse_meeting_date, parse_date_filter
+from utils.pagination import parse_limit, encode_cursor, decode_cursor
+from utils.transcript_format import to_compact_transcript, compact_json_response
 from services.upload_service import upload_service
 
 # Blueprint 생성
@@ -50,32 +54,68 @@ def index():
     return render_template("index.html")
 
 
+def _parse_list_params():
+    """
+    노트 목록 조회 쿼리 파라미터 파싱
+
+    Query Params:
+        limit: 페이지 크기
+        cursor: 이전 응답의 next_cursor
+        date_from: 시작 날짜 (YYYY-MM-DD 또는 ISO 형식)
+        date_to: 종료 날짜 (YYYY-MM-DD 또는 ISO 형식)
+        q: 제목 접두어
+
+    Returns:
+        dict: get_user_meetings() / get_shared_meetings() 키워드 인자
+
+    Raises:
+        ValueError: 파라미터 형식이 올바르지 않은 경우
+    """
+    return {
+        'limit': parse_limit(request.args.get('limit'), config.NOTES_PAGE_SIZE, config.NOTES_PAGE_SIZE_MAX),
+        'cursor_token': request.args.get('cursor') or None,
+        'date_from': parse_date_filter(request.args.get('date_from')),
+        'date_to': parse_date_filter(request.args.get('date_to'), end_of_day=True),
+        'title_prefix': request.args.get('q', '').strip() or None
+    }
+
+
 @meetings_bp.route("/notes")
 @login_required
 def notes():
     """
-    내 노트 목록 조회
+    내 노트 목록 조회 (키셋 페이지네이션)
 
     Returns:
         HTML: 노트 목록 페이지
     """
     user_id = session['user_id']
-    meetings = get_user_meetings(user_id)
-    return render_template("notes.html", meetings=meetings)
+
+    try:
+        page = get_user_meetings(user_id, **_parse_list_params())
+    except ValueError as e:
+        return f"⛔ {e}", 400
+
+    return render_template("notes.html", meetings=page['meetings'], next_cursor=page['next_cursor'])
 
 
 @meetings_bp.route("/shared-notes")
 @login_required
 def shared_notes():
     """
-    공유받은 노트 목록 조회
+    공유받은 노트 목록 조회 (키셋 페이지네이션)
 
     Returns:
         HTML: 공유 노트 목록 페이지
     """
     user_id = session['user_id']
-    shared_meetings = get_shared_meetings(user_id)
-    return render_template("shared-notes.html", meetings=shared_meetings)
+
+    try:
+        page = get_shared_meetings(user_id, **_parse_list_params())
+    except ValueError as e:
+        return f"⛔ {e}", 400
+
+    return render_template("shared-notes.html", meetings=page['meetings'], next_cursor=page['next_cursor'])
 
 
 @meetings_bp.route("/view/<string:meeting_id>")
@@ -108,6 +148,10 @@ def get_meeting_data(meeting_id):
     Args:
         meeting_id: 회의 ID
 
+    Query Params:
+        transcript: '0'이면 전사 데이터를 제외 (긴 회의는 /segments로 구간 조회)
+        format: 'compact'이면 전사를 컬럼형 포맷으로 반환 (응답은 포맷과 관계없이 압축 지원)
+
     Returns:
         JSON: 회의 전체 데이터
     """
@@ -120,34 +164,61 @@ def get_meeting_data(meeting_id):
             "error": "접근 권한이 없습니다."
         }), 403
 
-    # 회의 데이터 조회
-    rows = db.get_meeting_by_id(meeting_id)
+    include_transcript = request.args.get('transcript', '1') != '0'
+    compact = request.args.get('format') == 'compact'
 
-    if not rows:
-        return jsonify({
-            "success": False,
-            "error": "회의를 찾을 수 없습니다."
-        }), 404
+    if include_transcript and compact:
+        # 컬럼형 포맷: 회의 정보는 한 번만, 전사는 필요한 컬럼만 조회
+        meeting = db.get_meeting_info(meeting_id)
+
+        if not meeting:
+            return jsonify({
+                "success": False,
+                "error": "회의를 찾을 수 없습니다."
+            }), 404
+
+        segments, _ = db.get_segments_window(meeting_id, limit=None)
+        transcript = to_compact_transcript(segments)
+    elif include_transcript:
+        # 회의 데이터 조회
+        rows = db.get_meeting_by_id(meeting_id)
+
+        if not rows:
+            return jsonify({
+                "success": False,
+                "error": "회의를 찾을 수 없습니다."
+            }), 404
+
+        # 전사 데이터 변환 (dict로 변환)
+        transcript = [dict(row) for row in rows]
+        meeting = rows[0]
+    else:
+        meeting = db.get_meeting_info(meeting_id)
+
+        if not meeting:
+            return jsonify({
+                "success": False,
+                "error": "회의를 찾을 수 없습니다."
+            }), 404
 
-    # 전사 데이터 변환 (dict로 변환)
-    transcript = [dict(row) for row in rows]
+        transcript = None
 
     # 회의 정보 추출
-    audio_file = rows[0]['audio_file']
-    title = rows[0]['title']
-    meeting_date = rows[0]['meeting_date']
+    audio_file = meeting['audio_file']
+    title = meeting['title']
+    meeting_date = meeting['meeting_date']
 
-    # 참석자 목록 추출 (중복 제거)
-    participants = list(set([t['speaker_label'] for t in transcript if t.get('speaker_label')]))
-    participants.sort()
+    # 회의 통계 조회 (업로드 시 계산된 meeting_stats 사용)
+    stats = db.get_meeting_stats(meeting_id)
 
-    # 화자별 점유율 계산
-    speaker_share_data = calculate_speaker_share(meeting_id)
+    # 참석자 목록 및 화자별 점유율
+    participants = sorted(stats['speakers'].keys()) if stats else []
+    speaker_share_data = speaker_share_from_stats(stats)
 
     # 수정 권한 확인 (owner 또는 admin만 수정 가능)
     can_edit = can_edit_meeting(user_id, meeting_id)
 
-    return jsonify({
+    payload = {
         "success": True,
         "meeting_id": meeting_id,
         "title": title,
@@ -156,10 +227,234 @@ def get_meeting_data(meeting_id):
         "audio_url": f"/uploads/{audio_file}",
         "transcript": transcript,
         "speaker_share": speaker_share_data,
+        "stats": stats,
         "can_edit": can_edit
+    }
+
+    if compact:
+        payload["format"] = "compact"
+
+    # 전사가 포함된 응답은 기본 포맷도 압축 (Accept-Encoding 지원 시)
+    return compact_json_response(payload)
+
+
+def _parse_seconds(value, name):
+    """
+    초 단위 쿼리 파라미터 파싱
+
+    Args:
+        value (str or None): 요청 파라미터 값
+        name (str): 파라미터 이름 (오류 메시지용)
+
+    Returns:
+        float or None: 초 (값이 없으면 None)
+
+    Raises:
+        ValueError: 숫자가 아니거나 음수인 경우
+    """
+    if value is None or str(value).strip() == "":
+        return None
+
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}은(는) 초 단위 숫자여야 합니다.")
+
+    if seconds < 0:
+        raise ValueError(f"{name}은(는) 0 이상이어야 합니다.")
+
+    return seconds
+
+
+@meetings_bp.route("/api/meeting/<string:meeting_id>/segments")
+@login_required
+def get_meeting_segments(meeting_id):
+    """
+    회의 전사 구간 조회 (긴 회의의 지연 로딩용)
+
+    Args:
+        meeting_id: 회의 ID
+
+    Query Params:
+        from: 구간 시작 (초, 포함, optional)
+        to: 구간 끝 (초, 미포함, optional)
+        cursor: 이전 응답의 next_cursor (optional)
+        limit: 최대 세그먼트 수 (optional)
+        format: 'compact'이면 컬럼형 포맷으로 반환 (optional)
+
+    Returns:
+        JSON: 세그먼트 목록과 다음 페이지 커서
+    """
+    user_id = session['user_id']
+
+    if not can_access_meeting(user_id, meeting_id):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    try:
+        start_time = _parse_seconds(request.args.get('from'), 'from')
+        end_time = _parse_seconds(request.args.get('to'), 'to')
+        limit = parse_limit(request.args.get('limit'), config.TRANSCRIPT_PAGE_SIZE, config.TRANSCRIPT_PAGE_SIZE_MAX)
+
+        cursor_token = request.args.get('cursor')
+        after = tuple(decode_cursor(cursor_token, 2)) if cursor_token else None
+
+        segments, has_more = db.get_segments_window(
+            meeting_id,
+            start_time=start_time,
+            end_time=end_time,
+            after=after,
+            limit=limit
+        )
+
+        next_cursor = None
+        if has_more and segments:
+            last = segments[-1]
+            next_cursor = encode_cursor(last['start_time'], last['segment_id'])
+
+        if request.args.get('format') == 'compact':
+            return compact_json_response({
+                "success": True,
+                "meeting_id": meeting_id,
+                "format": "compact",
+                "segments": to_compact_transcript(segments),
+                "next_cursor": next_cursor
+            })
+
+        return compact_json_response({
+            "success": True,
+            "meeting_id": meeting_id,
+            "segments": segments,
+            "next_cursor": next_cursor
+        })
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"❌ 전사 구간 조회 실패: {e}", exc_info=True)
+        return jsonify({
+            "success": False,
+            "error": f"전사 조회 중 오류가 발생했습니다: {str(e)}"
+        }), 500
+
+
+@meetings_bp.route("/api/meeting/<string:meeting_id>/segment_at")
+@login_required
+def get_segment_at(meeting_id):
+    """
+    재생 시점에 해당하는 세그먼트 조회 (오디오 탐색 시 전사 위치 찾기)
+
+    Args:
+        meeting_id: 회의 ID
+
+    Query Params:
+        t: 재생 시점 (초, 필수)
+
+    Returns:
+        JSON: 해당 시점의 세그먼트
+    """
+    user_id = session['user_id']
+
+    if not can_access_meeting(user_id, meeting_id):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    try:
+        timestamp = _parse_seconds(request.args.get('t'), 't')
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+
+    if timestamp is None:
+        return jsonify({
+            "success": False,
+            "error": "t 파라미터가 필요합니다."
+        }), 400
+
+    segment = db.get_segment_at(meeting_id, timestamp)
+
+    if not segment:
+        return jsonify({
+            "success": False,
+            "error": "회의를 찾을 수 없습니다."
+        }), 404
+
+    return jsonify({
+        "success": True,
+        "meeting_id": meeting_id,
+        "segment": segment
     })
 
 
+@meetings_bp.route("/api/search_transcripts")
+@login_required
+def search_transcripts():
+    """
+    전사 키워드 검색 (FTS5, 접근 가능한 회의만)
+
+    Query Params:
+        q: 검색어 (필수)
+        meeting_id: 특정 회의로 제한 (optional)
+        limit: 최대 결과 수 (optional)
+
+    Returns:
+        JSON: 일치한 세그먼트 목록 (meeting_id, start_time, speaker_label, 강조된 snippet)
+    """
+    user_id = session['user_id']
+    query = request.args.get('q', '').strip()
+    meeting_id = request.args.get('meeting_id') or None
+
+    if not query:
+        return jsonify({
+            "success": False,
+            "error": "검색어를 입력해주세요."
+        }), 400
+
+    if meeting_id and not can_access_meeting(user_id, meeting_id):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    try:
+        limit = parse_limit(request.args.get('limit'), config.TRANSCRIPT_SEARCH_LIMIT, config.TRANSCRIPT_SEARCH_LIMIT_MAX)
+
+        results = db.search_transcripts(
+            query,
+            user_id=user_id,
+            is_admin=is_admin(user_id),
+            meeting_id=meeting_id,
+            limit=limit
+        )
+
+        return jsonify({
+            "success": True,
+            "query": query,
+            "results": results
+        })
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"❌ 전사 검색 실패: {e}", exc_info=True)
+        return jsonify({
+            "success": False,
+            "error": f"검색 중 오류가 발생했습니다: {str(e)}"
+        }), 500
+
+
 @meetings_bp.route("/api/delete_meeting/<string:meeting_id>", methods=["POST"])
 @login_required
 def delete_meeting(meeting_id):
@@ -522,7 +817,14 @@ def upload_and_process():
                 logger.warning(f"⚠️  문단 요약 생성 실패: {e}", exc_info=True)
                 # 요약 실패해도 계속 진행
 
-            # Step 6: 완료
+            # Step 6: 회의록 미리 생성 (사용자 설정 시 - 백그라운드에서 실행, 완료를 기다리지 않음)
+            try:
+                if get_user_settings(owner_id)['minutes_precompute']:
+                    upload_service.schedule_minutes(actual_meeting_id)
+            except Exception as e:
+                logger.warning(f"⚠️  회의록 미리 생성 예약 실패: {e}", exc_info=True)
+
+            # Step 7: 완료
             redirect_url = f"/view/{actual_meeting_id}"
             yield f"data: {json.dumps({'step': 'complete', 'message': '노트 생성이 완료되었습니다!', 'redirect': redirect_url, 'icon': '✅'})}\n\n"
         
@@ -544,15 +846,20 @@ def upload_and_process():
 @login_required
 def notes_json():
     """
-    노트 목록을 JSON으로 반환 (업로드 상태 확인용)
-    
+    노트 목록을 JSON으로 반환 (업로드 상태 확인용, 키셋 페이지네이션)
+
+    Query Params:
+        limit, cursor, date_from, date_to, q (_parse_list_params 참고)
+
     Returns:
-        JSON: 노트 목록
+        JSON: 노트 목록 및 다음 페이지 커서
     """
     try:
         user_id = session['user_id']
-        meetings = get_user_meetings(user_id)
-        return jsonify({"success": True, "meetings": meetings})
+        page = get_user_meetings(user_id, **_parse_list_params())
+        return jsonify({"success": True, "meetings": page['meetings'], "next_cursor": page['next_cursor']})
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -11,6 +11,7 @@ from utils.vector_db_manager import vdb_manager
 from utils.stt import STTManager
 from utils.decorators import login_required
 from utils.user_manager import can_access_meeting
+from utils.single_flight import single_flight, content_version
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,24 @@ def summarize(meeting_id):
         transcript_text = " ".join([row['segment'] for row in rows])
 
         # 3. stt_manager의 subtopic_generate를 이용해 요약 생성
-        summary_content = stt_manager.subtopic_generate(title, transcript_text)
+        # 4. 생성한 내용을 'meeting_subtopic' DB에 저장
+        #    (같은 회의·같은 내용으로 동시에 들어온 요청은 한 번만 생성/저장하고 결과를 공유)
+        def generate_and_save():
+            summary = stt_manager.subtopic_generate(title, transcript_text)
+            if summary:
+                vdb_manager.add_meeting_as_subtopic(
+                    meeting_id=meeting_id,
+                    title=title,
+                    meeting_date=meeting_date,
+                    audio_file=audio_file,
+                    summary_content=summary
+                )
+            return summary
+
+        summary_content = single_flight.do(
+            ('summarize', meeting_id, content_version(title, transcript_text)),
+            generate_and_save
+        )
 
         if not summary_content:
             return jsonify({
@@ -67,15 +85,6 @@ def summarize(meeting_id):
                 "error": "요약 생성에 실패했습니다."
             }), 500
 
-        # 4. 생성한 내용을 'meeting_subtopic' DB에 저장
-        vdb_manager.add_meeting_as_subtopic(
-            meeting_id=meeting_id,
-            title=title,
-            meeting_date=meeting_date,
-            audio_file=audio_file,
-            summary_content=summary_content
-        )
-
         return jsonify({
             "success": True,
             "message": "요약이 성공적으로 생성 및 저장되었습니다.",
@@ -166,26 +175,32 @@ def generate_minutes(meeting_id):
                 "error": "해당 회의를 찾을 수 없습니다."
             }), 404
 
-        # 2. title, meeting_date, transcript_text 추출
+        # 2. title, meeting_date, 발화 세그먼트 추출
         title = rows[0]['title']
         meeting_date = rows[0]['meeting_date']
-        transcript_text = " ".join([row['segment'] for row in rows])
-
-        # 3. vector DB에서 청킹된 문서 가져오기 (chunk_index 순서대로)
-        chunks_content = vdb_manager.get_chunks_by_meeting_id(meeting_id)
+        transcript_segments = [row['segment'] for row in rows]
 
-        if not chunks_content:
-            return jsonify({
-                "success": False,
-                "error": "청킹된 회의 내용을 찾을 수 없습니다. 오디오 파일을 먼저 업로드해주세요."
-            }), 400
+        # 3. vector DB에서 문단 요약 가져오기 (없으면 스크립트만 사용)
+        #    청크 텍스트는 스크립트와 같은 내용이므로 프롬프트에 함께 넣지 않음
+        summary_content = vdb_manager.get_summary_by_meeting_id(meeting_id)
 
         # 4. stt_manager의 generate_minutes를 이용해 회의록 생성 (meeting_date 전달)
-        minutes_content = stt_manager.generate_minutes(
-            title,
-            transcript_text,
-            chunks_content,
-            meeting_date
+        # 5. 생성된 회의록을 SQLite DB에 저장
+        #    (같은 회의·같은 입력으로 동시에 들어온 요청은 한 번만 생성/저장하고 결과를 공유)
+        def generate_and_save():
+            minutes = stt_manager.generate_minutes(
+                title,
+                transcript_segments,
+                summary_content,
+                meeting_date
+            )
+            if minutes:
+                db.save_minutes(meeting_id, title, meeting_date, minutes)
+            return minutes
+
+        minutes_content = single_flight.do(
+            ('minutes', meeting_id, content_version(title, meeting_date, transcript_segments, summary_content)),
+            generate_and_save
         )
 
         if not minutes_content:
@@ -194,9 +209,6 @@ def generate_minutes(meeting_id):
                 "error": "회의록 생성에 실패했습니다."
             }), 500
 
-        # 5. 생성된 회의록을 SQLite DB에 저장
-        db.save_minutes(meeting_id, title, meeting_date, minutes_content)
-
         return jsonify({
             "success": True,
             "message": "회의록이 성공적으로 생성 및 저장되었습니다.",
@@ -0,0 +1,198 @@
+"""
+벡터 인덱스 재구축 서비스
+청킹 파라미터나 임베딩 모델이 바뀌었을 때 meeting_dialogues로부터 새 버전 컬렉션을 백그라운드에서 구축하고,
+완료되면 활성 버전을 교체합니다 (구축 중에도 챗봇은 기존 버전으로 계속 검색).
+"""
+import threading
+import logging
+from datetime import datetime
+
+from config import config
+from utils.db_manager import DatabaseManager
+from utils.vector_db_manager import vdb_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ReindexService:
+    """벡터 인덱스 재구축 서비스 (체크포인트 기반 재개 가능)"""
+
+    def __init__(self):
+        self.db = DatabaseManager(str(config.DATABASE_PATH))
+        self.vdb_manager = vdb_manager
+        self._lock = threading.Lock()
+        self._thread = None
+        self.status = {
+            'state': 'idle',       # idle, running, completed, failed
+            'version': None,
+            'total': 0,
+            'completed': 0,
+            'started_at': None,
+            'finished_at': None,
+            'error': None
+        }
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        재인덱싱 시작 (구축 중이던 버전이 있으면 체크포인트부터 재개)
+
+        Returns:
+            dict: 현재 상태
+
+        Raises:
+            RuntimeError: 이미 재인덱싱이 진행 중인 경우
+        """
+        with self._lock:
+            if self.is_running():
+                raise RuntimeError("재인덱싱이 이미 진행 중입니다.")
+
+            store = self.vdb_manager.index_versions
+            backend = self.vdb_manager.embedding_backend
+            record = store.get_building_version(backend)
+            if record is None:
+                record = store.create_version(
+                    backend,
+                    self.vdb_manager.embedding_backend_id,
+                    self.vdb_manager.get_configured_chunking_params()
+                )
+            else:
+                logger.info(f"🔁 재인덱싱 재개: {record['version']}")
+
+            self.status.update({
+                'state': 'running',
+                'version': record['version'],
+                'total': 0,
+                'completed': 0,
+                'started_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'finished_at': None,
+                'error': None
+            })
+
+            self._thread = threading.Thread(
+                target=self._run, args=(record,), name=f"reindex-{record['version']}", daemon=True
+            )
+            self._thread.start()
+            return dict(self.status)
+
+    def get_status(self):
+        """
+        재인덱싱 진행 상태와 인덱스 버전 목록
+
+        Returns:
+            dict: {'reindex': {...}, 'active_version': str or None, 'versions': [...]}
+        """
+        return {
+            'reindex': dict(self.status),
+            'active_version': self.vdb_manager.index_version,
+            'versions': self.vdb_manager.index_versions.list_versions()
+        }
+
+    def _run(self, record):
+        version = record['version']
+        target = self.vdb_manager.open_vectorstores(
+            self.vdb_manager._resolve_collection_names(record['embedding_backend'], version)
+        )
+
+        try:
+            # 1. 체크포인트 이후 회의를 배치로 재인덱싱 (진행 중 업로드된 회의도 다음 패스에서 처리)
+            for _ in range(3):
+                pending = self._pending_meetings(version)
+                if not pending:
+                    break
+                self._reindex_meetings(record, pending, target)
+
+            # 2. 저장/삭제를 잠시 막고 남은 변경분을 반영한 뒤 활성 버전 교체
+            with self.vdb_manager.index_gate.exclusive():
+                self._reindex_meetings(record, self._pending_meetings(version), target)
+                self._remove_deleted_meetings(version, target)
+                previous = self.vdb_manager.swap_index_version(version)
+
+            self.status.update({
+                'state': 'completed',
+                'finished_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+            logger.info(f"✅ 재인덱싱 완료: {previous or '(버전 없음)'} → {version}")
+
+        except Exception as e:
+            # 버전은 'building' 상태로 남겨 다음 start() 때 체크포인트부터 재개
+            logger.error(f"❌ 재인덱싱 실패 ({version}): {e}", exc_info=True)
+            self.status.update({
+                'state': 'failed',
+                'error': str(e),
+                'finished_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+
+    def _pending_meetings(self, version):
+        completed = self.vdb_manager.index_versions.get_completed_meetings(version)
+        meeting_ids = self.db.get_all_meeting_ids()
+        self.status['total'] = len(meeting_ids)
+        self.status['completed'] = len(completed.intersection(meeting_ids))
+        return [meeting_id for meeting_id in meeting_ids if meeting_id not in completed]
+
+    def _reindex_meetings(self, record, meeting_ids, target):
+        """회의를 REINDEX_BATCH_MEETINGS개씩 재청킹/재임베딩하고 배치마다 체크포인트를 기록합니다."""
+        version = record['version']
+        params = record['params']
+        source_subtopic = self.vdb_manager.vectorstores['subtopic']._collection
+        batch_size = max(1, config.REINDEX_BATCH_MEETINGS)
+
+        for start in range(0, len(meeting_ids), batch_size):
+            batch = meeting_ids[start:start + batch_size]
+            chunk_texts, chunk_metadatas, chunk_ids = [], [], []
+            subtopic_texts, subtopic_metadatas, subtopic_ids = [], [], []
+
+            for meeting_id in batch:
+                info = self.db.get_meeting_info(meeting_id)
+                segments = self.db.get_segments_by_meeting_id(meeting_id)
+
+                # 이전 실행에서 일부만 저장된 경우를 대비해 대상 버전의 기존 데이터 삭제
+                for db_type in ('chunks', 'subtopic'):
+                    target[db_type]._collection.delete(where={'meeting_id': meeting_id})
+
+                if info and segments:
+                    texts, metadatas, ids = self.vdb_manager.build_chunk_records(
+                        meeting_id, info['title'], info['meeting_date'], info['audio_file'], segments, params
+                    )
+                    chunk_texts += texts
+                    chunk_metadatas += metadatas
+                    chunk_ids += ids
+
+                # 서브토픽(요약)은 SQLite에 원문이 없으므로 활성 버전 컬렉션의 텍스트를 다시 임베딩
+                subtopics = source_subtopic.get(where={'meeting_id': meeting_id}, include=['documents', 'metadatas'])
+                subtopic_texts += subtopics.get('documents') or []
+                subtopic_metadatas += subtopics.get('metadatas') or []
+                subtopic_ids += subtopics.get('ids') or []
+
+            if chunk_texts:
+                target['chunks'].add_texts(texts=chunk_texts, metadatas=chunk_metadatas, ids=chunk_ids)
+            if subtopic_texts:
+                target['subtopic'].add_texts(texts=subtopic_texts, metadatas=subtopic_metadatas, ids=subtopic_ids)
+            for meeting_id in batch:
+                self.vdb_manager.update_meeting_centroids(meeting_id, vectorstores=target)
+
+            self.vdb_manager.index_versions.mark_completed(version, batch)
+            self.status['completed'] += len(batch)
+            logger.info(
+                f"📦 재인덱싱 {version}: {self.status['completed']}/{self.status['total']} 회의 "
+                f"(청크 {len(chunk_ids)}개, 서브토픽 {len(subtopic_ids)}개)"
+            )
+
+    def _remove_deleted_meetings(self, version, target):
+        """재인덱싱 중 삭제된 회의를 새 버전 컬렉션에서 제거합니다."""
+        store = self.vdb_manager.index_versions
+        deleted = store.get_completed_meetings(version) - set(self.db.get_all_meeting_ids())
+
+        for meeting_id in deleted:
+            for db_type in ('chunks', 'subtopic', 'centroids'):
+                target[db_type]._collection.delete(where={'meeting_id': meeting_id})
+
+        if deleted:
+            store.clear_checkpoints(version, deleted)
+            logger.info(f"🗑️ 재인덱싱 중 삭제된 회의 {len(deleted)}개를 {version}에서 제거")
+
+
+# 싱글톤 인스턴스
+reindex_service = ReindexService()
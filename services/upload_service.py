@@ -5,6 +5,8 @@
 import os
 import uuid
 import subprocess
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from werkzeug.utils import secure_filename
 from datetime import datetime
@@ -14,6 +16,9 @@ from utils.stt import STTManager
 from utils.db_manager import DatabaseManager
 from utils.vector_db_manager import vdb_manager
 from utils.validation import validate_title, parse_meeting_date
+from utils.single_flight import single_flight, content_version
+
+logger = logging.getLogger(__name__)
 
 
 class UploadService:
@@ -23,6 +28,10 @@ class UploadService:
         self.stt_manager = STTManager()
         self.db = DatabaseManager(str(config.DATABASE_PATH))
         self.vdb_manager = vdb_manager
+        # 업로드 후 회의록 미리 생성용 (업로드 응답을 기다리게 하지 않도록 백그라운드 실행)
+        self.minutes_executor = ThreadPoolExecutor(
+            max_workers=config.MINUTES_PRECOMPUTE_WORKERS, thread_name_prefix="minutes-precompute"
+        )
 
     def validate_file(self, filename: str) -> tuple[bool, str]:
         """
@@ -259,6 +268,71 @@ class UploadService:
             'summary': summary_content
         }
 
+    def generate_minutes(self, meeting_id: str) -> dict:
+        """
+        회의록 생성 및 저장 (/api/generate_minutes와 같은 입력)
+        같은 입력의 회의록 생성 요청이 진행 중이면 그 결과를 공유합니다.
+
+        Args:
+            meeting_id: 회의 ID
+
+        Returns:
+            dict: 회의록 결과
+        """
+        print(f"📄 회의록 자동 생성 시작 (meeting_id: {meeting_id})")
+
+        rows = self.db.get_meeting_by_id(meeting_id)
+        if not rows:
+            raise ValueError("세그먼트를 찾을 수 없습니다.")
+
+        title = rows[0]['title']
+        meeting_date = rows[0]['meeting_date']
+        transcript_segments = [row['segment'] for row in rows]
+        summary_content = self.vdb_manager.get_summary_by_meeting_id(meeting_id)
+
+        def generate_and_save():
+            minutes = self.stt_manager.generate_minutes(title, transcript_segments, summary_content, meeting_date)
+            if minutes:
+                self.db.save_minutes(meeting_id, title, meeting_date, minutes)
+            return minutes
+
+        # 사용자가 생성 버튼을 누른 요청과 같은 키 → 진행 중이면 한 번만 생성
+        minutes_content = single_flight.do(
+            ('minutes', meeting_id, content_version(title, meeting_date, transcript_segments, summary_content)),
+            generate_and_save
+        )
+
+        if not minutes_content:
+            raise ValueError("회의록 생성에 실패했습니다.")
+
+        print(f"✅ 회의록 생성 및 저장 완료 (meeting_id: {meeting_id})")
+
+        return {
+            'success': True,
+            'minutes': minutes_content
+        }
+
+    def schedule_minutes(self, meeting_id: str):
+        """
+        회의록 생성을 백그라운드 단계로 예약 (업로드 파이프라인에서 청킹/요약 후 호출)
+
+        Args:
+            meeting_id: 회의 ID
+
+        Returns:
+            Future: 백그라운드 작업
+        """
+        def run():
+            try:
+                return self.generate_minutes(meeting_id)
+            except Exception as e:
+                # 실패해도 사용자가 회의록 생성 버튼으로 다시 생성할 수 있음
+                logger.warning(f"⚠️ 회의록 백그라운드 생성 실패 (meeting_id: {meeting_id}): {e}", exc_info=True)
+                return {'success': False, 'error': str(e)}
+
+        logger.info(f"📄 회의록 백그라운드 생성 예약 (meeting_id: {meeting_id})")
+        return self.minutes_executor.submit(run)
+
     def cleanup_temp_files(self, *file_paths):
         """
         임시 파일 삭제
@@ -14,6 +14,7 @@ document.addEventListener('DOMContentLoaded', () => {
     // --- 챗봇 대화 내역 및 상태 관리 (sessionStorage) ---
     const CHAT_HISTORY_KEY = 'chatbot_history';
     const CHATBOT_STATE_KEY = 'chatbot_state';
+    const CHAT_CONVERSATION_KEY = 'chatbot_conversation_id';
 
     // 페이지 로드 시 대화 내역 불러오기
     loadChatHistory();
@@ -141,34 +142,69 @@ document.addEventListener('DOMContentLoaded', () => {
         loadingMsg.classList.add('loading');
 
         try {
-            // API 호출
-            const response = await fetch('/api/chat', {
+            // API 호출 (SSE 스트리밍: 출처 → 답변 조각 → 완료)
+            const response = await fetch('/api/chat/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
                 body: JSON.stringify({
                     query: message,
+                    conversation_id: getConversationId(),  // 같은 탭의 이전 대화를 참고해 후속 질문 처리
                     // meeting_id: null  // 특정 회의로 제한하려면 여기에 meeting_id 전달
                 })
             });
 
-            const data = await response.json();
+            if (!response.ok) {
+                const data = await response.json();
+                loadingMsg.remove();
+                addChatMessage('assistant', `오류: ${data.error || '알 수 없는 오류가 발생했습니다.'}`);
+                return;
+            }
 
-            // 로딩 메시지 제거
-            loadingMsg.remove();
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let answer = '';
+            let answerBubble = null;
+            let streamError = null;
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+
+                buffer += decoder.decode(value, { stream: true });
+                const events = buffer.split('\n\n');
+                buffer = events.pop();
+
+                for (const rawEvent of events) {
+                    if (!rawEvent.startsWith('data: ')) continue;
+                    const data = JSON.parse(rawEvent.slice(6));
+
+                    if (data.event === 'token') {
+                        // 첫 조각 도착 시 로딩 메시지를 답변 말풍선으로 교체 (저장은 완료 후)
+                        if (!answerBubble) {
+                            loadingMsg.remove();
+                            answerBubble = addChatMessage('assistant', '', false, false).querySelector('.chat-bubble');
+                        }
+                        answer += data.text;
+                        answerBubble.textContent = answer;
+                        chatbotMessages.scrollTop = chatbotMessages.scrollHeight;
+                    } else if (data.event === 'error') {
+                        streamError = data.error;
+                    }
+                    // 'sources' 이벤트: 출처 표시는 현재 사용하지 않음 (필요시 formatSources 사용)
+                }
+            }
 
-            if (data.success) {
-                // 답변 표시
-                addChatMessage('assistant', data.answer);
+            if (!answerBubble) {
+                loadingMsg.remove();
+            }
 
-                // 출처 정보 표시 제거 (필요시 아래 주석 해제)
-                // if (data.sources && data.sources.length > 0) {
-                //     const sourcesText = formatSources(data.sources);
-                //     addChatMessage('assistant', sourcesText, true); // 작은 글씨로 표시
-                // }
+            if (streamError && !answer) {
+                addChatMessage('assistant', `오류: ${streamError}`);
             } else {
-                addChatMessage('assistant', `오류: ${data.error || '알 수 없는 오류가 발생했습니다.'}`);
+                saveChatMessage('assistant', answer, false);
             }
         } catch (error) {
             console.error('챗봇 API 호출 오류:', error);
@@ -185,6 +221,18 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // 대화 ID (탭 세션 동안 유지, 서버가 대화 기록을 구분하는 데 사용)
+    function getConversationId() {
+        let conversationId = sessionStorage.getItem(CHAT_CONVERSATION_KEY);
+        if (!conversationId) {
+            conversationId = (window.crypto && crypto.randomUUID)
+                ? crypto.randomUUID()
+                : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+            sessionStorage.setItem(CHAT_CONVERSATION_KEY, conversationId);
+        }
+        return conversationId;
+    }
+
     // 출처 정보 포맷팅
     function formatSources(sources) {
         if (!sources || sources.length === 0) return '';
@@ -866,7 +914,7 @@ document.addEventListener('DOMContentLoaded', () => {
         // 실제로 새 노트가 생성되었는지 확인 (최근 5분 이내)
         try {
             const fiveMinutesAgo = Date.now() - (5 * 60 * 1000);
-            const response = await fetch('/notes_json');
+            const response = await fetch('/notes_json?limit=1');
 
             if (response.ok) {
                 const data = await response.json();
@@ -874,7 +922,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 // 최근 생성된 노트가 있는지 확인
                 if (data.meetings && data.meetings.length > 0) {
                     const latestMeeting = data.meetings[0];
-                    const meetingTime = new Date(latestMeeting.meeting_date).getTime();
+                    const meetingTime = new Date(latestMeeting.date).getTime();
 
                     // upload_start_time 이후에 생성된 노트가 있으면 작업 완료된 것
                     if (meetingTime >= startTime) {
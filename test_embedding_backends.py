@@ -0,0 +1,51 @@
+"""
+로컬 해시 n-gram 임베딩 테스트
+- 해시 버킷이 차원 전체에 고르게 퍼지는지
+- 관련 없는 문장의 유사도가 0에 가깝고, 비슷한 문장은 높은지
+
+실행 방법:
+    python -m pytest test_embedding_backends.py
+    python test_embedding_backends.py
+"""
+import numpy as np
+
+from utils.embedding_backends import HashedNgramEmbeddings
+
+
+def _cosine(embeddings, first, second):
+    return float(np.dot(embeddings.embed_query(first), embeddings.embed_query(second)))
+
+
+def test_bucket_spread():
+    """서로 다른 한글 음절 2000개가 1024차원 대부분에 퍼져야 함 (균등 해시 기대값 약 880개)"""
+    embeddings = HashedNgramEmbeddings(dim=1024, ngram_range=(1, 1))
+    text = "".join(chr(0xAC00 + i) for i in range(2000))
+
+    vector = np.asarray(embeddings.embed_query(text))
+
+    # 같은 버킷에서 부호가 상쇄된 경우도 있으므로 여유를 둠
+    assert np.count_nonzero(vector) > 600
+
+
+def test_unrelated_texts_near_zero():
+    embeddings = HashedNgramEmbeddings()
+
+    for first, second in [
+        ("abc", "xyz"),
+        ("사과", "바나나 우유"),
+        ("예산 회의 결정", "점심 메뉴 추천"),
+    ]:
+        assert abs(_cosine(embeddings, first, second)) < 0.15, (first, second)
+
+
+def test_related_texts_similar():
+    embeddings = HashedNgramEmbeddings()
+
+    assert _cosine(embeddings, "예산 회의 결정", "예산 회의에서 결정") > 0.5
+
+
+if __name__ == "__main__":
+    test_bucket_spread()
+    test_unrelated_texts_near_zero()
+    test_related_texts_similar()
+    print("✅ 임베딩 백엔드 테스트 통과")
@@ -1,4 +1,3 @@
-import sqlite3
 from collections import defaultdict
 import os
 import logging
@@ -8,40 +7,117 @@ logger = logging.getLogger(__name__)
 basedir = os.path.abspath(os.path.dirname(__file__))
 DB_PATH = os.path.join(basedir, "..", "database", "minute_ai.db")
 
+
+def compute_meeting_stats(segments):
+    """
+    회의 세그먼트 목록으로부터 회의 통계를 계산합니다.
+
+    발화 시간은 다음 세그먼트의 start_time과의 차이로 추정하며,
+    마지막 세그먼트는 회의 전체의 평균 발화 속도(글자/초)로 추정합니다.
+
+    Args:
+        segments (list): {'speaker_label', 'start_time', 'segment', 'confidence'} 키를 가진 dict 리스트
+
+    Returns:
+        dict: {
+            'segment_count': int,
+            'duration_seconds': float,
+            'avg_confidence': float or None,
+            'total_chars': int,
+            'speakers': {speaker_label: {'chars': int, 'talk_time': float, 'turns': int}}
+        }
+    """
+    ordered = sorted(segments, key=lambda seg: seg.get('start_time') or 0.0)
+
+    speakers = defaultdict(lambda: {'chars': 0, 'talk_time': 0.0, 'turns': 0})
+    total_chars = 0
+    confidences = []
+    previous_speaker = None
+
+    for i, seg in enumerate(ordered):
+        speaker = str(seg.get('speaker_label') or 'Unknown')
+        text = seg.get('segment') or ""
+        start_time = seg.get('start_time') or 0.0
+
+        speakers[speaker]['chars'] += len(text)
+        total_chars += len(text)
+
+        if i + 1 < len(ordered):
+            next_start = ordered[i + 1].get('start_time') or 0.0
+            speakers[speaker]['talk_time'] += max(next_start - start_time, 0.0)
+
+        # 화자가 바뀔 때마다 발언 턴 1회
+        if speaker != previous_speaker:
+            speakers[speaker]['turns'] += 1
+            previous_speaker = speaker
+
+        if seg.get('confidence') is not None:
+            confidences.append(seg['confidence'])
+
+    duration = 0.0
+    if ordered:
+        last = ordered[-1]
+        last_start = last.get('start_time') or 0.0
+        last_chars = len(last.get('segment') or "")
+        measured_chars = total_chars - last_chars
+
+        # 마지막 세그먼트 발화 시간: 앞선 구간의 평균 발화 속도로 추정
+        last_talk_time = 0.0
+        if last_start > 0 and measured_chars > 0:
+            last_talk_time = last_chars / (measured_chars / last_start)
+
+        speakers[str(last.get('speaker_label') or 'Unknown')]['talk_time'] += last_talk_time
+        duration = last_start + last_talk_time
+
+    return {
+        'segment_count': len(ordered),
+        'duration_seconds': round(duration, 2),
+        'avg_confidence': round(sum(confidences) / len(confidences), 4) if confidences else None,
+        'total_chars': total_chars,
+        'speakers': {
+            speaker: {
+                'chars': values['chars'],
+                'talk_time': round(values['talk_time'], 2),
+                'turns': values['turns']
+            }
+            for speaker, values in speakers.items()
+        }
+    }
+
+
+def speaker_share_from_stats(stats):
+    """
+    회의 통계(meeting_stats)로부터 화자별 발언 점유율 차트 데이터를 만듭니다 (글자 수 기반).
+
+    Args:
+        stats (dict): compute_meeting_stats()의 반환값
+
+    Returns:
+        dict or None: {'labels': [...], 'data': [...]} (점유율 내림차순)
+    """
+    if not stats or not stats.get('total_chars'):
+        return None
+
+    total_length = stats['total_chars']
+    speaker_percentages = {
+        speaker: (values['chars'] / total_length) * 100
+        for speaker, values in stats['speakers'].items()
+    }
+    sorted_speakers = sorted(speaker_percentages.items(), key=lambda item: item[1], reverse=True)
+
+    return {
+        "labels": [item[0] for item in sorted_speakers],
+        "data": [round(item[1], 2) for item in sorted_speakers]
+    }
+
+
 def calculate_speaker_share(meeting_id):
-    """특정 회의의 화자별 발언 점유율을 계산합니다 (글자 수 기반)."""
+    """특정 회의의 화자별 발언 점유율을 계산합니다 (글자 수 기반, meeting_stats 사용)."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT speaker_label, segment FROM meeting_dialogues WHERE meeting_id = ?", (meeting_id,))
-            rows = cursor.fetchall()
-
-        if not rows:
-            return None
-
-        speaker_text_lengths = defaultdict(int)
-        total_length = 0
-
-        for row in rows:
-            speaker = row['speaker_label']
-            text = row['segment'] if row['segment'] is not None else ""
-            text_length = len(text)
-            speaker_text_lengths[speaker] += text_length
-            total_length += text_length
-
-        if total_length == 0:
-            return None
-
-        speaker_percentages = {speaker: (length / total_length) * 100 for speaker, length in speaker_text_lengths.items()}
-        sorted_speakers = sorted(speaker_percentages.items(), key=lambda item: item[1], reverse=True)
-
-        chart_data = {
-            "labels": [item[0] for item in sorted_speakers],
-            "data": [round(item[1], 2) for item in sorted_speakers]
-        }
+        from utils.db_manager import DatabaseManager
 
-        return chart_data
+        stats = DatabaseManager(DB_PATH).get_meeting_stats(meeting_id)
+        return speaker_share_from_stats(stats)
 
     except Exception as e:
         logger.error(f"Error in calculate_speaker_share: {e}")
@@ -0,0 +1,182 @@
+"""
+ASGI 지원 모듈
+- 경로 패턴 라우팅 (/api/summarize/<meeting_id> 형식)
+- Flask 세션 쿠키 읽기 (Flask 라우트와 로그인 상태 공유)
+- JSON / SSE 응답 전송, SSE 중 클라이언트 연결 종료 감지
+"""
+import asyncio
+import json
+import re
+import logging
+from http.cookies import SimpleCookie
+
+from itsdangerous import BadSignature
+
+logger = logging.getLogger(__name__)
+
+
+class AsgiRequest:
+    """ASGI HTTP 요청"""
+
+    def __init__(self, scope, receive, path_params=None):
+        self.scope = scope
+        self.receive = receive
+        self.method = scope['method']
+        self.path = scope['path']
+        self.path_params = path_params or {}
+        self.session = {}       # Flask 세션 (load_flask_session으로 채움)
+        self.headers = {key.decode('latin-1').lower(): value.decode('latin-1') for key, value in scope.get('headers', [])}
+        self._body = None
+
+    @property
+    def cookies(self):
+        cookie = SimpleCookie()
+        cookie.load(self.headers.get('cookie', ''))
+        return {key: morsel.value for key, morsel in cookie.items()}
+
+    async def body(self):
+        """요청 본문 전체 읽기"""
+        if self._body is None:
+            chunks = []
+            while True:
+                message = await self.receive()
+                if message['type'] == 'http.disconnect':
+                    break
+                chunks.append(message.get('body', b''))
+                if not message.get('more_body'):
+                    break
+            self._body = b''.join(chunks)
+        return self._body
+
+    async def json(self):
+        """JSON 본문 (비어 있거나 형식이 잘못되면 빈 dict)"""
+        body = await self.body()
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+class AsyncRouter:
+    """메서드 + 경로 패턴 → 비동기 핸들러"""
+
+    def __init__(self):
+        self._routes = []   # (method, regex, handler)
+
+    def route(self, pattern, methods=("GET",)):
+        """
+        핸들러 등록 데코레이터 - handler(request, send, **path_params)
+
+        Args:
+            pattern (str): 경로 패턴 (예: "/api/summarize/<meeting_id>")
+            methods (tuple): 허용 메서드
+        """
+        regex = re.compile('^' + re.sub(r'<(\w+)>', r'(?P<\1>[^/]+)', pattern) + '$')
+
+        def decorator(handler):
+            for method in methods:
+                self._routes.append((method, regex, handler))
+            return handler
+
+        return decorator
+
+    def match(self, method, path):
+        """
+        요청과 일치하는 핸들러 찾기
+
+        Returns:
+            tuple or None: (handler, path_params)
+        """
+        for route_method, regex, handler in self._routes:
+            if route_method == method:
+                found = regex.match(path)
+                if found:
+                    return handler, found.groupdict()
+        return None
+
+
+def load_flask_session(flask_app, request):
+    """
+    Flask 서명 쿠키 세션 읽기 (읽기 전용)
+
+    Args:
+        flask_app (Flask): 세션 서명 키/설정을 가진 Flask 앱
+        request (AsgiRequest): 요청
+
+    Returns:
+        dict: 세션 데이터 (쿠키가 없거나 서명이 잘못되었으면 빈 dict)
+    """
+    value = request.cookies.get(flask_app.config['SESSION_COOKIE_NAME'])
+    serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+    if not value or serializer is None:
+        return {}
+
+    try:
+        max_age = int(flask_app.permanent_session_lifetime.total_seconds())
+        return serializer.loads(value, max_age=max_age)
+    except BadSignature:
+        return {}
+
+
+async def send_json(send, payload, status=200):
+    """JSON 응답 전송"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json; charset=utf-8'),
+            (b'content-length', str(len(body)).encode('latin-1')),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def send_event_stream(receive, send, events):
+    """
+    SSE 응답 전송 (data: {json}\\n\\n)
+    클라이언트 연결이 끊기면 이벤트 생성 작업을 취소하고 제너레이터를 닫습니다.
+
+    Args:
+        receive: ASGI receive (요청 본문은 미리 읽어 두어야 함)
+        send: ASGI send
+        events: dict 이벤트를 내보내는 async generator
+    """
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', b'text/event-stream; charset=utf-8'),
+            (b'cache-control', b'no-cache'),
+            (b'x-accel-buffering', b'no'),
+        ],
+    })
+
+    async def produce():
+        try:
+            async for event in events:
+                data = f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8')
+                await send({'type': 'http.response.body', 'body': data, 'more_body': True})
+        finally:
+            await events.aclose()
+
+    async def wait_disconnect():
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+    producer = asyncio.ensure_future(produce())
+    watcher = asyncio.ensure_future(wait_disconnect())
+    try:
+        await asyncio.wait({producer, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if not producer.done():
+            # 클라이언트 연결 종료 → 진행 중인 LLM 스트림까지 취소
+            producer.cancel()
+        watcher.cancel()
+        await asyncio.gather(producer, watcher, return_exceptions=True)
+
+    if not producer.cancelled() and producer.exception() is None:
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
@@ -0,0 +1,193 @@
+"""
+회의별 결합 텍스트 캐시 모듈
+- 회의의 청크 전체 / 문단 요약 전체를 순서대로 결합한 텍스트를 캐시
+- 메모리 LRU + SQLite 영구 저장 (재시작 후에도 Vector DB 조회 없이 응답)
+- 청크/서브토픽 저장·삭제 시 회의 단위로 무효화
+"""
+import sqlite3
+import datetime
+import threading
+import logging
+from pathlib import Path
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class AssembledTextCache:
+    """회의별 결합 텍스트 캐시 (kind: 'chunks' 또는 'subtopic')"""
+
+    def __init__(self, path, maxsize=256):
+        """
+        Args:
+            path (str): 캐시 SQLite 파일 경로
+            maxsize (int): 메모리 LRU 최대 항목 수
+        """
+        self.path = str(path)
+        self.maxsize = maxsize
+        self._memory = OrderedDict()    # (kind, meeting_id) -> content
+        self._generations = {}          # (kind, meeting_id) -> 무효화 횟수 (로드 중 무효화 감지)
+        self._epochs = {}               # kind -> 전체 삭제 횟수
+        self._lock = threading.Lock()
+        # SQLite 쓰기 직렬화: 무효화 확인~INSERT 사이에 invalidate()/clear()의 DELETE가 끼어들지 않도록
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS assembled_texts (
+                kind TEXT NOT NULL,
+                meeting_id TEXT NOT NULL,
+                content TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (kind, meeting_id)
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _get_connection(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _generation(self, key):
+        return self._epochs.get(key[0], 0), self._generations.get(key, 0)
+
+    def _remember(self, key, content):
+        self._memory[key] = content
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, kind, meeting_id):
+        """
+        캐시 조회 (메모리 → SQLite)
+
+        Args:
+            kind (str): 'chunks' 또는 'subtopic'
+            meeting_id (str): 회의 ID
+
+        Returns:
+            str or None: 결합 텍스트 (빈 문자열은 '내용 없음'이 캐시된 상태), 미스면 None
+        """
+        key = (kind, meeting_id)
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return content
+            generation = self._generation(key)
+
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT content FROM assembled_texts WHERE kind = ? AND meeting_id = ?", (kind, meeting_id)
+        ).fetchone()
+        conn.close()
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # 읽는 동안 무효화되었으면 메모리에 올리지 않음
+            if self._generation(key) == generation:
+                self._remember(key, row[0])
+            return row[0]
+
+    def get_or_load(self, kind, meeting_id, loader):
+        """
+        캐시 조회, 미스면 loader()로 결합 텍스트를 만들어 저장합니다.
+        로드 중에 해당 회의가 무효화되면 결과를 저장하지 않습니다 (오래된 텍스트 저장 방지).
+
+        Args:
+            kind (str): 'chunks' 또는 'subtopic'
+            meeting_id (str): 회의 ID
+            loader (callable): 결합 텍스트를 반환하는 함수 (예외 발생 시 저장하지 않음)
+
+        Returns:
+            str: 결합 텍스트
+        """
+        content = self.get(kind, meeting_id)
+        if content is not None:
+            return content
+
+        key = (kind, meeting_id)
+        with self._lock:
+            generation = self._generation(key)
+
+        content = loader()
+
+        # 무효화 확인과 저장을 쓰기 잠금 하나로 묶음 (invalidate()/clear()의 DELETE가 사이에 실행되지 않음)
+        with self._write_lock:
+            with self._lock:
+                if self._generation(key) != generation:
+                    return content
+                self._remember(key, content)
+
+            conn = self._get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO assembled_texts (kind, meeting_id, content, updated_at) VALUES (?, ?, ?, ?)",
+                (kind, meeting_id, content, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            conn.commit()
+            conn.close()
+        return content
+
+    def invalidate(self, meeting_id, kinds=('chunks', 'subtopic')):
+        """
+        회의 캐시 무효화
+
+        Args:
+            meeting_id (str): 회의 ID
+            kinds (tuple): 무효화할 종류
+        """
+        with self._write_lock:
+            with self._lock:
+                for kind in kinds:
+                    key = (kind, meeting_id)
+                    self._memory.pop(key, None)
+                    self._generations[key] = self._generations.get(key, 0) + 1
+
+            conn = self._get_connection()
+            conn.executemany(
+                "DELETE FROM assembled_texts WHERE kind = ? AND meeting_id = ?",
+                [(kind, meeting_id) for kind in kinds]
+            )
+            conn.commit()
+            conn.close()
+
+    def clear(self, kinds=('chunks', 'subtopic')):
+        """
+        종류별 캐시 전체 삭제 (컬렉션 전체 삭제, 인덱스 버전 교체 시)
+
+        Args:
+            kinds (tuple): 삭제할 종류
+        """
+        with self._write_lock:
+            with self._lock:
+                for key in [key for key in self._memory if key[0] in kinds]:
+                    del self._memory[key]
+                for kind in kinds:
+                    self._epochs[kind] = self._epochs.get(kind, 0) + 1
+
+            conn = self._get_connection()
+            conn.executemany("DELETE FROM assembled_texts WHERE kind = ?", [(kind,) for kind in kinds])
+            conn.commit()
+            conn.close()
+
+    def get_stats(self):
+        """
+        캐시 적중률 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'memory_size'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'memory_size': len(self._memory)
+        }
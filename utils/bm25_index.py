@@ -0,0 +1,321 @@
+"""
+BM25 키워드 검색 인덱스 모듈
+- 한국어 음절 bigram 토크나이저 (조사/어미가 붙어도 고유명사, 숫자, 전문용어 매칭)
+- 프로세스 내 역색인 (CSR 배열 + 증분 delta, 삭제는 tombstone)
+- meeting_id 필터 지원
+"""
+import math
+import re
+import threading
+import unicodedata
+import logging
+from collections import Counter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 한글 음절 bigram (겹치는 매칭을 위해 lookahead 사용), 한 글자 한글 어절, 한글 외 어절(영문, 숫자 등)
+_HANGUL_BIGRAM_PATTERN = re.compile(r'(?=([가-힣]{2}))')
+_HANGUL_SINGLE_PATTERN = re.compile(r'(?<![가-힣])[가-힣](?![가-힣])')
+_OTHER_WORD_PATTERN = re.compile(r'[^\W_가-힣]+')
+
+
+def tokenize_korean(text):
+    """
+    한국어 검색용 토크나이저
+
+    연속된 한글은 음절 bigram으로 분해하고 (예: '사자회담에서' -> '사자', '자회', '회담', '담에', '에서'),
+    영문/숫자 등 한글 외 문자열은 그대로 토큰으로 사용합니다 (예: '2025년' -> '2025', ...).
+    BM25는 순서를 사용하지 않으므로 토큰 순서는 보장하지 않습니다.
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        list[str]: 토큰 리스트
+    """
+    text = unicodedata.normalize('NFC', text or "").lower()
+    return (
+        _HANGUL_BIGRAM_PATTERN.findall(text)
+        + _HANGUL_SINGLE_PATTERN.findall(text)
+        + _OTHER_WORD_PATTERN.findall(text)
+    )
+
+
+class BM25Index:
+    """
+    증분 업데이트를 지원하는 BM25 역색인
+
+    - 병합된 postings는 term 순으로 정렬된 CSR 배열(offsets, docs, tfs)로 보관
+    - 새로 추가된 문서는 delta 배열에 쌓였다가 일정 크기를 넘으면 CSR로 병합
+    - 삭제된 문서는 tombstone 처리 후 병합 시 제거
+    """
+
+    def __init__(self, k1=1.5, b=0.75, merge_min_entries=100_000, merge_ratio=0.1):
+        """
+        Args:
+            k1 (float): BM25 tf 포화 파라미터
+            b (float): BM25 문서 길이 정규화 파라미터
+            merge_min_entries (int): delta 병합 최소 posting 수
+            merge_ratio (float): CSR 크기 대비 delta 비율이 이 값을 넘으면 병합
+        """
+        self.k1 = k1
+        self.b = b
+        self.merge_min_entries = merge_min_entries
+        self.merge_ratio = merge_ratio
+
+        self._lock = threading.RLock()
+
+        self._vocab = {}            # term -> term_id
+        self._doc_index = {}        # doc_id -> 내부 인덱스
+        self._doc_ids = []          # 내부 인덱스 -> doc_id
+        self._meeting_codes = {}    # meeting_id -> 정수 코드
+
+        self._size = 0
+        self._doc_meeting = np.zeros(0, dtype=np.int32)
+        self._lengths = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._alive_count = 0
+        self._total_length = 0.0
+
+        # 병합된 postings (CSR)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._post_docs = np.zeros(0, dtype=np.int32)
+        self._post_tfs = np.zeros(0, dtype=np.uint16)
+
+        # 병합 전 postings (term_id, doc, tf 배치 배열 목록)
+        self._delta = []
+        self._delta_entries = 0
+        self._delta_cache = None
+
+    def __len__(self):
+        return self._alive_count
+
+    def _ensure_capacity(self, size):
+        capacity = len(self._alive)
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, capacity * 2, 1024)
+        for name in ('_doc_meeting', '_lengths', '_alive'):
+            array = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+
+    def _remove_index(self, index):
+        if self._alive[index]:
+            self._alive[index] = False
+            self._alive_count -= 1
+            self._total_length -= float(self._lengths[index])
+
+    def add_documents(self, doc_ids, texts, meeting_ids, merge=True):
+        """
+        문서 추가 (같은 doc_id가 이미 있으면 교체)
+
+        Args:
+            doc_ids (list[str]): 문서 ID 목록 (Vector DB ID와 동일)
+            texts (list[str]): 문서 텍스트 목록
+            meeting_ids (list[str]): 문서별 meeting_id 목록
+            merge (bool): delta가 커졌을 때 CSR 병합 여부 (대량 구축 시 False 후 merge() 1회 호출)
+        """
+        term_ids, docs, tfs = [], [], []
+
+        with self._lock:
+            self._ensure_capacity(self._size + len(doc_ids))
+
+            for doc_id, text, meeting_id in zip(doc_ids, texts, meeting_ids):
+                previous = self._doc_index.get(doc_id)
+                if previous is not None:
+                    self._remove_index(previous)
+
+                index = self._size
+                self._size += 1
+                self._doc_index[doc_id] = index
+                self._doc_ids.append(doc_id)
+
+                counts = Counter(tokenize_korean(text))
+                for term, tf in counts.items():
+                    term_id = self._vocab.get(term)
+                    if term_id is None:
+                        term_id = self._vocab[term] = len(self._vocab)
+                    term_ids.append(term_id)
+                    docs.append(index)
+                    tfs.append(min(tf, 65535))
+
+                code = self._meeting_codes.setdefault(meeting_id, len(self._meeting_codes))
+                length = sum(counts.values())
+
+                self._doc_meeting[index] = code
+                self._lengths[index] = length
+                self._alive[index] = True
+                self._alive_count += 1
+                self._total_length += length
+
+            if term_ids:
+                self._delta.append((
+                    np.asarray(term_ids, dtype=np.int32),
+                    np.asarray(docs, dtype=np.int32),
+                    np.asarray(tfs, dtype=np.uint16)
+                ))
+                self._delta_entries += len(term_ids)
+                self._delta_cache = None
+
+            if merge and self._delta_entries >= max(self.merge_min_entries, self.merge_ratio * len(self._post_docs)):
+                self.merge()
+
+    def remove_documents(self, doc_ids):
+        """
+        문서 삭제 (tombstone)
+
+        Args:
+            doc_ids (list[str]): 삭제할 문서 ID 목록
+        """
+        with self._lock:
+            for doc_id in doc_ids:
+                index = self._doc_index.pop(doc_id, None)
+                if index is not None:
+                    self._remove_index(index)
+
+    def remove_meeting(self, meeting_id):
+        """
+        회의의 모든 문서 삭제 (tombstone)
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            int: 삭제된 문서 수
+        """
+        with self._lock:
+            code = self._meeting_codes.get(meeting_id)
+            if code is None:
+                return 0
+
+            indexes = np.flatnonzero(self._alive[:self._size] & (self._doc_meeting[:self._size] == code))
+            for index in indexes:
+                self._doc_index.pop(self._doc_ids[index], None)
+                self._remove_index(index)
+
+            return len(indexes)
+
+    def _delta_arrays(self):
+        if self._delta_cache is None:
+            if self._delta:
+                self._delta_cache = tuple(np.concatenate(parts) for parts in zip(*self._delta))
+            else:
+                empty = (np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros(0, np.uint16))
+                self._delta_cache = empty
+        return self._delta_cache
+
+    def merge(self):
+        """delta postings를 CSR로 병합하고 삭제된 문서의 postings를 제거합니다."""
+        with self._lock:
+            counts = np.diff(self._offsets)
+            base_terms = np.repeat(np.arange(len(counts), dtype=np.int32), counts)
+            delta_terms, delta_docs, delta_tfs = self._delta_arrays()
+
+            terms = np.concatenate([base_terms, delta_terms])
+            docs = np.concatenate([self._post_docs, delta_docs])
+            tfs = np.concatenate([self._post_tfs, delta_tfs])
+
+            keep = self._alive[docs]
+            terms, docs, tfs = terms[keep], docs[keep], tfs[keep]
+
+            order = np.argsort(terms, kind='stable')
+            self._post_docs = docs[order]
+            self._post_tfs = tfs[order]
+
+            offsets = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(terms, minlength=len(self._vocab)), out=offsets[1:])
+            self._offsets = offsets
+
+            self._delta = []
+            self._delta_entries = 0
+            self._delta_cache = None
+
+    def search(self, query, k=10, meeting_ids=None):
+        """
+        BM25 검색
+
+        Args:
+            query (str): 검색 쿼리
+            k (int): 반환할 최대 결과 수
+            meeting_ids (list, optional): 검색 대상 meeting_id 목록
+
+        Returns:
+            list[tuple]: [(doc_id, score), ...] (점수 내림차순)
+        """
+        with self._lock:
+            if self._alive_count == 0:
+                return []
+
+            term_ids = sorted({self._vocab[t] for t in tokenize_korean(query) if t in self._vocab})
+            if not term_ids:
+                return []
+
+            size = self._size
+            lengths = self._lengths[:size]
+            avgdl = self._total_length / self._alive_count
+            norms = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+            scores = np.zeros(size, dtype=np.float32)
+
+            delta_terms, delta_docs, delta_tfs = self._delta_arrays()
+            delta_mask = np.isin(delta_terms, term_ids)
+            delta_terms, delta_docs, delta_tfs = delta_terms[delta_mask], delta_docs[delta_mask], delta_tfs[delta_mask]
+
+            merged_terms = len(self._offsets) - 1
+            for term_id in term_ids:
+                if term_id < merged_terms:
+                    start, end = self._offsets[term_id], self._offsets[term_id + 1]
+                    docs = self._post_docs[start:end]
+                    tfs = self._post_tfs[start:end]
+                else:
+                    docs = tfs = None
+
+                in_delta = delta_terms == term_id
+                if in_delta.any():
+                    extra_docs, extra_tfs = delta_docs[in_delta], delta_tfs[in_delta]
+                    docs = extra_docs if docs is None else np.concatenate([docs, extra_docs])
+                    tfs = extra_tfs if tfs is None else np.concatenate([tfs, extra_tfs])
+
+                if docs is None or len(docs) == 0:
+                    continue
+
+                df = len(docs)
+                idf = math.log(1 + (self._alive_count - df + 0.5) / (df + 0.5))
+                tfs = tfs.astype(np.float32)
+                scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norms[docs])
+
+            mask = self._alive[:size] & (scores > 0)
+            if meeting_ids is not None:
+                codes = [self._meeting_codes[m] for m in meeting_ids if m in self._meeting_codes]
+                mask &= np.isin(self._doc_meeting[:size], codes)
+
+            candidates = np.flatnonzero(mask)
+            if len(candidates) > k:
+                top = np.argpartition(-scores[candidates], k - 1)[:k]
+                candidates = candidates[top]
+            candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+            return [(self._doc_ids[i], float(scores[i])) for i in candidates]
+
+
+def reciprocal_rank_fusion(rankings, k=60):
+    """
+    여러 랭킹을 Reciprocal Rank Fusion으로 결합합니다.
+
+    Args:
+        rankings (list[list[str]]): 문서 ID 랭킹 목록 (각 랭킹은 관련도 내림차순)
+        k (int): RRF 상수 (클수록 하위 순위 가중치가 커짐)
+
+    Returns:
+        list[tuple]: [(doc_id, fused_score), ...] (점수 내림차순)
+    """
+    fused = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
@@ -1,9 +1,18 @@
 import os
 import re
+import json
+import time
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 
 from config import config
+from utils.semantic_answer_cache import SemanticAnswerCache
+from utils.query_rules import extract_query_constraints
+from utils.context_packer import pack_documents, estimate_tokens
+from utils.meeting_context_cache import MeetingContextCache, GeminiContextCacheBackend, LocalContextCacheBackend
+from utils.conversation_memory import ConversationMemory
 
 logger = logging.getLogger(__name__)
 
@@ -49,13 +58,44 @@ class ChatManager:
         self.gemini_client = genai.Client(api_key=api_key)
         self.model_name = "gemini-2.5-flash"
 
+        # chunks / subtopic 컬렉션 동시 검색용 스레드 풀
+        self.search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chat-search")
+
+        # 오래된 대화 요약 (수 초 걸리는 Gemini 호출이 검색 스레드를 점유하지 않도록 분리)
+        self.summary_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-summary")
+
+        # 회의 컨텍스트 캐시 무효화 (provider 캐시 삭제 호출도 검색 스레드와 분리)
+        self.cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-cache")
+
+        # 시맨틱 답변 캐시 (검색 범위 + 질문 임베딩 유사도 기준)
+        self.answer_cache = SemanticAnswerCache(
+            maxsize=config.ANSWER_CACHE_SCOPES,
+            entries_per_scope=config.ANSWER_CACHE_ENTRIES_PER_SCOPE,
+            ttl=config.ANSWER_CACHE_TTL,
+            threshold=config.ANSWER_CACHE_THRESHOLDS.get(config.EMBEDDING_BACKEND, 0.95)
+        )
+
+        # 단일 회의 컨텍스트 캐시 (MEETING_CONTEXT_CACHE=gemini/local일 때만)
+        self.meeting_context_cache = self._create_meeting_context_cache()
+
+        # 대화별 롤링 기록 (최근 대화 원문 + 오래된 대화 요약)
+        self.conversation_memory = ConversationMemory(
+            maxsize=config.CONVERSATION_MAX,
+            ttl=config.CONVERSATION_TTL,
+            recent_token_budget=config.CONVERSATION_RECENT_TOKEN_BUDGET,
+            max_recent_turns=config.CONVERSATION_MAX_RECENT_TURNS
+        )
+
         logger.info(f"✅ ChatManager 초기화 완료: retriever_type='{self.retriever_type}'")
 
         self._initialized = True
 
     def search_documents(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None) -> dict:
         """
-        meeting_chunks와 meeting_subtopic에서 각각 3개씩 검색
+        meeting_chunks와 meeting_subtopic에서 각각 CONTEXT_CANDIDATES_PER_COLLECTION개씩 검색
+        (실제 컨텍스트에 들어갈 문서는 pack_context()가 토큰 예산에 맞춰 선택)
+        (meeting_id 제한은 Vector DB 필터로 적용, 쿼리 임베딩 1회 후 두 컬렉션 동시 검색)
+        (여러 회의 대상 검색은 회의 centroid로 후보 회의를 먼저 선택)
 
         Args:
             query (str): 사용자 질문
@@ -79,104 +119,48 @@ class ChatManager:
         # - 따옴표로 묶인 단어
         # - NLP 기반 주제어 추출
 
+        # 검색 대상 meeting_id 목록 (Vector DB where 필터로 전달)
         if meeting_id:
-            # 특정 노트로 제한 (검색 후 필터링)
-            pass  # filter_criteria는 None으로 유지, 검색 후 meeting_id로 필터링
-        elif accessible_meeting_ids:
-            # 접근 가능한 노트들로 제한 (여러 노트에서 검색)
-            # Vector DB가 $in 연산자를 지원하지 않을 수 있으므로, 각 노트별로 검색 후 결합
-            logger.info(f"🔍 {len(accessible_meeting_ids)}개 노트에서 검색 중...")
-            all_chunks = []
-            all_subtopics = []
-
-            # 설정된 retriever_type 사용
-            try:
-                chunk_result = self.vdb_manager.search(
-                    db_type="chunks",
-                    query=query,
-                    k=len(accessible_meeting_ids) * 10,  # 넉넉하게 검색
-                    retriever_type=self.retriever_type,
-                    filter_criteria=None
-                )
-                # 접근 가능한 meeting_id로 필터링
-                all_chunks = [doc for doc in chunk_result
-                             if doc.metadata.get('meeting_id') in accessible_meeting_ids]
+            meeting_ids = [meeting_id]
+        elif accessible_meeting_ids is not None:
+            meeting_ids = list(accessible_meeting_ids)
+            logger.info(f"🔍 {len(meeting_ids)}개 노트에서 검색 중...")
+        else:
+            meeting_ids = None
 
-                subtopic_result = self.vdb_manager.search(
-                    db_type="subtopic",
+        k = config.CONTEXT_CANDIDATES_PER_COLLECTION
+
+        try:
+            # 쿼리는 한 번만 임베딩하고, 두 컬렉션을 동시에 벡터 검색 (설정된 retriever_type 사용)
+            query_embedding = self.vdb_manager.embed_query(query)
+
+            # 2단계 검색: 회의 centroid로 후보 회의 top-N을 먼저 고르고, 그 회의들의 청크/서브토픽만 검색
+            # hybrid는 BM25 키워드 일치가 centroid 필터로 잘려나가지 않도록 전체 범위에서 검색
+            candidate_count = config.COARSE_CANDIDATE_MEETINGS
+            if (config.COARSE_RETRIEVAL_ENABLED and not meeting_id and self.retriever_type != 'hybrid'
+                    and (meeting_ids is None or len(meeting_ids) > candidate_count)):
+                candidates = self.vdb_manager.select_candidate_meetings(
+                    query_embedding, candidate_count, meeting_ids=meeting_ids
+                )
+                if candidates:
+                    logger.info(f"🎯 후보 회의 {len(candidates)}개로 검색 범위 축소")
+                    meeting_ids = candidates
+
+            futures = {
+                db_type: self.search_executor.submit(
+                    self.vdb_manager.search,
+                    db_type=db_type,
                     query=query,
-                    k=len(accessible_meeting_ids) * 10,  # 넉넉하게 검색
+                    k=k,
                     retriever_type=self.retriever_type,
-                    filter_criteria=None
+                    meeting_ids=meeting_ids,
+                    query_embedding=query_embedding
                 )
-                # 접근 가능한 meeting_id로 필터링
-                all_subtopics = [doc for doc in subtopic_result
-                                if doc.metadata.get('meeting_id') in accessible_meeting_ids]
-
-                # title 키워드로 부분 일치 필터링
-                if title_keywords:
-                    logger.info(f"📌 title 필터링 적용: {title_keywords}")
-                    filtered_chunks = []
-                    for doc in all_chunks:
-                        doc_title = doc.metadata.get('title', '').lower()
-                        if any(keyword.lower() in doc_title for keyword in title_keywords):
-                            filtered_chunks.append(doc)
-
-                    filtered_subtopics = []
-                    for doc in all_subtopics:
-                        doc_title = doc.metadata.get('meeting_title', '').lower()
-                        if any(keyword.lower() in doc_title for keyword in title_keywords):
-                            filtered_subtopics.append(doc)
-
-                    logger.debug(f"   필터링 전: chunks={len(all_chunks)}, subtopic={len(all_subtopics)}")
-                    logger.debug(f"   필터링 후: chunks={len(filtered_chunks)}, subtopic={len(filtered_subtopics)}")
-
-                    all_chunks = filtered_chunks
-                    all_subtopics = filtered_subtopics
-
-            except Exception as e:
-                # 검색 실패 시 빈 결과 반환
-                logger.warning(f"⚠️ 검색 실패: {e}")
-                all_chunks = []
-                all_subtopics = []
-
-            # 상위 3개씩만 선택
-            chunks_results = all_chunks[:3]
-            subtopic_results = all_subtopics[:3]
-
-            logger.info(f"✅ 검색 완료: chunks={len(chunks_results)}개, subtopic={len(subtopic_results)}개")
-
-            return {
-                "chunks": chunks_results,
-                "subtopics": subtopic_results,
-                "total_count": len(chunks_results) + len(subtopic_results)
+                for db_type in ("chunks", "subtopic")
             }
 
-        try:
-            # 단일 노트 검색 또는 전체 검색
-            # 설정된 retriever_type 사용
-            chunks_results = self.vdb_manager.search(
-                db_type="chunks",
-                query=query,
-                k=20 if meeting_id else 10,  # 넉넉하게 검색 후 필터링
-                retriever_type=self.retriever_type,
-                filter_criteria=None
-            )
-
-            subtopic_results = self.vdb_manager.search(
-                db_type="subtopic",
-                query=query,
-                k=20 if meeting_id else 10,  # 넉넉하게 검색 후 필터링
-                retriever_type=self.retriever_type,
-                filter_criteria=None
-            )
-
-            # meeting_id가 지정된 경우, 해당 노트로 필터링
-            if meeting_id:
-                chunks_results = [doc for doc in chunks_results
-                                 if doc.metadata.get('meeting_id') == meeting_id]
-                subtopic_results = [doc for doc in subtopic_results
-                                   if doc.metadata.get('meeting_id') == meeting_id]
+            chunks_results = futures["chunks"].result()
+            subtopic_results = futures["subtopic"].result()
 
             # title 키워드로 부분 일치 필터링
             if title_keywords:
@@ -200,9 +184,9 @@ class ChatManager:
                 chunks_results = filtered_chunks
                 subtopic_results = filtered_subtopics
 
-            # 상위 3개만 선택
-            chunks_results = chunks_results[:3]
-            subtopic_results = subtopic_results[:3]
+            # 상위 k개만 선택
+            chunks_results = chunks_results[:k]
+            subtopic_results = subtopic_results[:k]
 
             logger.info(f"✅ 검색 완료: chunks={len(chunks_results)}개, subtopic={len(subtopic_results)}개")
 
@@ -220,12 +204,73 @@ class ChatManager:
                 "total_count": 0
             }
 
+    def pack_context(self, search_results: dict, token_budget: int = None) -> dict:
+        """
+        검색된 문서를 토큰 예산에 맞춰 선택
+
+        - chunks / subtopics를 검색 순위대로 번갈아 후보로 두고, 순위가 높은 문서부터 예산을 채움
+        - 이미 선택된 문서와 거의 같은 구절(shingle 겹침)은 제외
+        - 선택된 문서는 회의 일시 → 회의 내 위치 순으로 정렬 (모델이 시간 순서대로 읽도록)
+
+        Args:
+            search_results (dict): search_documents()의 반환값
+            token_budget (int, optional): 컨텍스트 토큰 예산 (기본값: CONTEXT_TOKEN_BUDGET)
+
+        Returns:
+            dict: {
+                "chunks": [Document, ...],
+                "subtopics": [Document, ...],
+                "total_count": int,
+                "context_stats": {"tokens", "budget", "candidates", "selected", "duplicates", "over_budget"}
+            }
+        """
+        ranked = []
+        for rank in range(max(len(search_results["chunks"]), len(search_results["subtopics"]))):
+            for kind, docs in (("chunk", search_results["chunks"]), ("subtopic", search_results["subtopics"])):
+                if rank < len(docs):
+                    ranked.append({
+                        "kind": kind,
+                        "doc": docs[rank],
+                        "text": docs[rank].page_content,
+                        "rendered": self._render_document(kind, docs[rank], rank + 1)
+                    })
+
+        selected, stats = pack_documents(
+            ranked,
+            token_budget=token_budget or config.CONTEXT_TOKEN_BUDGET,
+            dedup_threshold=config.CONTEXT_DEDUP_THRESHOLD,
+            shingle_size=config.CONTEXT_SHINGLE_SIZE
+        )
+
+        def chronological(doc):
+            meta = doc.metadata
+            return (
+                str(meta.get("meeting_date") or ""),
+                str(meta.get("meeting_id") or ""),
+                meta.get("start_time", meta.get("summary_index", 0)) or 0
+            )
+
+        chunks = sorted((item["doc"] for item in selected if item["kind"] == "chunk"), key=chronological)
+        subtopics = sorted((item["doc"] for item in selected if item["kind"] == "subtopic"), key=chronological)
+
+        logger.info(
+            f"📦 컨텍스트 구성: {stats['selected']}/{stats['candidates']}개 문서, "
+            f"약 {stats['tokens']}/{stats['budget']} 토큰 (중복 제외 {stats['duplicates']}개, 예산 초과 {stats['over_budget']}개)"
+        )
+
+        return {
+            "chunks": chunks,
+            "subtopics": subtopics,
+            "total_count": len(chunks) + len(subtopics),
+            "context_stats": stats
+        }
+
     def format_context(self, search_results: dict) -> str:
         """
         검색된 문서들을 컨텍스트 문자열로 포맷팅
 
         Args:
-            search_results (dict): search_documents()의 반환값
+            search_results (dict): pack_context()의 반환값 (search_documents()의 반환값도 그대로 사용 가능)
 
         Returns:
             str: 포맷팅된 컨텍스트
@@ -236,54 +281,65 @@ class ChatManager:
         if search_results["chunks"]:
             context_parts.append("=== 회의 대화 내용 ===")
             for i, doc in enumerate(search_results["chunks"], 1):
-                metadata = doc.metadata
-                context_parts.append(
-                    f"\n[문서 {i}]\n"
-                    f"회의: {metadata.get('title', 'N/A')}\n"
-                    f"일시: {metadata.get('meeting_date', 'N/A')}\n"
-                    f"시간: {metadata.get('start_time', 0):.0f}초 - {metadata.get('end_time', 0):.0f}초\n"
-                    f"내용:\n{doc.page_content}\n"
-                )
+                context_parts.append(self._render_document("chunk", doc, i))
 
         # Subtopics 추가
         if search_results["subtopics"]:
             context_parts.append("\n=== 회의 주제별 요약 ===")
             for i, doc in enumerate(search_results["subtopics"], 1):
-                metadata = doc.metadata
-                content = doc.page_content
-
-                # 첫 번째 ### 제목 라인 제거 (구버전 제목이 포함될 수 있음)
-                content = re.sub(r'^###\s+.+?\n', '', content, count=1)
-
-                context_parts.append(
-                    f"\n[요약 {i}]\n"
-                    f"회의: {metadata.get('meeting_title', 'N/A')}\n"
-                    f"일시: {metadata.get('meeting_date', 'N/A')}\n"
-                    f"주제: {metadata.get('main_topic', 'N/A')}\n"
-                    f"내용:\n{content}\n"
-                )
+                context_parts.append(self._render_document("subtopic", doc, i))
 
         if not context_parts:
             return "검색된 회의록 내용이 없습니다."
 
         return "\n".join(context_parts)
 
-    def generate_answer(self, query: str, context: str) -> dict:
+    def _render_document(self, kind: str, doc, index: int) -> str:
         """
-        Gemini 2.5 Flash를 사용하여 답변 생성
+        컨텍스트에 들어갈 문서 한 개의 문자열
+
+        Args:
+            kind (str): "chunk" 또는 "subtopic"
+            doc (Document): 검색된 문서
+            index (int): 문서 번호
+
+        Returns:
+            str: 메타데이터 헤더와 본문
+        """
+        metadata = doc.metadata
+
+        if kind == "chunk":
+            return (
+                f"\n[문서 {index}]\n"
+                f"회의: {metadata.get('title', 'N/A')}\n"
+                f"일시: {metadata.get('meeting_date', 'N/A')}\n"
+                f"시간: {metadata.get('start_time', 0):.0f}초 - {metadata.get('end_time', 0):.0f}초\n"
+                f"내용:\n{doc.page_content}\n"
+            )
+
+        # 첫 번째 ### 제목 라인 제거 (구버전 제목이 포함될 수 있음)
+        content = re.sub(r'^###\s+.+?\n', '', doc.page_content, count=1)
+
+        return (
+            f"\n[요약 {index}]\n"
+            f"회의: {metadata.get('meeting_title', 'N/A')}\n"
+            f"일시: {metadata.get('meeting_date', 'N/A')}\n"
+            f"주제: {metadata.get('main_topic', 'N/A')}\n"
+            f"내용:\n{content}\n"
+        )
+
+    def _build_answer_prompt(self, query: str, context: str, history: str = None) -> str:
+        """
+        답변 생성용 프롬프트 구성
 
         Args:
             query (str): 사용자 질문
             context (str): 검색된 문서 컨텍스트
+            history (str, optional): 이전 대화 기록 (_format_history() 결과)
 
         Returns:
-            dict: {
-                "success": bool,
-                "answer": str,
-                "error": str (optional)
-            }
+            str: Gemini 프롬프트
         """
-        # 프롬프트 생성
         prompt = f"""
 당신은 회의록 내용을 바탕으로 사용자의 질문에 답변하는 전문 비서 챗봇입니다.
 
@@ -300,7 +356,7 @@ class ChatManager:
 {context}
 
 ---
-
+{self._history_block(history)}
 [사용자 질문]:
 {query}
 
@@ -308,23 +364,60 @@ class ChatManager:
 
 [답변]:
 """
+        return prompt
+
+    def generate_answer(self, query: str, context: str, cached_content: str = None, history: str = None) -> dict:
+        """
+        Gemini 2.5 Flash를 사용하여 답변 생성
+
+        Args:
+            query (str): 사용자 질문
+            context (str): 검색된 문서 컨텍스트
+            cached_content (str, optional): 회의 컨텍스트 캐시 이름 (지정하면 context 대신 캐시 참조)
+            history (str, optional): 이전 대화 기록
 
+        Returns:
+            dict: {
+                "success": bool,
+                "answer": str,
+                "usage": {"prompt_tokens", "output_tokens"} (Gemini 응답에 사용량이 있는 경우),
+                "error": str (optional)
+            }
+        """
         try:
             # Gemini 2.5 Flash로 답변 생성
             response = self.gemini_client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+                **self._answer_request(query, context, cached_content, history)
             )
+            return self._answer_result(response)
 
-            answer = response.text.strip()
-
-            logger.info(f"✅ 답변 생성 완료 (길이: {len(answer)}자)")
-
+        except Exception as e:
+            logger.error(f"❌ 답변 생성 중 오류: {e}")
             return {
-                "success": True,
-                "answer": answer
+                "success": False,
+                "answer": "죄송합니다. 답변 생성 중 오류가 발생했습니다.",
+                "error": str(e)
             }
 
+    async def agenerate_answer(self, query: str, context: str, cached_content: str = None, history: str = None) -> dict:
+        """
+        generate_answer의 비동기 버전 (Gemini 응답을 기다리는 동안 스레드를 점유하지 않음)
+
+        Args:
+            query (str): 사용자 질문
+            context (str): 검색된 문서 컨텍스트
+            cached_content (str, optional): 회의 컨텍스트 캐시 이름
+            history (str, optional): 이전 대화 기록
+
+        Returns:
+            dict: generate_answer()와 같은 형식
+        """
+        try:
+            response = await self.gemini_client.aio.models.generate_content(
+                **self._answer_request(query, context, cached_content, history)
+            )
+            return self._answer_result(response)
+
         except Exception as e:
             logger.error(f"❌ 답변 생성 중 오류: {e}")
             return {
@@ -333,7 +426,133 @@ class ChatManager:
                 "error": str(e)
             }
 
-    def process_query(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None) -> dict:
+    def _answer_result(self, response) -> dict:
+        """Gemini 응답을 generate_answer() 반환 형식으로 변환"""
+        answer = response.text.strip()
+        usage = self._extract_usage(response)
+
+        logger.info(f"✅ 답변 생성 완료 (길이: {len(answer)}자, 토큰 사용량: {usage or 'N/A'})")
+
+        result = {
+            "success": True,
+            "answer": answer
+        }
+        if usage:
+            result["usage"] = usage
+        return result
+
+    def prepare_answer(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None,
+                       conversation_id: str = None) -> dict:
+        """
+        답변 생성 전 단계 (대화 기록 조회/후속 질문 재작성 → 답변 캐시 조회 → 회의 컨텍스트 캐시 또는 문서 검색/패킹)
+        동기/비동기/스트리밍 처리에서 공통으로 사용하며, 답변 생성 LLM 호출은 포함하지 않습니다.
+
+        Args:
+            query (str): 사용자 질문
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+            conversation_id (str, optional): 대화 키 (지정하면 이전 대화를 참고하고 이번 대화를 기록)
+
+        Returns:
+            dict: {
+                "query": str,
+                "search_query": str (검색/답변 캐시에 사용한 독립 질문 - 후속 질문이면 재작성된 질문),
+                "conversation_id": str or None,
+                "history": str or None (프롬프트에 넣을 이전 대화 기록),
+                "answer": str or None (캐시된 답변 / 검색 결과 없음 안내 - 있으면 LLM 호출 불필요),
+                "sources": list,
+                "context": str or None,
+                "cached_content": str or None (회의 컨텍스트 캐시 이름),
+                "context_tokens": int,
+                "cached": bool (답변 캐시 적중),
+                "cache_ticket": tuple or None
+            }
+        """
+        plan = {
+            "query": query,
+            "search_query": query,
+            "conversation_id": conversation_id,
+            "history": None,
+            "answer": None,
+            "sources": [],
+            "context": None,
+            "cached_content": None,
+            "context_tokens": 0,
+            "cached": False,
+            "cache_ticket": None
+        }
+
+        # 이전 대화가 있으면 프롬프트에 넣을 기록을 만들고, 후속 질문은 검색용 독립 질문으로 재작성
+        snapshot = self.conversation_memory.snapshot(conversation_id) if conversation_id else None
+        if snapshot:
+            plan["history"] = self._format_history(snapshot)
+            plan["search_query"] = self._rewrite_query(query, plan["history"])
+        search_query = plan["search_query"]
+
+        # 0. 같은 범위에서 유사한 질문의 답변이 캐시되어 있으면 재사용
+        cached, plan["cache_ticket"] = self._lookup_cached_answer(search_query, meeting_id, accessible_meeting_ids)
+        if cached:
+            plan.update(answer=cached["answer"], sources=cached["sources"], cached=True)
+            return plan
+
+        # 단일 회의 질문이고 회의 컨텍스트 캐시를 쓸 수 있으면 검색 없이 캐시 참조
+        cached_content, meeting_sources = self._get_meeting_context_cache(meeting_id, accessible_meeting_ids)
+        if cached_content:
+            plan.update(cached_content=cached_content, sources=meeting_sources)
+            return plan
+
+        # 1. 관련 문서 검색
+        search_results = self.search_documents(search_query, meeting_id, accessible_meeting_ids)
+
+        if search_results["total_count"] == 0:
+            plan["answer"] = "죄송합니다. 해당 질문과 관련된 회의록 내용을 찾을 수 없습니다."
+            return plan
+
+        # 2. 토큰 예산에 맞춰 문서 선택 후 컨텍스트 포맷팅 (출처는 실제 컨텍스트에 들어간 문서 기준)
+        packed = self.pack_context(search_results)
+        plan.update(
+            context=self.format_context(packed),
+            sources=self._build_sources(packed),
+            context_tokens=packed["context_stats"]["tokens"]
+        )
+        return plan
+
+    def _complete_answer(self, plan: dict, result: dict) -> dict:
+        """
+        답변 생성 결과를 응답 형식으로 변환하고 답변 캐시에 저장
+
+        Args:
+            plan (dict): prepare_answer()의 반환값
+            result (dict): generate_answer()의 반환값 (LLM 호출 없이 답변한 경우 None)
+
+        Returns:
+            dict: process_query() 반환 형식
+        """
+        if result is not None:
+            if not result["success"]:
+                return result
+            self._store_cached_answer(plan["cache_ticket"], result["answer"], plan["sources"])
+
+        response = {
+            "success": True,
+            "answer": plan["answer"] if result is None else result["answer"],
+            "sources": plan["sources"]
+        }
+        self._remember_turn(plan, response["answer"])
+        if plan["search_query"] != plan["query"]:
+            response["search_query"] = plan["search_query"]
+        if plan["cached"]:
+            response["cached"] = True
+        if plan["cached_content"]:
+            response["context_cached"] = True
+        if plan["context_tokens"]:
+            response["context_tokens"] = plan["context_tokens"]
+        if result is not None and "usage" in result:
+            response["usage"] = result["usage"]
+        return response
+
+    def process_query(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None,
+                      conversation_id: str = None) -> dict:
         """
         사용자 질의를 처리하여 답변 반환
 
@@ -341,6 +560,7 @@ class ChatManager:
             query (str): 사용자 질문
             meeting_id (str, optional): 특정 회의로 제한
             accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+            conversation_id (str, optional): 대화 키 (후속 질문 처리용)
 
         Returns:
             dict: {
@@ -352,26 +572,867 @@ class ChatManager:
         """
         logger.info(f"🤖 챗봇 질의 처리 시작: '{query}'")
 
-        # 1. 관련 문서 검색
-        search_results = self.search_documents(query, meeting_id, accessible_meeting_ids)
+        plan = self.prepare_answer(query, meeting_id, accessible_meeting_ids, conversation_id)
+        if plan["answer"] is not None:
+            return self._complete_answer(plan, None)
 
-        if search_results["total_count"] == 0:
-            return {
+        # 3. 답변 생성
+        result = self.generate_answer(
+            query, plan["context"], cached_content=plan["cached_content"], history=plan["history"]
+        )
+        return self._complete_answer(plan, result)
+
+    async def aprocess_query(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None,
+                             conversation_id: str = None) -> dict:
+        """
+        process_query의 비동기 버전 (ASGI 엔드포인트용)
+        검색(로컬 DB/임베딩)은 스레드 풀에서 실행하고, Gemini 응답 대기는 이벤트 루프에서 처리합니다.
+
+        Args:
+            query (str): 사용자 질문
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+            conversation_id (str, optional): 대화 키 (후속 질문 처리용)
+
+        Returns:
+            dict: process_query()와 같은 형식
+        """
+        logger.info(f"🤖 챗봇 질의 처리 시작 (async): '{query}'")
+
+        plan = await asyncio.to_thread(self.prepare_answer, query, meeting_id, accessible_meeting_ids, conversation_id)
+        if plan["answer"] is not None:
+            return self._complete_answer(plan, None)
+
+        result = await self.agenerate_answer(
+            query, plan["context"], cached_content=plan["cached_content"], history=plan["history"]
+        )
+        return self._complete_answer(plan, result)
+
+    def generate_answer_stream(self, query: str, context: str, usage: dict = None, cached_content: str = None,
+                               history: str = None):
+        """
+        Gemini 스트리밍 호출로 답변을 생성하면서 텍스트 조각을 순서대로 반환
+
+        제너레이터가 중간에 닫히면 (클라이언트 연결 종료) Gemini 스트림도 함께 닫아
+        남은 응답 생성을 중단합니다.
+
+        Args:
+            query (str): 사용자 질문
+            context (str): 검색된 문서 컨텍스트
+            usage (dict, optional): 전달하면 스트림 종료 후 Gemini 토큰 사용량을 채움
+            cached_content (str, optional): 회의 컨텍스트 캐시 이름 (지정하면 context 대신 캐시 참조)
+            history (str, optional): 이전 대화 기록
+
+        Yields:
+            str: 답변 텍스트 조각
+        """
+        stream = self.gemini_client.models.generate_content_stream(
+            **self._answer_request(query, context, cached_content, history)
+        )
+        try:
+            for chunk in stream:
+                if usage is not None:
+                    usage.update(self._extract_usage(chunk))
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+
+    async def agenerate_answer_stream(self, query: str, context: str, usage: dict = None, cached_content: str = None,
+                                      history: str = None):
+        """
+        generate_answer_stream의 비동기 버전
+
+        Args:
+            query (str): 사용자 질문
+            context (str): 검색된 문서 컨텍스트
+            usage (dict, optional): 전달하면 스트림 종료 후 Gemini 토큰 사용량을 채움
+            cached_content (str, optional): 회의 컨텍스트 캐시 이름
+            history (str, optional): 이전 대화 기록
+
+        Yields:
+            str: 답변 텍스트 조각
+        """
+        stream = await self.gemini_client.aio.models.generate_content_stream(
+            **self._answer_request(query, context, cached_content, history)
+        )
+        try:
+            async for chunk in stream:
+                if usage is not None:
+                    usage.update(self._extract_usage(chunk))
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            aclose = getattr(stream, 'aclose', None)
+            if aclose:
+                await aclose()
+
+    def process_query_stream(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None,
+                             conversation_id: str = None):
+        """
+        사용자 질의를 처리하여 출처 → 답변 조각 → 완료 순서로 이벤트 반환 (SSE 스트리밍용)
+
+        Args:
+            query (str): 사용자 질문
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+            conversation_id (str, optional): 대화 키 (후속 질문 처리용)
+
+        Yields:
+            dict: {"event": "sources", "sources": list}
+                  {"event": "token", "text": str}
+                  {"event": "done", "answer": str, "ttft_ms": int, "total_ms": int}
+                  {"event": "error", "error": str}
+        """
+        logger.info(f"🤖 챗봇 스트리밍 질의 처리 시작: '{query}'")
+        stream_state = _StreamState()
+
+        try:
+            # 1. 답변 캐시 / 회의 컨텍스트 캐시 / 문서 검색 → 출처 먼저 전송
+            plan = self.prepare_answer(query, meeting_id, accessible_meeting_ids, conversation_id)
+            yield from stream_state.start(plan)
+            if stream_state.finished:
+                self._remember_turn(plan, plan["answer"])
+                return
+
+            # 2. 답변 조각 전송
+            usage = {}
+            answer_stream = self.generate_answer_stream(
+                query, plan["context"], usage=usage, cached_content=plan["cached_content"], history=plan["history"]
+            )
+            try:
+                for text in answer_stream:
+                    yield stream_state.token(text)
+            finally:
+                answer_stream.close()
+
+            yield self._finish_stream(stream_state, plan, usage)
+
+        except GeneratorExit:
+            # 클라이언트 연결 종료 → 위 finally에서 Gemini 스트림까지 닫힘
+            stream_state.log_cancelled()
+            raise
+
+        except Exception as e:
+            logger.error(f"❌ 스트리밍 답변 생성 중 오류: {e}", exc_info=True)
+            yield {"event": "error", "error": str(e)}
+
+    async def aprocess_query_stream(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None,
+                                    conversation_id: str = None):
+        """
+        process_query_stream의 비동기 버전 (ASGI 엔드포인트용)
+
+        Args:
+            query (str): 사용자 질문
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+            conversation_id (str, optional): 대화 키 (후속 질문 처리용)
+
+        Yields:
+            dict: process_query_stream()과 같은 이벤트
+        """
+        logger.info(f"🤖 챗봇 스트리밍 질의 처리 시작 (async): '{query}'")
+        stream_state = _StreamState()
+
+        try:
+            plan = await asyncio.to_thread(
+                self.prepare_answer, query, meeting_id, accessible_meeting_ids, conversation_id
+            )
+            for event in stream_state.start(plan):
+                yield event
+            if stream_state.finished:
+                self._remember_turn(plan, plan["answer"])
+                return
+
+            usage = {}
+            answer_stream = self.agenerate_answer_stream(
+                query, plan["context"], usage=usage, cached_content=plan["cached_content"], history=plan["history"]
+            )
+            try:
+                async for text in answer_stream:
+                    yield stream_state.token(text)
+            finally:
+                await answer_stream.aclose()
+
+            yield self._finish_stream(stream_state, plan, usage)
+
+        except (GeneratorExit, asyncio.CancelledError):
+            # 클라이언트 연결 종료 (ASGI 핸들러가 제너레이터를 닫거나 작업을 취소)
+            stream_state.log_cancelled()
+            raise
+
+        except Exception as e:
+            logger.error(f"❌ 스트리밍 답변 생성 중 오류: {e}", exc_info=True)
+            yield {"event": "error", "error": str(e)}
+
+    def _finish_stream(self, stream_state, plan: dict, usage: dict) -> dict:
+        """스트리밍 완료 처리 (지연 시간 로그, 답변 캐시 저장) 후 done 이벤트 반환"""
+        answer = "".join(stream_state.answer_parts)
+        done = stream_state.done(answer, plan)
+        logger.info(
+            f"✅ 스트리밍 답변 완료 (검색: {stream_state.retrieval_ms}ms, TTFT: {done['ttft_ms']}ms, "
+            f"전체: {done['total_ms']}ms, 길이: {len(answer)}자, "
+            f"컨텍스트: 약 {plan['context_tokens']} 토큰, 토큰 사용량: {usage or 'N/A'})"
+        )
+        self._store_cached_answer(plan["cache_ticket"], answer, plan["sources"])
+        self._remember_turn(plan, answer)
+        if plan["search_query"] != plan["query"]:
+            done["search_query"] = plan["search_query"]
+        if usage:
+            done["usage"] = usage
+        return done
+
+    def prepare_batch(self, questions: list, meeting_id: str) -> dict:
+        """
+        한 회의에 대한 여러 질문의 답변 준비 (LLM 호출 없음)
+
+        - 질문 전체를 임베딩 1회로 처리 (이후 답변 캐시 조회는 임베딩 LRU 적중)
+        - 답변 캐시에 있는 질문은 제외
+        - 회의 컨텍스트 캐시를 쓸 수 있으면 검색 없이 캐시 참조
+        - 아니면 회의 문서를 한 번만 조회해 질문별 top-k를 고르고, 합쳐서 하나의 컨텍스트로 패킹
+
+        Args:
+            questions (list[str]): 질문 목록
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict: {
+                "questions": list,
+                "answers": list (질문별 답변, 미정이면 None),
+                "sources": list (질문별 출처),
+                "cached": list (질문별 답변 캐시 적중 여부),
+                "tickets": list (질문별 답변 캐시 저장 정보),
+                "pending": list (LLM으로 답변할 질문 인덱스),
+                "context": str or None (공유 컨텍스트),
+                "cached_content": str or None (회의 컨텍스트 캐시 이름),
+                "labels": dict ("문서 N" / "요약 N" → 출처),
+                "question_results": dict (질문 인덱스 → 질문별 검색 결과, 개별 생성 시 사용),
+                "context_tokens": int
+            }
+        """
+        count = len(questions)
+        plan = {
+            "questions": questions,
+            "answers": [None] * count,
+            "sources": [[] for _ in range(count)],
+            "cached": [False] * count,
+            "tickets": [None] * count,
+            "pending": [],
+            "context": None,
+            "cached_content": None,
+            "labels": {},
+            "question_results": {},
+            "context_tokens": 0
+        }
+
+        # 1. 질문 일괄 임베딩 (임베딩 API 1회)
+        query_embeddings = self.vdb_manager.embed_queries(questions)
+
+        # 2. 답변 캐시 조회 (임베딩 LRU에 이미 있으므로 추가 호출 없음)
+        for index, question in enumerate(questions):
+            cached, plan["tickets"][index] = self._lookup_cached_answer(question, meeting_id)
+            if cached:
+                plan["answers"][index] = cached["answer"]
+                plan["sources"][index] = cached["sources"]
+                plan["cached"][index] = True
+            else:
+                plan["pending"].append(index)
+
+        if not plan["pending"]:
+            return plan
+
+        # 3. 회의 컨텍스트 캐시 사용 가능하면 검색 생략
+        cached_content, meeting_sources = self._get_meeting_context_cache(meeting_id)
+        if cached_content:
+            plan["cached_content"] = cached_content
+            for index in plan["pending"]:
+                plan["sources"][index] = meeting_sources
+            return plan
+
+        # 4. 회의 문서 1회 조회로 질문별 검색
+        found = self.vdb_manager.search_meeting_batch(
+            meeting_id,
+            [query_embeddings[index] for index in plan["pending"]],
+            k=config.CONTEXT_CANDIDATES_PER_COLLECTION
+        )
+        for position, index in enumerate(plan["pending"]):
+            chunks = found["chunks"][position]
+            subtopics = found["subtopic"][position]
+            plan["question_results"][index] = {
+                "chunks": chunks,
+                "subtopics": subtopics,
+                "total_count": len(chunks) + len(subtopics)
+            }
+
+        # 5. 질문별 검색 결과를 순위대로 번갈아 합쳐 공유 컨텍스트 구성 (같은 문서는 한 번만)
+        merged = {"chunks": [], "subtopics": []}
+        seen = set()
+        for rank in range(config.CONTEXT_CANDIDATES_PER_COLLECTION):
+            for index in plan["pending"]:
+                for kind in ("chunks", "subtopics"):
+                    docs = plan["question_results"][index][kind]
+                    if rank < len(docs) and id(docs[rank]) not in seen:
+                        seen.add(id(docs[rank]))
+                        merged[kind].append(docs[rank])
+        merged["total_count"] = len(merged["chunks"]) + len(merged["subtopics"])
+
+        if merged["total_count"] == 0:
+            for index in plan["pending"]:
+                plan["answers"][index] = "죄송합니다. 해당 질문과 관련된 회의록 내용을 찾을 수 없습니다."
+            plan["pending"] = []
+            return plan
+
+        packed = self.pack_context(merged, token_budget=config.BATCH_CONTEXT_TOKEN_BUDGET)
+        plan["context"] = self.format_context(packed)
+        plan["context_tokens"] = packed["context_stats"]["tokens"]
+
+        # format_context()의 문서 번호 → 출처 (모델이 근거로 적은 번호를 출처로 변환)
+        labels = [f"문서 {i}" for i in range(1, len(packed["chunks"]) + 1)]
+        labels += [f"요약 {i}" for i in range(1, len(packed["subtopics"]) + 1)]
+        plan["labels"] = dict(zip(labels, self._build_sources(packed)))
+
+        # 모델이 근거를 적지 않은 경우 질문별 검색 결과 중 컨텍스트에 포함된 문서를 출처로 사용
+        included = {id(doc) for doc in packed["chunks"] + packed["subtopics"]}
+        for index in plan["pending"]:
+            results = plan["question_results"][index]
+            plan["sources"][index] = self._build_sources({
+                "chunks": [doc for doc in results["chunks"] if id(doc) in included],
+                "subtopics": [doc for doc in results["subtopics"] if id(doc) in included]
+            })
+
+        return plan
+
+    def _build_batch_prompt(self, plan: dict) -> str:
+        """
+        일괄 답변 프롬프트 구성 (질문 번호는 pending 순서 기준 1부터)
+
+        Args:
+            plan (dict): prepare_batch()의 반환값
+
+        Returns:
+            str: Gemini 프롬프트 (회의 컨텍스트 캐시 사용 시 질문 목록과 출력 형식만 포함)
+        """
+        question_lines = "\n".join(
+            f"{position}. {plan['questions'][index]}" for position, index in enumerate(plan["pending"], 1)
+        )
+
+        if plan["cached_content"]:
+            return f"""
+아래 [질문 목록]의 각 질문에 회의록 내용만으로 답변하세요.
+아래 형식의 JSON 배열만 출력하고, 추가 설명이나 마크다운 코드 블록은 포함하지 마세요.
+[{{"id": 1, "answer": "답변"}}]
+
+[질문 목록]:
+{question_lines}
+"""
+
+        return f"""
+당신은 회의록 내용을 바탕으로 여러 질문에 한 번에 답변하는 전문 비서입니다.
+
+[지시 사항]
+1. **반드시** 아래 [검색된 회의록 내용] **안에서만** 정보를 찾아서 답변해야 합니다.
+2. [검색된 회의록 내용]에 질문에 대한 정보가 전혀 없다면, 해당 질문의 답변은 "죄송합니다. 해당 내용을 회의록에서 찾을 수 없습니다."로 작성하세요.
+3. 절대로 당신의 사전 지식이나 외부 정보를 사용해서 답변을 추측하거나 생성하지 마세요.
+4. 각 질문에 독립적으로, 명확하고 간결하게 답변하세요.
+5. **중요**: 회의 제목과 날짜는 **반드시** 메타데이터의 '회의:' 및 '일시:' 필드를 참조하세요.
+6. 답변의 근거가 된 문서 번호(예: "문서 3", "요약 1")를 evidence에 적으세요.
+7. 아래 형식의 JSON 배열만 출력하고, 추가 설명이나 마크다운 코드 블록은 포함하지 마세요.
+[{{"id": 1, "answer": "답변", "evidence": ["문서 1", "요약 2"]}}]
+
+---
+
+[검색된 회의록 내용]:
+{plan['context']}
+
+---
+
+[질문 목록]:
+{question_lines}
+"""
+
+    def _batch_request(self, plan: dict) -> dict:
+        """일괄 답변 generate_content 호출 인자"""
+        prompt = self._build_batch_prompt(plan)
+        if plan["cached_content"]:
+            return self.meeting_context_cache.request(plan["cached_content"], prompt)
+        return {"model": self.model_name, "contents": prompt}
+
+    def _apply_batch_answers(self, plan: dict, response) -> list:
+        """
+        일괄 답변 응답(JSON 배열)을 질문별 답변/출처로 반영
+
+        Args:
+            plan (dict): prepare_batch()의 반환값
+            response: Gemini 응답
+
+        Returns:
+            list: 답변이 빠져 개별 생성이 필요한 질문 인덱스
+        """
+        cleaned = (response.text or "").strip().replace("```json", "").replace("```", "").strip()
+        try:
+            items = json.loads(cleaned)
+        except json.JSONDecodeError as e:
+            logger.warning(f"⚠️ 일괄 답변 JSON 파싱 실패, 질문별 개별 생성으로 진행: {e}")
+            return list(plan["pending"])
+
+        answered = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or not str(item.get("answer") or "").strip():
+                continue
+            try:
+                position = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= position <= len(plan["pending"]):
+                answered[plan["pending"][position - 1]] = item
+
+        for index, item in answered.items():
+            answer = str(item["answer"]).strip()
+            cited = []
+            for label in item.get("evidence") or []:
+                source = plan["labels"].get(str(label).strip())
+                if source is not None and source not in cited:
+                    cited.append(source)
+            if cited:
+                plan["sources"][index] = cited
+            plan["answers"][index] = answer
+            self._store_cached_answer(plan["tickets"][index], answer, plan["sources"][index])
+
+        missing = [index for index in plan["pending"] if index not in answered]
+        logger.info(f"✅ 일괄 답변 생성 완료 ({len(answered)}/{len(plan['pending'])}개 질문, 토큰 사용량: {self._extract_usage(response) or 'N/A'})")
+        return missing
+
+    def _question_context(self, plan: dict, index: int):
+        """
+        개별 생성용 질문별 컨텍스트 (일괄 답변에서 빠진 질문)
+
+        Returns:
+            tuple: (context, cached_content)
+        """
+        if plan["cached_content"]:
+            return None, plan["cached_content"]
+        packed = self.pack_context(plan["question_results"][index])
+        return self.format_context(packed), None
+
+    def _apply_single_answer(self, plan: dict, index: int, result: dict):
+        """개별 생성 결과 반영 (실패해도 다른 질문의 답변은 유지)"""
+        plan["answers"][index] = result["answer"]
+        if result["success"]:
+            self._store_cached_answer(plan["tickets"][index], result["answer"], plan["sources"][index])
+
+    def _batch_response(self, plan: dict, usage: dict, fanout: int) -> dict:
+        """
+        일괄 질문 응답 형식
+
+        Returns:
+            dict: {
                 "success": True,
-                "answer": "죄송합니다. 해당 질문과 관련된 회의록 내용을 찾을 수 없습니다.",
-                "sources": []
+                "results": [{"question", "answer", "sources", "cached"(적중 시)}, ...],
+                "context_tokens": int,
+                "fanout": int (일괄 답변에서 빠져 개별 생성한 질문 수),
+                "usage": dict (일괄 호출 토큰 사용량)
+            }
+        """
+        results = []
+        for index, question in enumerate(plan["questions"]):
+            item = {
+                "question": question,
+                "answer": plan["answers"][index] or "죄송합니다. 답변 생성 중 오류가 발생했습니다.",
+                "sources": plan["sources"][index]
             }
+            if plan["cached"][index]:
+                item["cached"] = True
+            results.append(item)
+
+        response = {
+            "success": True,
+            "results": results,
+            "context_tokens": plan["context_tokens"],
+            "fanout": fanout
+        }
+        if plan["cached_content"]:
+            response["context_cached"] = True
+        if usage:
+            response["usage"] = usage
+        return response
 
-        # 2. 컨텍스트 포맷팅
-        context = self.format_context(search_results)
+    def process_batch(self, questions: list, meeting_id: str) -> dict:
+        """
+        한 회의에 대한 여러 질문을 검색 1회 + 구조화된 생성 1회로 답변
+        (일괄 답변에서 빠진 질문만 BATCH_FANOUT_WORKERS개까지 동시에 개별 생성)
 
-        # 3. 답변 생성
-        result = self.generate_answer(query, context)
+        Args:
+            questions (list[str]): 질문 목록
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict: _batch_response() 형식
+        """
+        logger.info(f"🤖 일괄 질문 처리 시작: meeting_id={meeting_id}, 질문 {len(questions)}개")
+
+        plan = self.prepare_batch(questions, meeting_id)
+        usage, missing = {}, []
+
+        if plan["pending"]:
+            try:
+                response = self.gemini_client.models.generate_content(**self._batch_request(plan))
+                usage = self._extract_usage(response)
+                missing = self._apply_batch_answers(plan, response)
+            except Exception as e:
+                logger.error(f"❌ 일괄 답변 생성 중 오류, 질문별 개별 생성으로 진행: {e}")
+                missing = list(plan["pending"])
+
+        if missing:
+            def answer_one(index):
+                context, cached_content = self._question_context(plan, index)
+                return index, self.generate_answer(plan["questions"][index], context, cached_content=cached_content)
+
+            with ThreadPoolExecutor(max_workers=config.BATCH_FANOUT_WORKERS, thread_name_prefix="chat-batch") as executor:
+                for index, result in executor.map(answer_one, missing):
+                    self._apply_single_answer(plan, index, result)
+
+        return self._batch_response(plan, usage, len(missing))
+
+    async def aprocess_batch(self, questions: list, meeting_id: str) -> dict:
+        """
+        process_batch의 비동기 버전 (ASGI 엔드포인트용)
+
+        Args:
+            questions (list[str]): 질문 목록
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict: process_batch()와 같은 형식
+        """
+        logger.info(f"🤖 일괄 질문 처리 시작 (async): meeting_id={meeting_id}, 질문 {len(questions)}개")
+
+        plan = await asyncio.to_thread(self.prepare_batch, questions, meeting_id)
+        usage, missing = {}, []
+
+        if plan["pending"]:
+            try:
+                response = await self.gemini_client.aio.models.generate_content(**self._batch_request(plan))
+                usage = self._extract_usage(response)
+                missing = self._apply_batch_answers(plan, response)
+            except Exception as e:
+                logger.error(f"❌ 일괄 답변 생성 중 오류, 질문별 개별 생성으로 진행: {e}")
+                missing = list(plan["pending"])
+
+        if missing:
+            semaphore = asyncio.Semaphore(config.BATCH_FANOUT_WORKERS)
+
+            async def answer_one(index):
+                async with semaphore:
+                    context, cached_content = self._question_context(plan, index)
+                    return index, await self.agenerate_answer(plan["questions"][index], context, cached_content=cached_content)
+
+            for index, result in await asyncio.gather(*(answer_one(index) for index in missing)):
+                self._apply_single_answer(plan, index, result)
+
+        return self._batch_response(plan, usage, len(missing))
+
+    def _lookup_cached_answer(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None):
+        """
+        시맨틱 답변 캐시 조회
+
+        Args:
+            query (str): 사용자 질문
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+
+        Returns:
+            tuple: (cached, cache_ticket)
+                   - cached: {"answer", "sources"} 또는 None
+                   - cache_ticket: 답변 저장 시 사용할 (범위 키, 범위 버전, 질문 임베딩, 질문 조건), 캐시 비활성화 시 None
+        """
+        if not config.ANSWER_CACHE_ENABLED:
+            return None, None
+
+        try:
+            scope = [meeting_id] if meeting_id else accessible_meeting_ids
+            # 범위 버전은 검색 전에 읽어야 생성 중 회의가 수정된 답변이 저장되지 않음
+            cache_ticket = (
+                self.answer_cache.scope_key(scope),
+                self.vdb_manager.meeting_revisions.scope_version(scope),
+                self.vdb_manager.embed_query(query),
+                extract_query_constraints(query)
+            )
+            hit = self.answer_cache.get(*cache_ticket)
+        except Exception as e:
+            logger.warning(f"⚠️ 답변 캐시 조회 실패: {e}")
+            return None, None
+
+        if hit is None:
+            return None, cache_ticket
+
+        cached, similarity = hit
+        logger.info(f"♻️ 캐시된 답변 재사용 (유사도: {similarity:.3f})")
+        return cached, cache_ticket
+
+    def _store_cached_answer(self, cache_ticket, answer: str, sources: list):
+        """시맨틱 답변 캐시에 답변 저장 (캐시 비활성화 시 무시)"""
+        if cache_ticket is None:
+            return
+        scope_key, version, query_embedding, constraints = cache_ticket
+        self.answer_cache.set(scope_key, version, query_embedding, {"answer": answer, "sources": sources}, constraints)
+
+    def _answer_request(self, query: str, context: str, cached_content: str = None, history: str = None) -> dict:
+        """generate_content / generate_content_stream 호출 인자 (회의 컨텍스트 캐시 사용 시 대화 기록과 질문만 전송)"""
+        if cached_content:
+            return self.meeting_context_cache.request(
+                cached_content, f"{self._history_block(history)}[사용자 질문]:\n{query}\n\n[답변]:"
+            )
+        return {
+            "model": self.model_name,
+            "contents": self._build_answer_prompt(query, context, history)
+        }
+
+    @staticmethod
+    def _format_history(snapshot: dict) -> str:
+        """
+        대화 기록을 프롬프트용 문자열로 변환
+
+        Args:
+            snapshot (dict): ConversationMemory.snapshot()의 반환값
+
+        Returns:
+            str: 이전 대화 요약 + 최근 대화 원문
+        """
+        parts = []
+        if snapshot["summary"]:
+            parts.append(f"(이전 대화 요약)\n{snapshot['summary']}")
+        for question, answer in snapshot["turns"]:
+            parts.append(f"사용자: {question}\n챗봇: {answer}")
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _history_block(history: str = None) -> str:
+        """프롬프트의 이전 대화 섹션 (기록이 없으면 빈 문자열)"""
+        if not history:
+            return ""
+        return (
+            "\n[이전 대화] (질문의 대명사나 생략된 대상을 해석하는 데만 참고하고, 답변 근거는 회의록 내용에서 찾으세요):\n"
+            f"{history}\n\n---\n\n"
+        )
+
+    def _rewrite_query(self, query: str, history: str) -> str:
+        """
+        후속 질문을 대화 기록 없이도 이해되는 독립 질문으로 재작성 (검색/답변 캐시용)
+
+        Args:
+            query (str): 사용자 질문
+            history (str): 이전 대화 기록
+
+        Returns:
+            str: 재작성된 질문 (비활성화/실패 시 원래 질문)
+        """
+        if not config.CONVERSATION_REWRITE_ENABLED:
+            return query
+
+        prompt = f"""
+아래 [이전 대화]를 참고해서 [마지막 질문]을 이전 대화 없이도 이해할 수 있는 검색용 질문 한 문장으로 다시 작성하세요.
+- 대명사나 생략된 대상(그것, 그 사람, 거기, 그때 등)은 이전 대화에 나온 구체적인 이름/주제로 바꾸세요.
+- 이미 독립적인 질문이면 그대로 출력하세요.
+- 다시 작성한 질문만 출력하고, 설명은 포함하지 마세요.
+
+[이전 대화]:
+{history}
+
+[마지막 질문]:
+{query}
+"""
+        try:
+            response = self.gemini_client.models.generate_content(model=self.model_name, contents=prompt)
+            text = (response.text or "").strip()
+            rewritten = text.splitlines()[0].strip() if text else ""
+        except Exception as e:
+            logger.warning(f"⚠️ 후속 질문 재작성 실패, 원래 질문으로 검색: {e}")
+            return query
+
+        if not rewritten or len(rewritten) > max(len(query) * 4, 200):
+            return query
+
+        if rewritten != query:
+            logger.info(f"📝 후속 질문 재작성: '{query}' → '{rewritten}'")
+        return rewritten
+
+    def _remember_turn(self, plan: dict, answer: str):
+        """대화 기록에 이번 질문/답변 저장 (오래된 대화 요약은 백그라운드에서)"""
+        conversation_id = plan.get("conversation_id")
+        if not conversation_id or not answer:
+            return
+        job = self.conversation_memory.record(conversation_id, plan["query"], answer)
+        if job:
+            self.summary_executor.submit(self._summarize_conversation, conversation_id, job)
+
+    def _summarize_conversation(self, conversation_id: str, job):
+        """
+        요약 대기 중인 대화를 기존 요약과 합쳐 CONVERSATION_SUMMARY_MAX_TOKENS 이내로 압축
 
-        if not result["success"]:
-            return result
+        Args:
+            conversation_id (str): 대화 키
+            job (tuple): ConversationMemory.record()가 반환한 (기존 요약, [(question, answer), ...])
+        """
+        while job:
+            summary, turns = job
+            dialogue = "\n\n".join(f"사용자: {question}\n챗봇: {answer}" for question, answer in turns)
+            prompt = f"""
+아래 [기존 요약]과 [추가 대화]를 합쳐서 이후 질문을 이해하는 데 필요한 내용만 남긴 대화 요약을 작성하세요.
+- 언급된 회의, 사람, 결정 사항, 날짜, 숫자 등 구체적인 대상은 유지하세요.
+- {config.CONVERSATION_SUMMARY_MAX_TOKENS}자 이내의 평문으로 작성하고, 요약만 출력하세요.
+
+[기존 요약]:
+{summary or "(없음)"}
+
+[추가 대화]:
+{dialogue}
+"""
+            try:
+                response = self.gemini_client.models.generate_content(model=self.model_name, contents=prompt)
+                new_summary = (response.text or "").strip()
+            except Exception as e:
+                logger.warning(f"⚠️ 대화 요약 실패 (다음 질문 때 다시 시도): {e}")
+                self.conversation_memory.release_summary(conversation_id)
+                return
+
+            # 글자 수 ≥ 추정 토큰 수이므로 글자 수로 자르면 토큰 상한이 보장됨
+            new_summary = new_summary[:config.CONVERSATION_SUMMARY_MAX_TOKENS]
+            logger.info(f"🗜️ 대화 요약 갱신: {len(turns)}개 턴 압축 (요약 약 {estimate_tokens(new_summary)} 토큰)")
+            job = self.conversation_memory.apply_summary(conversation_id, new_summary, len(turns))
+
+    def _create_meeting_context_cache(self):
+        """
+        설정에 따라 회의 컨텍스트 캐시 생성 (off면 None)
+
+        Returns:
+            MeetingContextCache or None
+        """
+        mode = config.MEETING_CONTEXT_CACHE
+        if mode == "gemini":
+            backend = GeminiContextCacheBackend(self.gemini_client, self.model_name, config.MEETING_CONTEXT_CACHE_TTL)
+        elif mode == "local":
+            backend = LocalContextCacheBackend(self.model_name)
+        else:
+            return None
+
+        cache = MeetingContextCache(backend, ttl=config.MEETING_CONTEXT_CACHE_TTL)
+
+        # 회의가 수정/재요약/삭제되면 캐시도 바로 만료 (provider 호출은 백그라운드에서)
+        revisions = getattr(self.vdb_manager, "meeting_revisions", None)
+        if revisions is not None:
+            revisions.add_listener(lambda meeting_id: self.cache_executor.submit(cache.invalidate, meeting_id))
+
+        logger.info(f"✅ 회의 컨텍스트 캐시 사용: {mode}")
+        return cache
+
+    def _get_meeting_context_cache(self, meeting_id: str = None, accessible_meeting_ids: list = None):
+        """
+        단일 회의 질문이면 회의 컨텍스트 캐시 조회/생성
+
+        Args:
+            meeting_id (str, optional): 특정 회의로 제한
+            accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+
+        Returns:
+            tuple: (캐시 이름, 출처 목록) - 캐시를 사용할 수 없으면 (None, None)
+        """
+        if self.meeting_context_cache is None:
+            return None, None
+
+        if not meeting_id and accessible_meeting_ids is not None and len(accessible_meeting_ids) == 1:
+            meeting_id = accessible_meeting_ids[0]
+        if not meeting_id:
+            return None, None
 
-        # 4. 출처 정보 추가
+        try:
+            info = self.vdb_manager.db_manager.get_meeting_info(meeting_id)
+            if not info:
+                return None, None
+
+            name = self.meeting_context_cache.get_or_create(
+                meeting_id,
+                self.vdb_manager.meeting_revisions.get_revision(meeting_id),
+                lambda: self._build_meeting_context(info)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 회의 컨텍스트 캐시 사용 실패, 일반 검색으로 진행: {e}")
+            return None, None
+
+        if not name:
+            return None, None
+
+        return name, [{
+            "type": "meeting",
+            "meeting_id": meeting_id,
+            "title": info.get("title"),
+            "meeting_date": info.get("meeting_date")
+        }]
+
+    def _build_meeting_context(self, info: dict):
+        """
+        회의 컨텍스트 캐시에 올릴 지시 사항과 회의 전체 내용 구성
+
+        Args:
+            info (dict): get_meeting_info()의 반환값
+
+        Returns:
+            tuple or None: (system_instruction, context) - 회의가 너무 짧거나 길면 None
+        """
+        meeting_id = info["meeting_id"]
+        transcript = self.vdb_manager.get_chunks_by_meeting_id(meeting_id)
+        summary = self.vdb_manager.get_summary_by_meeting_id(meeting_id)
+        if not transcript and not summary:
+            return None
+
+        context_parts = [
+            f"[회의록 내용]\n회의: {info.get('title', 'N/A')}\n일시: {info.get('meeting_date', 'N/A')}"
+        ]
+        if transcript:
+            context_parts.append(f"=== 회의 대화 내용 ===\n{transcript}")
+        if summary:
+            context_parts.append(f"=== 회의 주제별 요약 ===\n{summary}")
+        context = "\n\n".join(context_parts)
+
+        tokens = estimate_tokens(context)
+        if not config.MEETING_CONTEXT_CACHE_MIN_TOKENS <= tokens <= config.MEETING_CONTEXT_CACHE_MAX_TOKENS:
+            logger.info(f"ℹ️ 회의 컨텍스트 캐시 미사용 (약 {tokens} 토큰, meeting_id: {meeting_id})")
+            return None
+
+        system_instruction = (
+            "당신은 회의록 내용을 바탕으로 사용자의 질문에 답변하는 전문 비서 챗봇입니다.\n\n"
+            "[지시 사항]\n"
+            "1. **반드시** 주어진 [회의록 내용] **안에서만** 정보를 찾아서 답변해야 합니다.\n"
+            "2. [회의록 내용]에 질문에 대한 정보가 전혀 없다면, \"죄송합니다. 해당 내용을 회의록에서 찾을 수 없습니다.\"라고 명확하게 답변해야 합니다.\n"
+            "3. 절대로 당신의 사전 지식이나 외부 정보를 사용해서 답변을 추측하거나 생성하지 마세요.\n"
+            "4. 답변은 명확하고 간결하게 요약하여 제공하세요.\n"
+            "5. **중요**: 회의 제목과 날짜는 **반드시** '회의:' 및 '일시:' 필드를 참조하세요. 내용(본문)에 나오는 제목이나 날짜는 구버전일 수 있으므로 무시하세요."
+        )
+        return system_instruction, context
+
+    @staticmethod
+    def _extract_usage(response) -> dict:
+        """Gemini 응답의 토큰 사용량 (사용량 정보가 없으면 빈 dict)"""
+        metadata = getattr(response, 'usage_metadata', None)
+        if metadata is None:
+            return {}
+        usage = {
+            "prompt_tokens": getattr(metadata, 'prompt_token_count', None),
+            "output_tokens": getattr(metadata, 'candidates_token_count', None)
+        }
+        return {key: value for key, value in usage.items() if value is not None}
+
+    def _build_sources(self, search_results: dict) -> list:
+        """
+        검색 결과를 응답용 출처 목록으로 변환
+
+        Args:
+            search_results (dict): search_documents()의 반환값
+
+        Returns:
+            list: 출처 정보 목록 (chunk / subtopic)
+        """
         sources = []
 
         # Chunks 출처
@@ -397,8 +1458,59 @@ class ChatManager:
                 "main_topic": meta.get("main_topic")
             })
 
-        return {
-            "success": True,
-            "answer": result["answer"],
-            "sources": sources
+        return sources
+
+
+class _StreamState:
+    """스트리밍 답변 진행 상태 (출처/조각/완료 이벤트 생성과 TTFT 측정)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_token_at = None
+        self.retrieval_ms = 0
+        self.answer_parts = []
+        self.finished = False
+
+    def _elapsed_ms(self, until=None):
+        return int(((until or time.perf_counter()) - self.started_at) * 1000)
+
+    def start(self, plan):
+        """출처 이벤트 (LLM 호출 없이 답할 수 있으면 답변/완료 이벤트까지)"""
+        self.retrieval_ms = self._elapsed_ms()
+        yield {"event": "sources", "sources": plan["sources"]}
+
+        if plan["answer"] is not None:
+            if plan["cached"]:
+                logger.info(f"✅ 캐시된 답변 전송 ({self.retrieval_ms}ms)")
+            yield {"event": "token", "text": plan["answer"]}
+            self.finished = True
+            done = {"event": "done", "answer": plan["answer"], "ttft_ms": self.retrieval_ms, "total_ms": self.retrieval_ms}
+            if plan["cached"]:
+                done["cached"] = True
+            yield done
+
+    def token(self, text):
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.answer_parts.append(text)
+        return {"event": "token", "text": text}
+
+    def done(self, answer, plan):
+        self.finished = True
+        done = {
+            "event": "done",
+            "answer": answer,
+            "ttft_ms": self._elapsed_ms(self.first_token_at),
+            "total_ms": self._elapsed_ms(),
+            "context_tokens": plan["context_tokens"]
         }
+        if plan["cached_content"]:
+            done["context_cached"] = True
+        return done
+
+    def log_cancelled(self):
+        if not self.finished:
+            logger.info(
+                f"⚠️ 클라이언트 연결 종료로 답변 생성 중단 "
+                f"({self._elapsed_ms()}ms, {len(self.answer_parts)}개 조각 전송됨)"
+            )
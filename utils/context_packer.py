@@ -0,0 +1,108 @@
+"""
+챗봇 컨텍스트 패킹 모듈
+- 문서별 토큰 수 추정 (한글/한자는 글자당 1토큰, 그 외는 4글자당 1토큰으로 보수적으로 계산)
+- 문자 shingle 겹침으로 거의 같은 구절(겹치는 청크, 청크와 같은 내용의 요약 등) 제거
+- 검색 순위가 높은 문서부터 토큰 예산을 채움
+"""
+import math
+import re
+
+_CJK_PATTERN = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u4e00-\u9fff]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def estimate_tokens(text):
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text (str): 텍스트
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    others = len(_WHITESPACE_PATTERN.sub('', text)) - cjk
+    return cjk + math.ceil(others / 4)
+
+
+def shingles(text, size=5):
+    """
+    공백을 제거한 문자 n-gram 집합
+
+    Args:
+        text (str): 텍스트
+        size (int): n-gram 길이
+
+    Returns:
+        set: shingle 집합
+    """
+    normalized = _WHITESPACE_PATTERN.sub('', text).lower()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def overlap_ratio(first, second):
+    """
+    두 shingle 집합의 겹침 비율 (작은 쪽 기준 - 한 구절이 다른 구절에 포함된 경우도 중복으로 판단)
+
+    Args:
+        first (set): shingle 집합
+        second (set): shingle 집합
+
+    Returns:
+        float: 0.0 ~ 1.0
+    """
+    if not first or not second:
+        return 0.0
+    return len(first & second) / min(len(first), len(second))
+
+
+def pack_documents(candidates, token_budget, dedup_threshold=0.6, shingle_size=5):
+    """
+    검색 순위 순서의 후보 문서로 토큰 예산을 채웁니다.
+
+    Args:
+        candidates (list[dict]): 순위 순서의 후보 [{'text': 중복 비교용 본문, 'rendered': 컨텍스트에 들어갈 문자열, ...}, ...]
+        token_budget (int): 컨텍스트 토큰 예산
+        dedup_threshold (float): 이미 선택된 문서와 겹침 비율이 이 값 이상이면 중복으로 제외
+        shingle_size (int): shingle 길이
+
+    Returns:
+        tuple: (selected, stats)
+               - selected: 선택된 후보 목록 (순위 순서, 각 항목에 'tokens' 추가)
+               - stats: {'tokens', 'budget', 'candidates', 'selected', 'duplicates', 'over_budget'}
+    """
+    selected = []
+    selected_shingles = []
+    used_tokens = 0
+    duplicates = 0
+    over_budget = 0
+
+    for candidate in candidates:
+        candidate_shingles = shingles(candidate['text'], shingle_size)
+        if any(overlap_ratio(candidate_shingles, other) >= dedup_threshold for other in selected_shingles):
+            duplicates += 1
+            continue
+
+        tokens = estimate_tokens(candidate['rendered'])
+        if selected and used_tokens + tokens > token_budget:
+            # 첫 문서는 예산을 넘어도 포함, 이후 작은 문서는 남은 예산에 들어갈 수 있으므로 계속 확인
+            over_budget += 1
+            continue
+
+        selected.append(dict(candidate, tokens=tokens))
+        selected_shingles.append(candidate_shingles)
+        used_tokens += tokens
+
+    return selected, {
+        'tokens': used_tokens,
+        'budget': token_budget,
+        'candidates': len(candidates),
+        'selected': len(selected),
+        'duplicates': duplicates,
+        'over_budget': over_budget
+    }
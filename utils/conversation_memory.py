@@ -0,0 +1,152 @@
+"""
+챗봇 대화 메모리 모듈
+- 대화(브라우저 세션)별로 최근 질문/답변을 토큰 예산 안에서 원문 그대로 유지
+- 예산을 넘긴 오래된 대화는 요약 대기열로 옮기고, 호출자가 LLM으로 기존 요약과 합쳐 짧은 요약으로 압축
+- 프롬프트에 들어가는 대화 기록은 (요약 상한 + 최근 대화 예산)으로 고정되어 대화가 길어져도 늘어나지 않음
+"""
+import threading
+import time
+import logging
+from collections import OrderedDict
+
+from utils.context_packer import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationMemory:
+    """대화별 롤링 기록 (스레드 안전)"""
+
+    def __init__(self, maxsize=1000, ttl=3600, recent_token_budget=1000, max_recent_turns=6):
+        """
+        Args:
+            maxsize (int): 최대 대화 수 (초과 시 가장 오래 사용하지 않은 대화부터 제거)
+            ttl (float): 마지막 질문 이후 대화 유지 시간 (초)
+            recent_token_budget (int): 원문으로 유지할 최근 대화의 토큰 예산
+            max_recent_turns (int): 원문으로 유지할 최대 대화 수
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.recent_token_budget = recent_token_budget
+        self.max_recent_turns = max_recent_turns
+        self._conversations = OrderedDict()    # key -> {'summary', 'turns', 'pending', 'summarizing', 'expires_at'}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        conversation = self._conversations.get(key)
+        if conversation is not None and conversation['expires_at'] <= time.monotonic():
+            del self._conversations[key]
+            return None
+        return conversation
+
+    def snapshot(self, key):
+        """
+        프롬프트용 대화 기록 조회
+
+        Args:
+            key (str): 대화 키
+
+        Returns:
+            dict or None: {'summary': str, 'turns': [(question, answer), ...]} (기록이 없으면 None)
+                          요약 대기 중인 대화도 요약에 반영될 때까지 turns에 포함
+        """
+        with self._lock:
+            conversation = self._get(key)
+            if conversation is None:
+                return None
+            turns = conversation['pending'] + conversation['turns']
+            # 요약이 늦어지거나 실패해도 프롬프트가 커지지 않도록 대기 턴 포함 최근 예산의 2배까지만 사용
+            while len(turns) > 1 and sum(turn['tokens'] for turn in turns) > self.recent_token_budget * 2:
+                turns.pop(0)
+            if not turns and not conversation['summary']:
+                return None
+            return {
+                'summary': conversation['summary'],
+                'turns': [(turn['question'], turn['answer']) for turn in turns]
+            }
+
+    def record(self, key, question, answer):
+        """
+        대화 한 턴 저장
+
+        Args:
+            key (str): 대화 키
+            question (str): 사용자 질문
+            answer (str): 챗봇 답변
+
+        Returns:
+            tuple or None: 요약이 필요하면 (기존 요약, 요약할 [(question, answer), ...]), 아니면 None
+                           반환값이 있으면 호출자가 요약 후 apply_summary()를 호출해야 함
+        """
+        with self._lock:
+            conversation = self._get(key)
+            if conversation is None:
+                conversation = {'summary': '', 'turns': [], 'pending': [], 'summarizing': False}
+                self._conversations[key] = conversation
+            conversation['expires_at'] = time.monotonic() + self.ttl
+            self._conversations.move_to_end(key)
+            while len(self._conversations) > self.maxsize:
+                self._conversations.popitem(last=False)
+
+            turns = conversation['turns']
+            turns.append({
+                'question': question,
+                'answer': answer,
+                'tokens': estimate_tokens(question) + estimate_tokens(answer)
+            })
+
+            # 최근 대화 예산/턴 수를 넘으면 오래된 턴부터 요약 대기열로 이동 (마지막 턴은 항상 원문 유지)
+            while len(turns) > 1 and (
+                len(turns) > self.max_recent_turns
+                or sum(turn['tokens'] for turn in turns) > self.recent_token_budget
+            ):
+                conversation['pending'].append(turns.pop(0))
+
+            return self._claim_summary(conversation)
+
+    def _claim_summary(self, conversation):
+        if conversation['summarizing'] or not conversation['pending']:
+            return None
+        conversation['summarizing'] = True
+        return conversation['summary'], [(turn['question'], turn['answer']) for turn in conversation['pending']]
+
+    def apply_summary(self, key, summary, count):
+        """
+        요약 결과 반영
+
+        Args:
+            key (str): 대화 키
+            summary (str): 기존 요약과 대기 중이던 대화를 합친 새 요약
+            count (int): 요약에 포함된 대기 턴 수
+
+        Returns:
+            tuple or None: 요약하는 동안 새로 쌓인 대기 턴이 있으면 다음 요약 작업 (record()와 같은 형식)
+        """
+        with self._lock:
+            conversation = self._get(key)
+            if conversation is None:
+                return None
+            conversation['summary'] = summary
+            del conversation['pending'][:count]
+            conversation['summarizing'] = False
+            return self._claim_summary(conversation)
+
+    def release_summary(self, key):
+        """요약 실패 시 대기 턴을 유지한 채 다음 기록 때 다시 시도하도록 해제"""
+        with self._lock:
+            conversation = self._get(key)
+            if conversation is not None:
+                conversation['summarizing'] = False
+
+    def clear(self, key=None):
+        """
+        대화 기록 삭제
+
+        Args:
+            key (str, optional): 대화 키 (None이면 전체 삭제)
+        """
+        with self._lock:
+            if key is None:
+                self._conversations.clear()
+            else:
+                self._conversations.pop(key, None)
@@ -2,16 +2,46 @@
 import sqlite3
 import uuid
 import datetime
+import html
+import json
 import logging
+import re
+import threading
+import time
+
+from utils.analysis import compute_meeting_stats
 
 logger = logging.getLogger(__name__)
 
 
+def segment_bigrams(text):
+    """
+    전사 세그먼트의 2글자 부분 문자열 집합 (공백 포함 구간 제외, 소문자 변환)
+
+    Args:
+        text (str): 세그먼트 텍스트
+
+    Returns:
+        set: 2글자 문자열 집합
+    """
+    text = (text or "").lower()
+    return {
+        text[i:i + 2] for i in range(len(text) - 1)
+        if not text[i].isspace() and not text[i + 1].isspace()
+    }
+
+
 class DatabaseManager:
     """SQLite 데이터베이스 관리 (Singleton 패턴)"""
     _instance = None
     _initialized = False
 
+    # 2글자 검색어 bigram 적중 수가 이보다 적으면 인덱스로 후보를 먼저 모음
+    BIGRAM_SELECTIVE_ROWS = 5000
+
+    # 메모리 회의 제목 인덱스 유효 시간 (초, 다른 프로세스의 제목 변경 반영용)
+    TITLE_INDEX_TTL = 60
+
     def __new__(cls, db_path=None):
         if cls._instance is None:
             cls._instance = super(DatabaseManager, cls).__new__(cls)
@@ -26,6 +56,10 @@ class DatabaseManager:
             raise ValueError("DatabaseManager 최초 생성 시 db_path가 필요합니다.")
 
         self.db_path = db_path
+        self.fts_tokenizer = None
+        self.bigram_index_enabled = False
+        self._title_index = None            # (제목 앞 2글자 → [(소문자 제목, 행)], 로드 시각)
+        self._title_index_lock = threading.Lock()
         self._initialized = True
         logger.info(f"✅ DatabaseManager 초기화: {db_path}")
 
@@ -121,12 +155,85 @@ class DatabaseManager:
                 )
             """)
 
-            # 6. 인덱스 생성 (성능 최적화)
+            # 6. meetings 테이블 (회의 단위 목록, 노트 목록 페이지네이션용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meetings (
+                    meeting_id TEXT PRIMARY KEY,
+                    title TEXT,
+                    meeting_date TEXT,
+                    audio_file TEXT,
+                    owner_id INTEGER,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 기존 meeting_dialogues 데이터로 meetings 테이블 백필 (누락된 회의만)
+            cursor.execute("""
+                INSERT OR IGNORE INTO meetings (meeting_id, title, meeting_date, audio_file, owner_id)
+                SELECT meeting_id, MAX(title), MAX(meeting_date), MIN(audio_file), MIN(owner_id)
+                FROM meeting_dialogues
+                WHERE meeting_id NOT IN (SELECT meeting_id FROM meetings)
+                GROUP BY meeting_id
+            """)
+            if cursor.rowcount > 0:
+                logger.info(f"✅ meetings 테이블 백필: {cursor.rowcount}개 회의")
+
+            # 7. meeting_stats 테이블 (회의별 통계, 업로드 시 계산)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meeting_stats (
+                    meeting_id TEXT PRIMARY KEY,
+                    segment_count INTEGER NOT NULL,
+                    duration_seconds REAL,
+                    avg_confidence REAL,
+                    total_chars INTEGER NOT NULL,
+                    speaker_stats TEXT NOT NULL,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 세그먼트가 변경되면 해당 회의 통계를 무효화 (다음 조회 시 재계산)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS meeting_stats_invalidate_ai AFTER INSERT ON meeting_dialogues BEGIN
+                    DELETE FROM meeting_stats WHERE meeting_id = new.meeting_id;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS meeting_stats_invalidate_ad AFTER DELETE ON meeting_dialogues BEGIN
+                    DELETE FROM meeting_stats WHERE meeting_id = old.meeting_id;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS meeting_stats_invalidate_au
+                AFTER UPDATE OF meeting_id, speaker_label, start_time, segment, confidence ON meeting_dialogues BEGIN
+                    DELETE FROM meeting_stats WHERE meeting_id IN (old.meeting_id, new.meeting_id);
+                END
+            """)
+
+            # 8. user_settings 테이블 (사용자별 설정, NULL이면 config 기본값 사용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_settings (
+                    user_id INTEGER PRIMARY KEY,
+                    minutes_precompute INTEGER,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                )
+            """)
+
+            # 9. 인덱스 생성 (성능 최적화)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_meeting_id ON meeting_dialogues(meeting_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_owner_id ON meeting_dialogues(owner_id)")
+            # 시간 구간 조회 / 타임스탬프 위치 조회용 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_dialogues_meeting_time ON meeting_dialogues(meeting_id, start_time, segment_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_shares_meeting ON meeting_shares(meeting_id)")
+            # 키셋 페이지네이션 (meeting_date, meeting_id) 정렬용 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(meeting_date, meeting_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_owner_date ON meetings(owner_id, meeting_date, meeting_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_shares_user ON meeting_shares(shared_with_user_id, meeting_id)")
 
-            # 7. Admin 사용자 자동 생성
+            # 10. 전사 전문 검색(FTS5) 인덱스
+            self._initialize_fts(cursor)
+
+            # 11. Admin 사용자 자동 생성
             from config import config
             admin_emails = config.ADMIN_EMAILS
 
@@ -154,6 +261,126 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def _initialize_fts(self, cursor):
+        """
+        meeting_dialogues.segment에 대한 FTS5 외부 콘텐츠(external content) 인덱스를 생성합니다.
+        - 한국어 부분 일치를 위해 trigram 토크나이저 사용 (SQLite 3.34+)
+        - trigram을 지원하지 않는 SQLite에서는 unicode61로 대체
+        - INSERT/UPDATE/DELETE 트리거로 meeting_dialogues와 자동 동기화
+        - trigram은 3글자 미만 검색어를 MATCH할 수 없으므로 2글자 검색어용 bigram 보조 인덱스 생성
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='meeting_dialogues_fts'")
+        fts_exists = cursor.fetchone() is not None
+
+        if not fts_exists:
+            for tokenizer in ("trigram", "unicode61"):
+                try:
+                    cursor.execute(f"""
+                        CREATE VIRTUAL TABLE meeting_dialogues_fts USING fts5(
+                            segment,
+                            content='meeting_dialogues',
+                            content_rowid='segment_id',
+                            tokenize='{tokenizer}'
+                        )
+                    """)
+                    break
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"⚠️ FTS5 '{tokenizer}' 토크나이저 사용 불가: {e}")
+            else:
+                logger.warning("⚠️ FTS5를 사용할 수 없어 전사 전문 검색이 비활성화됩니다.")
+                self.fts_tokenizer = None
+                return
+
+            # 기존 데이터로 인덱스 구축
+            cursor.execute("INSERT INTO meeting_dialogues_fts(meeting_dialogues_fts) VALUES('rebuild')")
+            logger.info(f"✅ 전사 전문 검색 인덱스 생성 완료 (tokenizer={tokenizer})")
+
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='meeting_dialogues_fts'")
+        self.fts_tokenizer = "trigram" if "trigram" in cursor.fetchone()['sql'] else "unicode61"
+
+        # meeting_dialogues 변경 시 FTS 인덱스 자동 동기화
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS meeting_dialogues_fts_ai AFTER INSERT ON meeting_dialogues BEGIN
+                INSERT INTO meeting_dialogues_fts(rowid, segment) VALUES (new.segment_id, new.segment);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS meeting_dialogues_fts_ad AFTER DELETE ON meeting_dialogues BEGIN
+                INSERT INTO meeting_dialogues_fts(meeting_dialogues_fts, rowid, segment) VALUES ('delete', old.segment_id, old.segment);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS meeting_dialogues_fts_au AFTER UPDATE OF segment ON meeting_dialogues BEGIN
+                INSERT INTO meeting_dialogues_fts(meeting_dialogues_fts, rowid, segment) VALUES ('delete', old.segment_id, old.segment);
+                INSERT INTO meeting_dialogues_fts(rowid, segment) VALUES (new.segment_id, new.segment);
+            END
+        """)
+
+        if self.fts_tokenizer == "trigram":
+            self._initialize_bigram_index(cursor)
+
+    def _initialize_bigram_index(self, cursor):
+        """
+        2글자 검색어용 bigram 보조 인덱스 (gram -> segment_id)
+        - 세그먼트 저장 시 _index_segment_bigrams()로 추가, 삭제/수정 시 트리거로 제거
+        - 인덱스에 없는 세그먼트(기존 데이터, 텍스트 수정)는 시작 시 채움
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS meeting_dialogues_bigrams (
+                gram TEXT NOT NULL,
+                segment_id INTEGER NOT NULL,
+                PRIMARY KEY (gram, segment_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bigrams_segment ON meeting_dialogues_bigrams(segment_id)")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS meeting_dialogues_bigrams_ad AFTER DELETE ON meeting_dialogues BEGIN
+                DELETE FROM meeting_dialogues_bigrams WHERE segment_id = old.segment_id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS meeting_dialogues_bigrams_au AFTER UPDATE OF segment ON meeting_dialogues BEGIN
+                DELETE FROM meeting_dialogues_bigrams WHERE segment_id = old.segment_id;
+            END
+        """)
+
+        cursor.execute("""
+            SELECT segment_id, segment FROM meeting_dialogues
+            WHERE segment_id NOT IN (SELECT segment_id FROM meeting_dialogues_bigrams)
+        """)
+        missing = cursor.fetchall()
+        self.bigram_index_enabled = True
+        if missing:
+            self._index_segment_bigrams(cursor, [(row['segment_id'], row['segment']) for row in missing])
+            logger.info(f"✅ 전사 bigram 인덱스 백필: {len(missing)}개 세그먼트")
+
+    def _index_segment_bigrams(self, cursor, segments):
+        """
+        세그먼트 bigram 인덱스 추가
+
+        Args:
+            cursor: SQLite 커서 (호출자 트랜잭션 사용)
+            segments (list[tuple]): [(segment_id, segment_text), ...]
+        """
+        if not self.bigram_index_enabled:
+            return
+        cursor.executemany(
+            "INSERT OR IGNORE INTO meeting_dialogues_bigrams (gram, segment_id) VALUES (?, ?)",
+            ((gram, segment_id) for segment_id, text in segments for gram in segment_bigrams(text))
+        )
+
+    def _is_selective_bigram(self, gram):
+        """bigram 적중 세그먼트 수가 BIGRAM_SELECTIVE_ROWS 미만인지 확인 (인덱스 범위만 읽음)"""
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM meeting_dialogues_bigrams WHERE gram = ? LIMIT ?)",
+                (gram, self.BIGRAM_SELECTIVE_ROWS)
+            )
+            return cursor.fetchone()[0] < self.BIGRAM_SELECTIVE_ROWS
+        finally:
+            conn.close()
+
     def save_stt_to_db(self, segments, audio_filename, title, meeting_date=None, owner_id=None):
         """
         음성 인식 결과를 데이터베이스에 저장합니다.
@@ -177,6 +404,7 @@ class DatabaseManager:
 
         conn = self._get_connection()
         cursor = conn.cursor()
+        inserted = []
         for segment in segments:
             cursor.execute("""
                 INSERT INTO meeting_dialogues
@@ -186,8 +414,16 @@ class DatabaseManager:
                 meeting_id, meeting_date, str(segment['speaker']), segment['start_time'],
                 segment['text'], segment['confidence'], audio_filename, title, owner_id
             ))
+            inserted.append((cursor.lastrowid, segment['text']))
+        self._index_segment_bigrams(cursor, inserted)
+        cursor.execute("""
+            INSERT OR REPLACE INTO meetings (meeting_id, title, meeting_date, audio_file, owner_id)
+            VALUES (?, ?, ?, ?, ?)
+        """, (meeting_id, title, meeting_date, audio_filename, owner_id))
+        self._refresh_meeting_stats(cursor, meeting_id)
         conn.commit()
         conn.close()
+        self._title_index = None
         logger.info(f"✅ DB 저장 완료: meeting_id={meeting_id}, owner_id={owner_id}, meeting_date={meeting_date}")
         return meeting_id
 
@@ -213,6 +449,20 @@ class DatabaseManager:
         conn.close()
         return meetings
 
+    def get_all_meeting_ids(self):
+        """
+        전체 회의 ID 목록을 조회합니다 (meetings 테이블).
+
+        Returns:
+            list: meeting_id 목록
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT meeting_id FROM meetings ORDER BY meeting_date, meeting_id")
+        meeting_ids = [row['meeting_id'] for row in cursor.fetchall()]
+        conn.close()
+        return meeting_ids
+
     def get_segments_by_meeting_id(self, meeting_id):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -221,6 +471,433 @@ class DatabaseManager:
         conn.close()
         return [dict(row) for row in rows]
 
+    def _refresh_meeting_stats(self, cursor, meeting_id):
+        """
+        meeting_dialogues로부터 회의 통계를 계산하여 meeting_stats에 저장합니다.
+        (호출자가 commit 책임)
+
+        Returns:
+            dict or None: 계산된 통계, 세그먼트가 없으면 None
+        """
+        cursor.execute("""
+            SELECT speaker_label, start_time, segment, confidence
+            FROM meeting_dialogues
+            WHERE meeting_id = ?
+        """, (meeting_id,))
+        segments = [dict(row) for row in cursor.fetchall()]
+
+        if not segments:
+            cursor.execute("DELETE FROM meeting_stats WHERE meeting_id = ?", (meeting_id,))
+            return None
+
+        stats = compute_meeting_stats(segments)
+        cursor.execute("""
+            INSERT OR REPLACE INTO meeting_stats
+            (meeting_id, segment_count, duration_seconds, avg_confidence, total_chars, speaker_stats, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            meeting_id, stats['segment_count'], stats['duration_seconds'], stats['avg_confidence'],
+            stats['total_chars'], json.dumps(stats['speakers'], ensure_ascii=False),
+            datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ))
+        return stats
+
+    def refresh_meeting_stats(self, meeting_id):
+        """
+        회의 통계를 다시 계산하여 저장합니다. (세그먼트 수정 후 호출)
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict or None: 계산된 통계
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            stats = self._refresh_meeting_stats(cursor, meeting_id)
+            conn.commit()
+            return stats
+        finally:
+            conn.close()
+
+    def get_meeting_stats(self, meeting_id):
+        """
+        저장된 회의 통계를 조회합니다. 통계가 없거나 무효화된 경우 다시 계산합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict or None: {'segment_count', 'duration_seconds', 'avg_confidence', 'total_chars',
+                           'speakers': {speaker: {'chars', 'talk_time', 'turns'}}}
+                          회의가 없으면 None
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT segment_count, duration_seconds, avg_confidence, total_chars, speaker_stats
+                FROM meeting_stats
+                WHERE meeting_id = ?
+            """, (meeting_id,))
+            row = cursor.fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return self.refresh_meeting_stats(meeting_id)
+
+        stats = dict(row)
+        stats['speakers'] = json.loads(stats.pop('speaker_stats'))
+        return stats
+
+    def backfill_meeting_stats(self, force=False):
+        """
+        통계가 없는 모든 회의의 meeting_stats를 계산합니다.
+
+        Args:
+            force (bool): True면 기존 통계도 모두 다시 계산
+
+        Returns:
+            int: 계산한 회의 수
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            if force:
+                cursor.execute("SELECT meeting_id FROM meetings")
+            else:
+                cursor.execute("""
+                    SELECT meeting_id FROM meetings
+                    WHERE meeting_id NOT IN (SELECT meeting_id FROM meeting_stats)
+                """)
+            meeting_ids = [row['meeting_id'] for row in cursor.fetchall()]
+
+            for meeting_id in meeting_ids:
+                self._refresh_meeting_stats(cursor, meeting_id)
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info(f"✅ meeting_stats 백필 완료: {len(meeting_ids)}개 회의")
+        return len(meeting_ids)
+
+    def search_transcripts(self, query, user_id=None, is_admin=False, meeting_id=None, limit=20):
+        """
+        FTS5 인덱스로 전사 세그먼트를 키워드 검색합니다.
+        - 모든 검색어를 포함하는 세그먼트만 반환 (AND 검색)
+        - trigram 토크나이저는 3글자 미만 검색어를 MATCH할 수 없으므로
+          2글자 검색어는 bigram 보조 인덱스, 1글자 검색어는 LIKE로 검색
+        - 사용자 접근 권한(소유 + 공유, admin은 전체)으로 필터링
+
+        Args:
+            query (str): 검색어 (공백으로 구분된 여러 단어 가능)
+            user_id (int, optional): 요청 사용자 ID (is_admin이 False이면 필수)
+            is_admin (bool): admin 여부 (True면 권한 필터링 생략)
+            meeting_id (str, optional): 특정 회의로 제한
+            limit (int): 최대 결과 수
+
+        Returns:
+            list: [{'segment_id', 'meeting_id', 'title', 'meeting_date', 'speaker_label',
+                    'start_time', 'snippet'}, ...] (snippet의 일치 구간은 <mark>로 강조, HTML 이스케이프됨)
+        """
+        terms = [term for term in query.split() if term]
+        if not terms or not self.fts_tokenizer:
+            return []
+
+        if self.fts_tokenizer == "trigram":
+            match_terms = [term for term in terms if len(term) >= 3]
+            short_terms = [term for term in terms if len(term) < 3]
+        else:
+            match_terms, short_terms = terms, []
+
+        joins = []
+        conditions = []
+        params = []
+
+        if match_terms:
+            # FTS5 쿼리 문법 문자가 해석되지 않도록 각 검색어를 큰따옴표로 감쌈
+            joins.append("JOIN meeting_dialogues_fts ON meeting_dialogues_fts.rowid = d.segment_id")
+            conditions.append("meeting_dialogues_fts MATCH ?")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in match_terms))
+            snippet_column = "snippet(meeting_dialogues_fts, 0, char(2), char(3), '…', 32)"
+            order_by = "bm25(meeting_dialogues_fts)"
+        else:
+            snippet_column = "d.segment"
+            order_by = "m.meeting_date DESC, d.start_time ASC"
+
+        # 후보를 좁히는 조건이 없으면 회의 일시 순서대로 훑다가 LIMIT에서 멈춤 (흔한 2글자 검색어)
+        scan_by_date = not match_terms
+        for term in short_terms:
+            if len(term) == 2 and self.bigram_index_enabled:
+                gram = term.lower()
+                # 드문 bigram은 인덱스로 후보를 먼저 모으고, 흔한 bigram은 세그먼트마다 인덱스로 확인
+                if self._is_selective_bigram(gram):
+                    conditions.append("d.segment_id IN (SELECT segment_id FROM meeting_dialogues_bigrams WHERE gram = ?)")
+                    scan_by_date = False
+                else:
+                    conditions.append("""EXISTS (
+                        SELECT 1 FROM meeting_dialogues_bigrams b WHERE b.gram = ? AND b.segment_id = d.segment_id
+                    )""")
+                params.append(gram)
+            else:
+                conditions.append("d.segment LIKE ? ESCAPE '\\'")
+                escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                params.append(f"%{escaped}%")
+
+        if meeting_id:
+            conditions.append("d.meeting_id = ?")
+            params.append(meeting_id)
+
+        if not is_admin:
+            conditions.append("""(m.owner_id = ? OR EXISTS (
+                SELECT 1 FROM meeting_shares s
+                WHERE s.meeting_id = d.meeting_id AND s.shared_with_user_id = ?
+            ))""")
+            params.extend([user_id, user_id])
+
+        if scan_by_date:
+            # CROSS JOIN으로 회의 일시 인덱스 → 회의별 시간순 인덱스 순서를 고정해 정렬 없이 LIMIT 적용
+            from_clause = "FROM meetings m CROSS JOIN meeting_dialogues d ON d.meeting_id = m.meeting_id"
+        else:
+            from_clause = "FROM meeting_dialogues d JOIN meetings m ON m.meeting_id = d.meeting_id"
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT d.segment_id, d.meeting_id, m.title, m.meeting_date, d.speaker_label, d.start_time,
+                       {snippet_column} AS snippet
+                {from_clause}
+                {' '.join(joins)}
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {order_by}
+                LIMIT ?
+            """, (*params, limit))
+            rows = [dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+        # snippet()은 MATCH 검색어만 강조하므로 짧은 검색어는 직접 강조 (대소문자 무시)
+        highlight = re.compile("|".join(re.escape(term) for term in short_terms), re.IGNORECASE) if short_terms else None
+        for row in rows:
+            snippet = row['snippet'] or ""
+            if highlight:
+                snippet = highlight.sub(lambda match: f"\x02{match.group()}\x03", snippet)
+            row['snippet'] = html.escape(snippet).replace("\x02", "<mark>").replace("\x03", "</mark>")
+
+        return rows
+
+    def get_meeting_info(self, meeting_id):
+        """
+        회의 단위 정보(제목, 일시, 오디오 파일, 소유자)를 조회합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict or None: {'meeting_id', 'title', 'meeting_date', 'audio_file', 'owner_id'}
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT meeting_id, title, meeting_date, audio_file, owner_id
+            FROM meetings
+            WHERE meeting_id = ?
+        """, (meeting_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def find_meeting_ids_by_date(self, year, month, day):
+        """
+        회의 일시가 지정한 날짜인 회의 ID를 조회합니다.
+
+        Args:
+            year (int or None): 연도 (None이면 모든 연도의 같은 월/일)
+            month (int): 월
+            day (int): 일
+
+        Returns:
+            list: meeting_id 목록
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        if year is not None:
+            start = datetime.date(year, month, day)
+            end = start + datetime.timedelta(days=1)
+            # (meeting_date, meeting_id) 인덱스 범위 검색
+            cursor.execute("""
+                SELECT meeting_id FROM meetings
+                WHERE meeting_date >= ? AND meeting_date < ?
+            """, (start.isoformat(), end.isoformat()))
+        else:
+            cursor.execute("""
+                SELECT meeting_id FROM meetings
+                WHERE substr(meeting_date, 6, 5) = ?
+            """, (f"{month:02d}-{day:02d}",))
+        meeting_ids = [row['meeting_id'] for row in cursor.fetchall()]
+        conn.close()
+        return meeting_ids
+
+    def _get_title_index(self):
+        """
+        회의 제목 메모리 인덱스를 반환합니다 (제목 변경 시 무효화, TITLE_INDEX_TTL마다 다시 로드).
+
+        Returns:
+            dict: 소문자 제목 앞 2글자 → [(소문자 제목, {'meeting_id', 'title'}), ...]
+        """
+        cached = self._title_index
+        if cached is not None and time.monotonic() - cached[1] < self.TITLE_INDEX_TTL:
+            return cached[0]
+
+        with self._title_index_lock:
+            cached = self._title_index
+            if cached is not None and time.monotonic() - cached[1] < self.TITLE_INDEX_TTL:
+                return cached[0]
+
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT meeting_id, title FROM meetings WHERE length(title) >= 2")
+            index = {}
+            for row in cursor.fetchall():
+                lowered = row['title'].lower()
+                index.setdefault(lowered[:2], []).append((lowered, dict(row)))
+            conn.close()
+
+            self._title_index = (index, time.monotonic())
+            return index
+
+    def find_meetings_by_title_in_text(self, text, min_length=2):
+        """
+        텍스트에 제목이 그대로 포함된 회의를 조회합니다 (예: 질문에 회의 제목이 언급된 경우).
+        질문마다 테이블을 훑지 않도록 제목 앞 2글자 메모리 인덱스로 후보만 비교합니다.
+
+        Args:
+            text (str): 검색할 텍스트 (사용자 질문 등)
+            min_length (int): 비교할 최소 제목 길이 (너무 짧은 제목의 우연한 일치 방지)
+
+        Returns:
+            list: [{'meeting_id', 'title'}, ...]
+        """
+        index = self._get_title_index()
+        lowered = (text or "").lower()
+
+        rows, seen = [], set()
+        for i in range(len(lowered) - 1):
+            for title, row in index.get(lowered[i:i + 2], ()):
+                if (len(title) >= min_length and row['meeting_id'] not in seen
+                        and lowered.startswith(title, i)):
+                    seen.add(row['meeting_id'])
+                    rows.append(dict(row))
+        return rows
+
+    def find_meetings_by_title_keyword(self, keyword):
+        """
+        제목에 키워드가 포함된 회의를 조회합니다 (부분 일치).
+
+        Args:
+            keyword (str): 제목 키워드
+
+        Returns:
+            list: [{'meeting_id', 'title'}, ...]
+        """
+        escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT meeting_id, title FROM meetings
+            WHERE title LIKE ? ESCAPE '\\'
+        """, (f"%{escaped}%",))
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return rows
+
+    def get_segments_window(self, meeting_id, start_time=None, end_time=None, after=None, limit=200):
+        """
+        회의 전사 세그먼트를 시간 구간 [start_time, end_time) 또는 커서 기준으로 조회합니다.
+        (meeting_id, start_time, segment_id) 인덱스를 사용합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+            start_time (float, optional): 구간 시작 (초, 포함)
+            end_time (float, optional): 구간 끝 (초, 미포함)
+            after (tuple, optional): (start_time, segment_id) - 이 세그먼트 이후부터 조회 (커서)
+            limit (int, optional): 최대 세그먼트 수 (None이면 전체)
+
+        Returns:
+            tuple: (segments, has_more)
+                segments: [{'segment_id', 'speaker_label', 'start_time', 'segment', 'confidence'}, ...]
+        """
+        conditions = ["meeting_id = ?"]
+        params = [meeting_id]
+
+        if start_time is not None:
+            conditions.append("start_time >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            conditions.append("start_time < ?")
+            params.append(end_time)
+        if after is not None:
+            conditions.append("(start_time, segment_id) > (?, ?)")
+            params.extend(after)
+
+        if limit is not None:
+            params.append(limit + 1)
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT segment_id, speaker_label, start_time, segment, confidence
+            FROM meeting_dialogues
+            WHERE {' AND '.join(conditions)}
+            ORDER BY start_time ASC, segment_id ASC
+            {'LIMIT ?' if limit is not None else ''}
+        """, params)
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+
+        if limit is None:
+            return rows, False
+        return rows[:limit], len(rows) > limit
+
+    def get_segment_at(self, meeting_id, timestamp):
+        """
+        주어진 재생 시점(초)에 해당하는 세그먼트를 조회합니다.
+        (start_time <= timestamp 인 마지막 세그먼트, 없으면 첫 세그먼트)
+
+        Args:
+            meeting_id (str): 회의 ID
+            timestamp (float): 재생 시점 (초)
+
+        Returns:
+            dict or None: {'segment_id', 'speaker_label', 'start_time', 'segment', 'confidence'}
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT segment_id, speaker_label, start_time, segment, confidence
+            FROM meeting_dialogues
+            WHERE meeting_id = ? AND start_time <= ?
+            ORDER BY start_time DESC, segment_id DESC
+            LIMIT 1
+        """, (meeting_id, timestamp))
+        row = cursor.fetchone()
+
+        if row is None:
+            cursor.execute("""
+                SELECT segment_id, speaker_label, start_time, segment, confidence
+                FROM meeting_dialogues
+                WHERE meeting_id = ?
+                ORDER BY start_time ASC, segment_id ASC
+                LIMIT 1
+            """, (meeting_id,))
+            row = cursor.fetchone()
+
+        conn.close()
+        return dict(row) if row else None
+
     def save_minutes(self, meeting_id, title, meeting_date, minutes_content, owner_id=None):
         """
         생성된 회의록을 데이터베이스에 저장합니다.
@@ -338,8 +1015,14 @@ class DatabaseManager:
 
         cursor.execute(query, tuple(params))
         deleted_rows = cursor.rowcount
+        # 세그먼트가 모두 삭제된 회의는 meetings 목록에서도 제거
+        cursor.execute("""
+            DELETE FROM meetings
+            WHERE meeting_id NOT IN (SELECT DISTINCT meeting_id FROM meeting_dialogues)
+        """)
         conn.commit()
         conn.close()
+        self._title_index = None
 
         logger.info(f"✅ DB 삭제 완료: {deleted_rows}개 행 삭제됨")
         return deleted_rows
@@ -403,6 +1086,7 @@ class DatabaseManager:
         # 4. meeting_dialogues에서 삭제 수행
         cursor.execute("DELETE FROM meeting_dialogues WHERE meeting_id = ?", (meeting_id,))
         deleted_dialogues = cursor.rowcount
+        cursor.execute("DELETE FROM meetings WHERE meeting_id = ?", (meeting_id,))
 
         # 5. meeting_minutes에서 삭제 수행
         deleted_minutes = 0
@@ -426,6 +1110,7 @@ class DatabaseManager:
             deleted_mindmap = cursor.rowcount
 
         conn.commit()
+        self._title_index = None
 
         logger.info(f"[삭제 수행] meeting_dialogues: {deleted_dialogues}개 삭제")
         logger.info(f"[삭제 수행] meeting_minutes: {deleted_minutes}개 삭제")
@@ -542,6 +1227,7 @@ class DatabaseManager:
                 WHERE meeting_id = ?
             """, (new_title, meeting_id))
             updated_dialogues = cursor.rowcount
+            cursor.execute("UPDATE meetings SET title = ? WHERE meeting_id = ?", (new_title, meeting_id))
 
             # 2-2. meeting_minutes 테이블 업데이트 (테이블이 존재하는 경우)
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='meeting_minutes'")
@@ -556,6 +1242,7 @@ class DatabaseManager:
                 updated_minutes = cursor.rowcount
 
             conn.commit()
+            self._title_index = None
 
             logger.info(f"✅ SQLite 제목 업데이트 완료: meeting_id={meeting_id}, dialogues={updated_dialogues}개, minutes={updated_minutes}개")
 
@@ -624,6 +1311,7 @@ class DatabaseManager:
                 WHERE meeting_id = ?
             """, (new_date, meeting_id))
             updated_dialogues = cursor.rowcount
+            cursor.execute("UPDATE meetings SET meeting_date = ? WHERE meeting_id = ?", (new_date, meeting_id))
 
             # 2-2. meeting_minutes 테이블 업데이트 (테이블이 존재하는 경우)
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='meeting_minutes'")
@@ -0,0 +1,178 @@
+"""
+임베딩 백엔드 모듈
+- config.EMBEDDING_BACKEND 값으로 임베딩 모델 선택
+- 'openai': OpenAIEmbeddings (네트워크 호출, OPENAI_API_KEY 필요)
+- 'hashed_ngram': 로컬 CPU 해시 문자 n-gram 임베딩 (오프라인, 한국어 음절 단위에 적합)
+"""
+import re
+import unicodedata
+import logging
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKENDS = ('openai', 'hashed_ngram')
+
+# FNV-1a 64bit 상수 (프로세스마다 달라지는 hash() 대신 고정 해시 사용)
+_FNV_OFFSET = np.uint64(0xcbf29ce484222325)
+_FNV_PRIME = np.uint64(0x100000001b3)
+
+# splitmix64 finalizer 상수 (FNV 결과의 상위 비트를 고르게 섞음)
+_MIX_1 = np.uint64(0xbf58476d1ce4e5b9)
+_MIX_2 = np.uint64(0x94d049bb133111eb)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _mix64(hashes):
+    """
+    splitmix64 finalizer (avalanche)
+
+    FNV-1a는 짧은 입력에서 상위 비트가 거의 섞이지 않아 버킷이 몇 개에 몰리므로
+    버킷/부호를 고르기 전에 모든 비트를 섞습니다.
+
+    Args:
+        hashes (np.ndarray): uint64 해시 배열
+
+    Returns:
+        np.ndarray: 섞인 uint64 해시 배열
+    """
+    hashes = (hashes ^ (hashes >> np.uint64(30))) * _MIX_1
+    hashes = (hashes ^ (hashes >> np.uint64(27))) * _MIX_2
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+class HashedNgramEmbeddings(Embeddings):
+    """
+    해시 문자 n-gram 임베딩 (feature hashing)
+
+    문자 n-gram을 고정 해시로 dim 차원에 투영하고 부호 해시로 충돌을 상쇄합니다.
+    여러 텍스트를 하나의 배열로 이어 붙여 NumPy 연산으로 한 번에 인코딩합니다.
+    """
+
+    def __init__(self, dim=1024, ngram_range=(1, 3)):
+        """
+        Args:
+            dim (int): 임베딩 차원
+            ngram_range (tuple): (최소 n, 최대 n) 문자 n-gram 범위
+        """
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    @property
+    def backend_id(self):
+        """컬렉션 태그용 백엔드 식별자 (설정이 바뀌면 벡터 공간도 바뀜)"""
+        return f"hashed_ngram:v2:d{self.dim}:n{self.ngram_range[0]}-{self.ngram_range[1]}"
+
+    def _normalize(self, text):
+        text = unicodedata.normalize('NFC', text or "").lower()
+        return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+    def _encode(self, texts):
+        """
+        텍스트 배치를 (len(texts), dim) float32 행렬로 인코딩
+
+        Args:
+            texts (list[str]): 텍스트 목록
+
+        Returns:
+            np.ndarray: L2 정규화된 임베딩 행렬
+        """
+        batch_size = len(texts)
+        if batch_size == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        encoded = [self._normalize(text).encode('utf-32-le') for text in texts]
+        lengths = np.fromiter((len(raw) // 4 for raw in encoded), dtype=np.int64, count=batch_size)
+        codes = np.frombuffer(b''.join(encoded), dtype=np.uint32).astype(np.uint64)
+        doc_ids = np.repeat(np.arange(batch_size, dtype=np.int64), lengths)
+
+        counts = np.zeros(batch_size * self.dim, dtype=np.float64)
+        total = len(codes)
+
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            size = total - n + 1
+            if size <= 0:
+                continue
+
+            # n-gram FNV-1a 해시 (n을 시드에 섞어 n별로 다른 해시 공간 사용)
+            hashes = np.full(size, _FNV_OFFSET ^ np.uint64(n), dtype=np.uint64)
+            for offset in range(n):
+                hashes = (hashes ^ codes[offset:offset + size]) * _FNV_PRIME
+
+            # 문서 경계를 넘는 n-gram 제외
+            valid = doc_ids[:size] == doc_ids[n - 1:]
+            hashes = hashes[valid]
+
+            # 버킷은 하위 비트, 부호는 독립적인 최상위 비트에서 선택
+            hashes = _mix64(hashes)
+            buckets = (hashes % np.uint64(self.dim)).astype(np.int64)
+            signs = np.where(hashes >> np.uint64(63), 1.0, -1.0)
+
+            counts += np.bincount(
+                doc_ids[:size][valid] * self.dim + buckets,
+                weights=signs,
+                minlength=batch_size * self.dim
+            )
+
+        matrix = counts.reshape(batch_size, self.dim)
+
+        # 빈도 완화 (sublinear tf) 후 L2 정규화
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        return (matrix / norms).astype(np.float32)
+
+    def embed_documents(self, texts):
+        """
+        문서 임베딩
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록
+
+        Returns:
+            list[list[float]]: 임베딩 목록
+        """
+        return self._encode(list(texts)).tolist()
+
+    def embed_query(self, text):
+        """
+        쿼리 임베딩
+
+        Args:
+            text (str): 쿼리 텍스트
+
+        Returns:
+            list[float]: 임베딩 벡터
+        """
+        return self._encode([text])[0].tolist()
+
+
+def create_embedding_backend(backend, dim=1024):
+    """
+    설정된 이름으로 임베딩 백엔드를 생성합니다.
+
+    Args:
+        backend (str): 'openai' 또는 'hashed_ngram'
+        dim (int): 로컬 백엔드 임베딩 차원
+
+    Returns:
+        tuple: (Embeddings 인스턴스, 백엔드 식별자 문자열)
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    if backend == 'openai':
+        from langchain_openai import OpenAIEmbeddings
+
+        embeddings = OpenAIEmbeddings()
+        return embeddings, f"openai:{embeddings.model}"
+
+    if backend == 'hashed_ngram':
+        embeddings = HashedNgramEmbeddings(dim=dim)
+        return embeddings, embeddings.backend_id
+
+    raise ValueError(f"지원하지 않는 임베딩 백엔드입니다: {backend}. {list(EMBEDDING_BACKENDS)} 중 하나를 선택하세요.")
@@ -0,0 +1,369 @@
+"""
+임베딩 캐시 모듈
+- (모델명, 정규화된 텍스트의 SHA-256) 키로 임베딩 벡터를 SQLite에 영구 저장
+- float32 / float16 BLOB으로 압축 저장
+- 동일 텍스트 동시 요청 single-flight 중복 제거
+- 캐시 적중률 통계
+- 최근 쿼리 임베딩 LRU 캐시
+"""
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+import logging
+from pathlib import Path
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# SQLite IN 절 파라미터 수 제한을 피하기 위한 조회 배치 크기
+_LOOKUP_BATCH_SIZE = 500
+
+
+def normalize_text(text):
+    """
+    캐시 키 생성을 위한 텍스트 정규화 (유니코드 NFC, 줄 끝 공백 및 앞뒤 공백 제거)
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = unicodedata.normalize('NFC', text or "")
+    return '\n'.join(line.rstrip() for line in text.strip().split('\n'))
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    기존 임베딩 모델을 감싸 영구 캐시를 적용하는 임베딩 함수
+    Chroma vectorstore의 embedding_function으로 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, base_embeddings, cache_path, dtype='float32', model_name=None):
+        """
+        Args:
+            base_embeddings (Embeddings): 실제 임베딩을 계산할 모델 (예: OpenAIEmbeddings)
+            cache_path (str): 캐시 SQLite 파일 경로
+            dtype (str): 저장 형식 ('float32' 또는 'float16')
+            model_name (str, optional): 캐시 키에 사용할 모델명 (기본값: base_embeddings.model)
+        """
+        if dtype not in ('float32', 'float16'):
+            raise ValueError(f"지원하지 않는 임베딩 캐시 dtype입니다: {dtype}")
+
+        self.base_embeddings = base_embeddings
+        self.cache_path = str(cache_path)
+        self.dtype = dtype
+        self.model_name = model_name or getattr(base_embeddings, 'model', None) or type(base_embeddings).__name__
+
+        # single-flight: 텍스트 해시 -> 계산 완료 이벤트
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
+        self._initialize_table()
+
+    def _get_connection(self):
+        return sqlite3.connect(self.cache_path, timeout=30)
+
+    def _initialize_table(self):
+        Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dtype TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (model, text_hash)
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _hash(self, normalized_text):
+        return hashlib.sha256(normalized_text.encode('utf-8')).hexdigest()
+
+    def _load(self, hashes):
+        """캐시에서 해시 목록에 해당하는 벡터 조회 -> {hash: list[float]}"""
+        found = {}
+        if not hashes:
+            return found
+
+        hashes = list(hashes)
+        conn = self._get_connection()
+        try:
+            for i in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+                batch = hashes[i:i + _LOOKUP_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(f"""
+                    SELECT text_hash, dtype, vector FROM embedding_cache
+                    WHERE model = ? AND text_hash IN ({placeholders})
+                """, (self.model_name, *batch)).fetchall()
+
+                for text_hash, dtype, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=dtype).astype(np.float32).tolist()
+        finally:
+            conn.close()
+
+        return found
+
+    def _store(self, items):
+        """
+        (hash, vector) 목록을 캐시에 저장
+
+        Returns:
+            dict: {hash: list[float]} - 저장 형식(dtype)으로 변환된 벡터 (캐시 적중 시와 동일한 값)
+        """
+        stored = {}
+        if not items:
+            return stored
+
+        rows = []
+        for text_hash, vector in items:
+            array = np.asarray(vector, dtype=self.dtype)
+            rows.append((self.model_name, text_hash, self.dtype, int(array.shape[0]), array.tobytes()))
+            stored[text_hash] = array.astype(np.float32).tolist()
+
+        conn = self._get_connection()
+        try:
+            conn.executemany("""
+                INSERT OR REPLACE INTO embedding_cache (model, text_hash, dtype, dim, vector)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+        return stored
+
+    def embed_documents(self, texts):
+        """
+        문서 임베딩 (캐시 적중분은 재사용, 미스분만 모델 호출)
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록
+
+        Returns:
+            list[list[float]]: 입력 순서와 동일한 임베딩 목록
+        """
+        normalized = [normalize_text(text) for text in texts]
+        hashes = [self._hash(text) for text in normalized]
+
+        # 배치 내 중복 제거 (첫 등장 텍스트 기준)
+        unique = {}
+        for text_hash, text in zip(hashes, normalized):
+            unique.setdefault(text_hash, text)
+
+        vectors = self._load(unique.keys())
+        hits = len(vectors)
+
+        # 미스 항목 중 직접 계산할 것(owned)과 다른 요청이 계산 중인 것(waiting) 분리
+        owned, waiting = {}, {}
+        with self._lock:
+            for text_hash, text in unique.items():
+                if text_hash in vectors:
+                    continue
+                event = self._inflight.get(text_hash)
+                if event is None:
+                    self._inflight[text_hash] = threading.Event()
+                    owned[text_hash] = text
+                else:
+                    waiting[text_hash] = event
+
+        try:
+            if owned:
+                owned_hashes = list(owned.keys())
+                embedded = self.base_embeddings.embed_documents([owned[h] for h in owned_hashes])
+                vectors.update(self._store(list(zip(owned_hashes, embedded))))
+        finally:
+            with self._lock:
+                for text_hash in owned:
+                    self._inflight.pop(text_hash).set()
+
+        if waiting:
+            for event in waiting.values():
+                event.wait()
+            vectors.update(self._load(waiting.keys()))
+
+            # 먼저 계산하던 요청이 실패한 경우 직접 계산
+            missing = [h for h in waiting if h not in vectors]
+            if missing:
+                embedded = self.base_embeddings.embed_documents([unique[h] for h in missing])
+                vectors.update(self._store(list(zip(missing, embedded))))
+
+        with self._lock:
+            self._stats['hits'] += hits
+            self._stats['misses'] += len(owned)
+            self._stats['coalesced'] += len(waiting)
+
+        if texts:
+            logger.info(
+                f"🧮 임베딩 캐시: {len(texts)}개 요청, 적중 {hits}, 신규 계산 {len(owned)}, 대기 병합 {len(waiting)}"
+            )
+
+        return [vectors[text_hash] for text_hash in hashes]
+
+    def embed_query(self, text):
+        """
+        쿼리 임베딩 (사용자 질의는 재사용률이 낮아 캐시하지 않음)
+
+        Args:
+            text (str): 쿼리 텍스트
+
+        Returns:
+            list[float]: 임베딩 벡터
+        """
+        return self.base_embeddings.embed_query(text)
+
+    def embed_queries(self, texts):
+        """
+        여러 쿼리를 한 번에 임베딩 (캐시하지 않고 모델 1회 호출)
+
+        Args:
+            texts (list[str]): 쿼리 텍스트 목록
+
+        Returns:
+            list[list[float]]: 입력 순서와 동일한 임베딩 목록
+        """
+        return self.base_embeddings.embed_documents(texts)
+
+    def get_stats(self):
+        """
+        캐시 통계 조회
+
+        Returns:
+            dict: {'model', 'hits', 'misses', 'coalesced', 'hit_rate', 'entries'}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        conn = self._get_connection()
+        try:
+            entries = conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache WHERE model = ?", (self.model_name,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+        requests = stats['hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = round((stats['hits'] + stats['coalesced']) / requests, 4) if requests else 0.0
+        stats['model'] = self.model_name
+        stats['entries'] = entries
+        return stats
+
+
+class QueryEmbeddingLRU(Embeddings):
+    """
+    최근 쿼리 임베딩을 메모리 LRU로 캐시하는 임베딩 함수 래퍼
+    (같은 질문 반복, 한 질문에 대한 여러 컬렉션 검색 시 재임베딩 방지)
+    """
+
+    def __init__(self, base_embeddings, maxsize=256):
+        """
+        Args:
+            base_embeddings (Embeddings): 실제 임베딩 함수
+            maxsize (int): 캐시할 최대 쿼리 수
+        """
+        self.base_embeddings = base_embeddings
+        self.maxsize = maxsize
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def embed_documents(self, texts):
+        """문서 임베딩 (캐시하지 않고 그대로 전달)"""
+        return self.base_embeddings.embed_documents(texts)
+
+    def embed_query(self, text):
+        """
+        쿼리 임베딩 (LRU 캐시 적용)
+
+        Args:
+            text (str): 쿼리 텍스트
+
+        Returns:
+            list[float]: 임베딩 벡터
+        """
+        key = normalize_text(text)
+
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return vector
+            self._stats['misses'] += 1
+
+        vector = self.base_embeddings.embed_query(text)
+
+        with self._lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return vector
+
+    def embed_queries(self, texts):
+        """
+        여러 쿼리를 한 번에 임베딩 (LRU 적중분은 재사용, 미스분만 모아서 모델 1회 호출)
+        결과는 LRU에 저장되므로 이후 같은 쿼리의 embed_query()는 모델을 호출하지 않습니다.
+
+        Args:
+            texts (list[str]): 쿼리 텍스트 목록
+
+        Returns:
+            list[list[float]]: 입력 순서와 동일한 임베딩 목록
+        """
+        keys = [normalize_text(text) for text in texts]
+        vectors = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._cache.get(key)
+                if vector is not None:
+                    self._cache.move_to_end(key)
+                    vectors[key] = vector
+            missing = list(dict.fromkeys(key for key, text in zip(keys, texts) if key not in vectors))
+            self._stats['hits'] += len(keys) - len(missing)
+            self._stats['misses'] += len(missing)
+
+        if missing:
+            originals = {}
+            for key, text in zip(keys, texts):
+                originals.setdefault(key, text)
+            batch_embed = getattr(self.base_embeddings, 'embed_queries', self.base_embeddings.embed_documents)
+            embedded = batch_embed([originals[key] for key in missing])
+
+            with self._lock:
+                for key, vector in zip(missing, embedded):
+                    vectors[key] = vector
+                    self._cache[key] = vector
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        return [vectors[key] for key in keys]
+
+    def get_stats(self):
+        """
+        캐시 통계 조회
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'entries'}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / requests, 4) if requests else 0.0
+        return stats
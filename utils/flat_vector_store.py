@@ -0,0 +1,606 @@
+"""
+메모리 매핑 NumPy 플랫(flat) 벡터 인덱스 모듈
+- 임베딩을 float16 또는 int8(행별 스케일) 행렬 파일로 저장하고 np.memmap으로 조회
+- 문서/메타데이터는 SQLite 사이드카에 저장
+- 정확한(exact) top-k 코사인 검색, meeting_id 조건은 정수 코드 배열로 벡터화 필터링
+- 삭제는 tombstone, 일정 비율을 넘으면 압축(compaction)
+- Chroma 컬렉션 호환 API(get/delete/update/count/metadata/modify)와 LangChain VectorStore 래퍼 제공
+"""
+import json
+import os
+import sqlite3
+import threading
+import uuid
+import logging
+from pathlib import Path
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+from langchain_core.vectorstores.utils import maximal_marginal_relevance
+
+logger = logging.getLogger(__name__)
+
+_NUMERIC_OPERATORS = {
+    '$gt': lambda a, b: a > b,
+    '$gte': lambda a, b: a >= b,
+    '$lt': lambda a, b: a < b,
+    '$lte': lambda a, b: a <= b,
+}
+
+
+def _match_condition(value, condition):
+    """단일 메타데이터 값이 Chroma where 조건을 만족하는지 확인"""
+    if not isinstance(condition, dict):
+        return value == condition
+
+    for operator, operand in condition.items():
+        if operator == '$eq' and value != operand:
+            return False
+        if operator == '$ne' and value == operand:
+            return False
+        if operator == '$in' and value not in operand:
+            return False
+        if operator == '$nin' and value in operand:
+            return False
+        if operator in _NUMERIC_OPERATORS:
+            if value is None or not _NUMERIC_OPERATORS[operator](value, operand):
+                return False
+    return True
+
+
+class FlatIndex:
+    """
+    메모리 매핑 플랫 벡터 인덱스 (Chroma Collection 호환 최소 API)
+
+    디렉토리 구성:
+        vectors.bin  - 정규화된 임베딩 행렬 (float16 또는 int8)
+        scales.bin   - int8 사용 시 행별 스케일 (float32)
+        index.db     - 행 번호, 문서 ID, 문서, 메타데이터 사이드카
+    """
+
+    def __init__(self, path, dtype='float16', compact_ratio=0.25, metadata=None):
+        """
+        Args:
+            path (str): 인덱스 디렉토리
+            dtype (str): 벡터 저장 형식 ('float16' 또는 'int8')
+            compact_ratio (float): 삭제된 행 비율이 이 값을 넘으면 압축
+            metadata (dict, optional): 컬렉션 메타데이터 (신규 생성 시 저장)
+        """
+        if dtype not in ('float16', 'int8'):
+            raise ValueError(f"지원하지 않는 플랫 인덱스 dtype입니다: {dtype}")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.name = self.path.name
+        self.compact_ratio = compact_ratio
+
+        self._lock = threading.RLock()
+        self._db_path = str(self.path / "index.db")
+        self._initialize_sidecar(dtype, metadata)
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 저장소 초기화 / 로드
+    # ------------------------------------------------------------------
+
+    def _get_connection(self):
+        return sqlite3.connect(self._db_path, timeout=30)
+
+    def _initialize_sidecar(self, dtype, metadata):
+        conn = self._get_connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rows (
+                row INTEGER PRIMARY KEY,
+                id TEXT UNIQUE NOT NULL,
+                document TEXT,
+                metadata TEXT
+            )
+        """)
+        conn.execute("INSERT OR IGNORE INTO info (key, value) VALUES ('dtype', ?)", (dtype,))
+        conn.execute("INSERT OR IGNORE INTO info (key, value) VALUES ('size', '0')")
+        conn.execute("INSERT OR IGNORE INTO info (key, value) VALUES ('metadata', ?)",
+                     (json.dumps(metadata or {}, ensure_ascii=False),))
+        conn.commit()
+        conn.close()
+
+    def _load(self):
+        conn = self._get_connection()
+        info = dict(conn.execute("SELECT key, value FROM info").fetchall())
+        rows = conn.execute("SELECT row, id, metadata FROM rows ORDER BY row").fetchall()
+        conn.close()
+
+        self.dtype = info['dtype']
+        self.dim = int(info['dim']) if 'dim' in info else None
+        self._collection_metadata = json.loads(info.get('metadata') or '{}')
+        self._size = int(info['size'])
+
+        self._ids = [None] * self._size
+        self._metadatas = [None] * self._size
+        self._row_of_id = {}
+        self._alive = np.zeros(self._size, dtype=bool)
+
+        for row, doc_id, metadata in rows:
+            self._ids[row] = doc_id
+            self._metadatas[row] = json.loads(metadata) if metadata else {}
+            self._row_of_id[doc_id] = row
+            self._alive[row] = True
+
+        self._meeting_codes = {}
+        self._meeting = np.full(self._size, -1, dtype=np.int32)
+        for row in np.flatnonzero(self._alive):
+            self._meeting[row] = self._meeting_code(self._metadatas[row].get('meeting_id'))
+
+        self._vectors = None
+        self._scales = None
+        if self.dim is not None:
+            self._open_matrix(max(self._size, 1))
+
+    def _meeting_code(self, meeting_id):
+        return self._meeting_codes.setdefault(meeting_id, len(self._meeting_codes))
+
+    def _open_matrix(self, min_rows):
+        """벡터 파일을 최소 min_rows 행 이상으로 확장하고 memmap을 다시 엽니다."""
+        vector_path = self.path / "vectors.bin"
+        item_size = np.dtype(self.dtype).itemsize * self.dim
+        current_rows = vector_path.stat().st_size // item_size if vector_path.exists() else 0
+
+        capacity = current_rows
+        if capacity < min_rows:
+            capacity = max(min_rows, current_rows * 2, 1024)
+            with open(vector_path, 'ab') as f:
+                f.truncate(capacity * item_size)
+
+        self._vectors = np.memmap(vector_path, dtype=self.dtype, mode='r+', shape=(capacity, self.dim))
+
+        if self.dtype == 'int8':
+            scale_path = self.path / "scales.bin"
+            with open(scale_path, 'ab') as f:
+                f.truncate(capacity * 4)
+            self._scales = np.memmap(scale_path, dtype=np.float32, mode='r+', shape=(capacity,))
+
+    def _encode(self, embeddings):
+        """임베딩을 L2 정규화 후 저장 형식으로 변환 -> (matrix, scales)"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        if self.dtype == 'int8':
+            scales = np.abs(matrix).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            return np.round(matrix / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+
+        return matrix.astype(np.float16), None
+
+    def _decode(self, rows):
+        """행 번호 목록의 벡터를 float32로 복원"""
+        matrix = np.asarray(self._vectors[rows], dtype=np.float32)
+        if self.dtype == 'int8':
+            matrix *= self._scales[rows][:, None]
+        return matrix
+
+    # ------------------------------------------------------------------
+    # 필터링
+    # ------------------------------------------------------------------
+
+    def _where_mask(self, where):
+        """Chroma where 필터를 살아있는 행 마스크로 변환"""
+        mask = self._alive[:self._size].copy()
+        if where:
+            mask &= self._eval_where(where)
+        return mask
+
+    def _eval_where(self, where):
+        if '$and' in where:
+            result = np.ones(self._size, dtype=bool)
+            for clause in where['$and']:
+                result &= self._eval_where(clause)
+            return result
+
+        if '$or' in where:
+            result = np.zeros(self._size, dtype=bool)
+            for clause in where['$or']:
+                result |= self._eval_where(clause)
+            return result
+
+        result = np.ones(self._size, dtype=bool)
+        for key, condition in where.items():
+            if key == 'meeting_id':
+                result &= self._meeting_mask(condition)
+            else:
+                result &= np.fromiter(
+                    (meta is not None and _match_condition(meta.get(key), condition) for meta in self._metadatas),
+                    dtype=bool, count=self._size
+                )
+        return result
+
+    def _meeting_mask(self, condition):
+        """meeting_id 조건은 정수 코드 배열로 벡터화 처리"""
+        if not isinstance(condition, dict):
+            condition = {'$eq': condition}
+
+        result = np.ones(self._size, dtype=bool)
+        for operator, operand in condition.items():
+            values = operand if operator in ('$in', '$nin') else [operand]
+            codes = [self._meeting_codes[v] for v in values if v in self._meeting_codes]
+            matched = np.isin(self._meeting, codes)
+            result &= ~matched if operator in ('$ne', '$nin') else matched
+        return result
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def add(self, ids, embeddings, documents=None, metadatas=None):
+        """
+        문서 추가 (같은 ID가 있으면 기존 행을 tombstone 처리 후 새 행에 추가)
+
+        Args:
+            ids (list[str]): 문서 ID 목록
+            embeddings (list[list[float]]): 임베딩 목록
+            documents (list[str], optional): 문서 텍스트 목록
+            metadatas (list[dict], optional): 메타데이터 목록
+        """
+        if not ids:
+            return
+
+        documents = documents or [None] * len(ids)
+        metadatas = [meta or {} for meta in (metadatas or [None] * len(ids))]
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = len(embeddings[0])
+                conn = self._get_connection()
+                conn.execute("INSERT OR REPLACE INTO info (key, value) VALUES ('dim', ?)", (str(self.dim),))
+                conn.commit()
+                conn.close()
+
+            self._tombstone([self._row_of_id[i] for i in ids if i in self._row_of_id])
+
+            start = self._size
+            end = start + len(ids)
+            if self._vectors is None or end > self._vectors.shape[0]:
+                self._open_matrix(end)
+
+            matrix, scales = self._encode(embeddings)
+            self._vectors[start:end] = matrix
+            if scales is not None:
+                self._scales[start:end] = scales
+            self._vectors.flush()
+
+            conn = self._get_connection()
+            conn.execute("DELETE FROM rows WHERE id IN (%s)" % ','.join('?' * len(ids)), list(ids))
+            conn.executemany(
+                "INSERT INTO rows (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                [(start + i, doc_id, documents[i], json.dumps(metadatas[i], ensure_ascii=False))
+                 for i, doc_id in enumerate(ids)]
+            )
+            conn.execute("UPDATE info SET value = ? WHERE key = 'size'", (str(end),))
+            conn.commit()
+            conn.close()
+
+            self._size = end
+            self._alive = np.concatenate([self._alive, np.ones(len(ids), dtype=bool)])
+            self._meeting = np.concatenate([
+                self._meeting,
+                np.array([self._meeting_code(meta.get('meeting_id')) for meta in metadatas], dtype=np.int32)
+            ])
+            for i, doc_id in enumerate(ids):
+                self._ids.append(doc_id)
+                self._metadatas.append(metadatas[i])
+                self._row_of_id[doc_id] = start + i
+
+    def upsert(self, ids, embeddings, documents=None, metadatas=None):
+        """add()와 동일 (기존 ID는 교체)"""
+        self.add(ids, embeddings, documents, metadatas)
+
+    def _tombstone(self, rows):
+        for row in rows:
+            if self._alive[row]:
+                self._alive[row] = False
+                self._row_of_id.pop(self._ids[row], None)
+                self._metadatas[row] = None
+                self._meeting[row] = -1
+
+    def delete(self, ids=None, where=None):
+        """
+        문서 삭제 (tombstone, 삭제 비율이 높으면 압축)
+
+        Args:
+            ids (list[str], optional): 삭제할 문서 ID 목록
+            where (dict, optional): Chroma where 필터 ({}이면 전체 삭제)
+        """
+        with self._lock:
+            rows = self._select_rows(ids, where)
+            if len(rows) == 0:
+                return
+
+            self._tombstone(rows)
+
+            conn = self._get_connection()
+            conn.executemany("DELETE FROM rows WHERE row = ?", [(int(row),) for row in rows])
+            conn.commit()
+            conn.close()
+
+            dead = self._size - int(self._alive.sum())
+            if self._size and dead / self._size > self.compact_ratio:
+                self.compact()
+
+    def update(self, ids, metadatas=None, documents=None, embeddings=None):
+        """
+        문서의 메타데이터/본문/임베딩을 갱신합니다.
+
+        Args:
+            ids (list[str]): 문서 ID 목록
+            metadatas (list[dict], optional): 새 메타데이터 목록
+            documents (list[str], optional): 새 문서 텍스트 목록
+            embeddings (list[list[float]], optional): 새 임베딩 목록
+        """
+        with self._lock:
+            targets = [(i, self._row_of_id[doc_id]) for i, doc_id in enumerate(ids) if doc_id in self._row_of_id]
+            if not targets:
+                return
+
+            conn = self._get_connection()
+            for i, row in targets:
+                if metadatas is not None:
+                    self._metadatas[row] = metadatas[i] or {}
+                    self._meeting[row] = self._meeting_code(self._metadatas[row].get('meeting_id'))
+                    conn.execute("UPDATE rows SET metadata = ? WHERE row = ?",
+                                 (json.dumps(self._metadatas[row], ensure_ascii=False), row))
+                if documents is not None:
+                    conn.execute("UPDATE rows SET document = ? WHERE row = ?", (documents[i], row))
+            conn.commit()
+            conn.close()
+
+            if embeddings is not None:
+                rows = [row for _, row in targets]
+                matrix, scales = self._encode([embeddings[i] for i, _ in targets])
+                self._vectors[rows] = matrix
+                if scales is not None:
+                    self._scales[rows] = scales
+                self._vectors.flush()
+
+    def compact(self):
+        """tombstone 행을 제거하고 벡터 파일과 사이드카의 행 번호를 다시 매깁니다."""
+        with self._lock:
+            alive_rows = np.flatnonzero(self._alive)
+            logger.info(f"🗜️ 플랫 인덱스 압축: '{self.name}' {self._size}행 → {len(alive_rows)}행")
+
+            if self.dim is not None:
+                item_size = np.dtype(self.dtype).itemsize * self.dim
+                tmp_path = self.path / "vectors.bin.tmp"
+                np.asarray(self._vectors[alive_rows]).tofile(tmp_path)
+                with open(tmp_path, 'ab') as f:
+                    f.truncate(max(len(alive_rows), 1) * item_size)
+
+                if self.dtype == 'int8':
+                    scale_tmp = self.path / "scales.bin.tmp"
+                    np.asarray(self._scales[alive_rows]).tofile(scale_tmp)
+
+                self._vectors = None
+                self._scales = None
+                os.replace(tmp_path, self.path / "vectors.bin")
+                if self.dtype == 'int8':
+                    os.replace(scale_tmp, self.path / "scales.bin")
+
+            conn = self._get_connection()
+            conn.execute("UPDATE rows SET row = -row - 1")
+            conn.executemany("UPDATE rows SET row = ? WHERE row = ?",
+                             [(new, -int(old) - 1) for new, old in enumerate(alive_rows)])
+            conn.execute("UPDATE info SET value = ? WHERE key = 'size'", (str(len(alive_rows)),))
+            conn.commit()
+            conn.close()
+
+            self._load()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _select_rows(self, ids=None, where=None):
+        if ids is not None:
+            rows = np.array([self._row_of_id[i] for i in ids if i in self._row_of_id], dtype=np.int64)
+            if where:
+                rows = rows[self._where_mask(where)[rows]]
+            return rows
+        return np.flatnonzero(self._where_mask(where))
+
+    def _fetch_documents(self, rows):
+        if len(rows) == 0:
+            return {}
+        conn = self._get_connection()
+        fetched = dict(conn.execute(
+            "SELECT row, document FROM rows WHERE row IN (%s)" % ','.join('?' * len(rows)),
+            [int(row) for row in rows]
+        ).fetchall())
+        conn.close()
+        return fetched
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=None):
+        """
+        Chroma Collection.get() 호환 조회
+
+        Returns:
+            dict: {'ids': [...], 'documents': [...], 'metadatas': [...] (, 'embeddings': [...])}
+        """
+        include = include if include is not None else ["documents", "metadatas"]
+
+        with self._lock:
+            rows = self._select_rows(ids, where)
+            if offset:
+                rows = rows[offset:]
+            if limit is not None:
+                rows = rows[:limit]
+
+            result = {'ids': [self._ids[row] for row in rows]}
+            if "metadatas" in include:
+                result['metadatas'] = [dict(self._metadatas[row]) for row in rows]
+            if "documents" in include:
+                documents = self._fetch_documents(rows)
+                result['documents'] = [documents.get(int(row)) for row in rows]
+            if "embeddings" in include:
+                result['embeddings'] = self._decode(rows).tolist() if len(rows) else []
+            return result
+
+    def count(self):
+        return int(self._alive.sum())
+
+    @property
+    def metadata(self):
+        return dict(self._collection_metadata)
+
+    def modify(self, name=None, metadata=None):
+        """컬렉션 메타데이터 변경 (Chroma 호환, name 변경은 지원하지 않음)"""
+        if metadata is None:
+            return
+        with self._lock:
+            self._collection_metadata = dict(metadata)
+            conn = self._get_connection()
+            conn.execute("UPDATE info SET value = ? WHERE key = 'metadata'",
+                         (json.dumps(self._collection_metadata, ensure_ascii=False),))
+            conn.commit()
+            conn.close()
+
+    def query(self, embedding, k=4, where=None, include_embeddings=False):
+        """
+        정확한 top-k 코사인 유사도 검색
+
+        Args:
+            embedding (list[float]): 쿼리 임베딩
+            k (int): 반환할 결과 수
+            where (dict, optional): Chroma where 필터
+            include_embeddings (bool): 결과 행의 임베딩 포함 여부 (MMR용)
+
+        Returns:
+            list[tuple]: [(doc_id, document, metadata, distance[, embedding]), ...] (거리 오름차순, distance = 1 - cosine)
+        """
+        with self._lock:
+            if self.dim is None or self._size == 0:
+                return []
+
+            query = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+
+            mask = self._where_mask(where)
+            rows = np.flatnonzero(mask)
+            if len(rows) == 0:
+                return []
+
+            if len(rows) == self._size:
+                # 필터 없음: 연속 구간을 블록 단위로 행렬 곱
+                scores = np.empty(self._size, dtype=np.float32)
+                block = 4096
+                for start in range(0, self._size, block):
+                    end = min(start + block, self._size)
+                    scores[start:end] = np.asarray(self._vectors[start:end], dtype=np.float32) @ query
+                if self.dtype == 'int8':
+                    scores *= self._scales[:self._size]
+            else:
+                # 필터 있음: 해당 행만 모아서 계산
+                scores = self._decode(rows) @ query
+
+            if len(scores) > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind='stable')]
+
+            result_rows = top if len(rows) == self._size else rows[top]
+            documents = self._fetch_documents(result_rows)
+            embeddings = self._decode(result_rows) if include_embeddings else None
+
+            results = []
+            for i, row in enumerate(result_rows):
+                item = (self._ids[row], documents.get(int(row)), dict(self._metadatas[row]), float(1.0 - scores[top[i]]))
+                if include_embeddings:
+                    item += (embeddings[i],)
+                results.append(item)
+            return results
+
+
+class FlatVectorStore(VectorStore):
+    """
+    FlatIndex 기반 LangChain VectorStore
+    VectorDBManager에서 Chroma 대신 사용할 수 있도록 Chroma와 같은 메서드 이름을 제공합니다.
+    """
+
+    def __init__(self, path, embedding_function, dtype='float16', collection_metadata=None, compact_ratio=0.25):
+        """
+        Args:
+            path (str): 인덱스 디렉토리
+            embedding_function (Embeddings): 임베딩 함수
+            dtype (str): 벡터 저장 형식 ('float16' 또는 'int8')
+            collection_metadata (dict, optional): 컬렉션 메타데이터
+            compact_ratio (float): 압축 기준 삭제 비율
+        """
+        self._embedding_function = embedding_function
+        self._collection = FlatIndex(path, dtype=dtype, compact_ratio=compact_ratio, metadata=collection_metadata)
+
+    @property
+    def embeddings(self):
+        return self._embedding_function
+
+    def add_texts(self, texts, metadatas=None, ids=None, **kwargs):
+        texts = list(texts)
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        embeddings = self._embedding_function.embed_documents(texts)
+        self._collection.add(ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas)
+        return ids
+
+    def delete(self, ids=None, **kwargs):
+        self._collection.delete(ids=ids, where=kwargs.get('where'))
+
+    def _to_documents(self, results):
+        return [
+            (Document(id=doc_id, page_content=document or "", metadata=metadata), distance)
+            for doc_id, document, metadata, distance in results
+        ]
+
+    def similarity_search_by_vector_with_relevance_scores(self, embedding, k=4, filter=None, **kwargs):
+        """(Document, distance) 목록 반환 (Chroma와 동일하게 distance는 낮을수록 유사)"""
+        return self._to_documents(self._collection.query(embedding, k=k, where=filter))
+
+    def similarity_search_by_vector(self, embedding, k=4, filter=None, **kwargs):
+        return [doc for doc, _ in self.similarity_search_by_vector_with_relevance_scores(embedding, k, filter)]
+
+    def similarity_search_with_score(self, query, k=4, filter=None, **kwargs):
+        embedding = self._embedding_function.embed_query(query)
+        return self.similarity_search_by_vector_with_relevance_scores(embedding, k, filter)
+
+    def similarity_search(self, query, k=4, filter=None, **kwargs):
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def _select_relevance_score_fn(self):
+        # distance = 1 - cosine -> relevance = cosine
+        return lambda distance: 1.0 - distance
+
+    def max_marginal_relevance_search_by_vector(self, embedding, k=4, fetch_k=20, lambda_mult=0.5,
+                                                filter=None, **kwargs):
+        results = self._collection.query(embedding, k=fetch_k, where=filter, include_embeddings=True)
+        if not results:
+            return []
+
+        selected = maximal_marginal_relevance(
+            np.asarray(embedding, dtype=np.float32),
+            [item[4] for item in results],
+            k=k,
+            lambda_mult=lambda_mult
+        )
+        return [doc for doc, _ in self._to_documents([results[i][:4] for i in selected])]
+
+    def max_marginal_relevance_search(self, query, k=4, fetch_k=20, lambda_mult=0.5, filter=None, **kwargs):
+        embedding = self._embedding_function.embed_query(query)
+        return self.max_marginal_relevance_search_by_vector(embedding, k, fetch_k, lambda_mult, filter)
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, ids=None, path=None, **kwargs):
+        if path is None:
+            raise ValueError("FlatVectorStore.from_texts에는 path가 필요합니다.")
+        store = cls(path, embedding, **kwargs)
+        store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return store
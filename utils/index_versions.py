@@ -0,0 +1,291 @@
+"""
+벡터 인덱스 버전 관리 모듈
+- 인덱스 버전별 청킹/임베딩 파라미터 기록 (meeting_chunks_v3 등 버전 컬렉션)
+- 임베딩 백엔드별 활성 버전 포인터 (단일 트랜잭션으로 교체)
+- 재인덱싱 진행 체크포인트 (회의 단위, 중단 후 재개 가능)
+- 인덱스 교체와 저장 작업 사이의 읽기/쓰기 게이트
+"""
+import json
+import sqlite3
+import datetime
+import threading
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class IndexVersionStore:
+    """SQLite 기반 인덱스 버전 / 체크포인트 저장소"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 상태 SQLite 파일 경로
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS index_versions (
+                version TEXT PRIMARY KEY,
+                embedding_backend TEXT NOT NULL,
+                embedding_backend_id TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                activated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS active_versions (
+                embedding_backend TEXT PRIMARY KEY,
+                version TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS reindex_checkpoints (
+                version TEXT NOT NULL,
+                meeting_id TEXT NOT NULL,
+                completed_at TEXT NOT NULL,
+                PRIMARY KEY (version, meeting_id)
+            );
+        """)
+        conn.commit()
+        conn.close()
+
+    def _get_connection(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _now():
+        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @staticmethod
+    def _to_dict(row):
+        if row is None:
+            return None
+        version = dict(row)
+        version['params'] = json.loads(version['params'])
+        return version
+
+    def get_active_version(self, embedding_backend):
+        """
+        임베딩 백엔드의 활성 인덱스 버전 조회
+
+        Args:
+            embedding_backend (str): 임베딩 백엔드 이름
+
+        Returns:
+            dict or None: {'version', 'embedding_backend', 'embedding_backend_id', 'params', 'status', ...}
+                          (None이면 버전 없는 기존 컬렉션 사용)
+        """
+        conn = self._get_connection()
+        row = conn.execute("""
+            SELECT v.* FROM active_versions a
+            JOIN index_versions v ON v.version = a.version
+            WHERE a.embedding_backend = ?
+        """, (embedding_backend,)).fetchone()
+        conn.close()
+        return self._to_dict(row)
+
+    def get_building_version(self, embedding_backend):
+        """
+        재인덱싱 중인(완료되지 않은) 버전 조회
+
+        Args:
+            embedding_backend (str): 임베딩 백엔드 이름
+
+        Returns:
+            dict or None: 구축 중인 버전 정보
+        """
+        conn = self._get_connection()
+        row = conn.execute("""
+            SELECT * FROM index_versions
+            WHERE embedding_backend = ? AND status = 'building'
+            ORDER BY created_at DESC LIMIT 1
+        """, (embedding_backend,)).fetchone()
+        conn.close()
+        return self._to_dict(row)
+
+    def list_versions(self):
+        """
+        전체 인덱스 버전 목록 (최신순)
+
+        Returns:
+            list[dict]: 버전 정보 목록
+        """
+        conn = self._get_connection()
+        rows = conn.execute("SELECT * FROM index_versions ORDER BY created_at DESC, version DESC").fetchall()
+        conn.close()
+        return [self._to_dict(row) for row in rows]
+
+    def create_version(self, embedding_backend, embedding_backend_id, params):
+        """
+        새 인덱스 버전 생성 (버전 번호는 백엔드와 무관하게 전역 증가: v1, v2, ...)
+
+        Args:
+            embedding_backend (str): 임베딩 백엔드 이름
+            embedding_backend_id (str): 임베딩 모델 식별자
+            params (dict): 청킹 파라미터
+
+        Returns:
+            dict: 생성된 버전 정보
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("""
+                SELECT MAX(CAST(substr(version, 2) AS INTEGER)) AS latest FROM index_versions
+            """).fetchone()
+            version = f"v{(row['latest'] or 0) + 1}"
+            conn.execute("""
+                INSERT INTO index_versions (version, embedding_backend, embedding_backend_id, params, status, created_at)
+                VALUES (?, ?, ?, ?, 'building', ?)
+            """, (version, embedding_backend, embedding_backend_id, json.dumps(params), self._now()))
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info(f"🆕 인덱스 버전 생성: {version} ({embedding_backend_id}, {params})")
+        return self.get_version(version)
+
+    def get_version(self, version):
+        """버전 정보 조회"""
+        conn = self._get_connection()
+        row = conn.execute("SELECT * FROM index_versions WHERE version = ?", (version,)).fetchone()
+        conn.close()
+        return self._to_dict(row)
+
+    def set_status(self, version, status):
+        """버전 상태 변경 ('building', 'failed', 'active', 'retired')"""
+        conn = self._get_connection()
+        conn.execute("UPDATE index_versions SET status = ? WHERE version = ?", (status, version))
+        conn.commit()
+        conn.close()
+
+    def activate(self, version):
+        """
+        활성 버전 포인터 교체 (단일 트랜잭션)
+
+        Args:
+            version (str): 활성화할 버전
+
+        Returns:
+            str or None: 이전 활성 버전
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            backend = conn.execute(
+                "SELECT embedding_backend FROM index_versions WHERE version = ?", (version,)
+            ).fetchone()['embedding_backend']
+            previous = conn.execute(
+                "SELECT version FROM active_versions WHERE embedding_backend = ?", (backend,)
+            ).fetchone()
+            previous = previous['version'] if previous else None
+
+            conn.execute("""
+                INSERT INTO active_versions (embedding_backend, version) VALUES (?, ?)
+                ON CONFLICT(embedding_backend) DO UPDATE SET version = excluded.version
+            """, (backend, version))
+            conn.execute(
+                "UPDATE index_versions SET status = 'active', activated_at = ? WHERE version = ?",
+                (self._now(), version)
+            )
+            if previous and previous != version:
+                conn.execute("UPDATE index_versions SET status = 'retired' WHERE version = ?", (previous,))
+            conn.commit()
+        finally:
+            conn.close()
+
+        return previous
+
+    def get_completed_meetings(self, version):
+        """
+        재인덱싱이 끝난 meeting_id 집합
+
+        Args:
+            version (str): 인덱스 버전
+
+        Returns:
+            set: meeting_id 집합
+        """
+        conn = self._get_connection()
+        rows = conn.execute("SELECT meeting_id FROM reindex_checkpoints WHERE version = ?", (version,)).fetchall()
+        conn.close()
+        return {row['meeting_id'] for row in rows}
+
+    def mark_completed(self, version, meeting_ids):
+        """회의 재인덱싱 완료 체크포인트 기록"""
+        now = self._now()
+        conn = self._get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO reindex_checkpoints (version, meeting_id, completed_at) VALUES (?, ?, ?)",
+            [(version, meeting_id, now) for meeting_id in meeting_ids]
+        )
+        conn.commit()
+        conn.close()
+
+    def clear_checkpoints(self, version, meeting_ids):
+        """회의 체크포인트 삭제 (재인덱싱 중 변경된 회의를 다시 처리하도록)"""
+        conn = self._get_connection()
+        conn.executemany(
+            "DELETE FROM reindex_checkpoints WHERE version = ? AND meeting_id = ?",
+            [(version, meeting_id) for meeting_id in meeting_ids]
+        )
+        conn.commit()
+        conn.close()
+
+
+class IndexSwapGate:
+    """
+    활성 인덱스 교체용 읽기/쓰기 게이트
+    - 저장/삭제 작업은 동시에 여러 개 진행 가능 (writing)
+    - 인덱스 교체는 진행 중인 작업이 끝나길 기다린 뒤 단독으로 실행 (exclusive)
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._writers = 0
+        self._exclusive = False
+        self._owner = None
+
+    @contextmanager
+    def writing(self):
+        """저장/삭제 작업 구간 (인덱스 교체 중이면 교체가 끝날 때까지 대기)"""
+        with self._condition:
+            # 교체 작업 스레드 자신이 저장 메서드를 호출하는 경우는 통과
+            if self._owner != threading.get_ident():
+                while self._exclusive:
+                    self._condition.wait()
+            self._writers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writers -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        """인덱스 교체 구간 (새 저장/삭제 작업을 막고 진행 중인 작업이 끝날 때까지 대기)"""
+        if self._owner == threading.get_ident():
+            # 이미 교체 구간을 가진 스레드의 중첩 호출
+            yield
+            return
+
+        with self._condition:
+            while self._exclusive:
+                self._condition.wait()
+            self._exclusive = True
+            self._owner = threading.get_ident()
+            while self._writers > 0:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive = False
+                self._owner = None
+                self._condition.notify_all()
@@ -0,0 +1,145 @@
+"""
+회의 단위 centroid 인덱스 모듈
+- 회의별 청크 임베딩으로 centroid(대표 벡터)를 1~수 개 계산
+- 질문 임베딩과 centroid의 코사인 유사도로 후보 회의 top-N 선택 (coarse 단계)
+- 선택된 회의의 청크/서브토픽만 벡터 검색 (fine 단계)하여 회의 수가 늘어도 검색 비용을 일정하게 유지
+"""
+import math
+import threading
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def compute_meeting_centroids(embeddings, max_centroids=3, chunks_per_centroid=10, iterations=5):
+    """
+    회의 청크 임베딩으로 centroid를 계산합니다.
+    청크가 많은 회의는 여러 주제를 다루므로 최대 max_centroids개의 centroid로 나눕니다
+    (시간 순 구간 평균으로 초기화한 구면 k-means).
+
+    Args:
+        embeddings (array-like): (청크 수, 차원) 임베딩 (시간 순서)
+        max_centroids (int): 회의당 최대 centroid 수
+        chunks_per_centroid (int): centroid 1개당 최소 청크 수
+        iterations (int): k-means 반복 횟수
+
+    Returns:
+        np.ndarray: (centroid 수, 차원) 정규화된 centroid 행렬 (임베딩이 없으면 None)
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if vectors.ndim != 2 or len(vectors) == 0:
+        return None
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors / np.maximum(norms, 1e-12)
+
+    count = max(1, min(max_centroids, math.ceil(len(vectors) / chunks_per_centroid)))
+
+    # 회의는 시간에 따라 주제가 바뀌므로 연속 구간 평균으로 초기화
+    centroids = np.stack([part.mean(axis=0) for part in np.array_split(vectors, count)])
+
+    for _ in range(iterations if count > 1 else 0):
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        for c in range(count):
+            members = vectors[assignment == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+
+    centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+    return centroids
+
+
+class MeetingCentroidIndex:
+    """
+    프로세스 내 회의 centroid 인덱스
+
+    - 회의별 centroid 행렬을 보관하고, 검색 시 하나의 행렬로 쌓아 한 번의 행렬곱으로 점수 계산
+    - 회의 점수는 해당 회의 centroid 중 최고 유사도
+    - 접근 가능한 meeting_id 목록(ACL)은 마스크로 적용
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._centroids = {}    # meeting_id -> (c, dim) 행렬
+        self._stacked = None    # (matrix, owners, meeting_ids) 검색용 캐시
+
+    def __len__(self):
+        return len(self._centroids)
+
+    def __contains__(self, meeting_id):
+        return meeting_id in self._centroids
+
+    def set_meeting(self, meeting_id, centroids):
+        """
+        회의 centroid 등록 (기존 centroid는 교체)
+
+        Args:
+            meeting_id (str): 회의 ID
+            centroids (np.ndarray): (c, dim) centroid 행렬
+        """
+        with self._lock:
+            self._centroids[meeting_id] = np.asarray(centroids, dtype=np.float32)
+            self._stacked = None
+
+    def remove_meeting(self, meeting_id):
+        """
+        회의 centroid 삭제
+
+        Args:
+            meeting_id (str): 회의 ID
+        """
+        with self._lock:
+            if self._centroids.pop(meeting_id, None) is not None:
+                self._stacked = None
+
+    def _stack(self):
+        if self._stacked is None:
+            meeting_ids = list(self._centroids)
+            matrices = [self._centroids[m] for m in meeting_ids]
+            matrix = np.concatenate(matrices) if matrices else np.zeros((0, 0), dtype=np.float32)
+            owners = np.repeat(np.arange(len(meeting_ids)), [len(m) for m in matrices])
+            self._stacked = (matrix, owners, meeting_ids)
+        return self._stacked
+
+    def top_meetings(self, query_embedding, n=20, meeting_ids=None):
+        """
+        질문과 가장 관련 있는 회의 top-N 선택
+
+        Args:
+            query_embedding (list[float]): 쿼리 임베딩
+            n (int): 선택할 회의 수
+            meeting_ids (list, optional): 검색 대상 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            list[tuple]: [(meeting_id, score), ...] (점수 내림차순)
+        """
+        with self._lock:
+            matrix, owners, all_meeting_ids = self._stack()
+
+        if len(matrix) == 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape[0] != matrix.shape[1]:
+            logger.warning(f"⚠️ centroid 차원({matrix.shape[1]})과 쿼리 차원({query.shape[0]})이 다릅니다.")
+            return []
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        # 회의별 최고 centroid 유사도
+        scores = np.full(len(all_meeting_ids), -np.inf, dtype=np.float32)
+        np.maximum.at(scores, owners, matrix @ query)
+
+        if meeting_ids is not None:
+            allowed = set(meeting_ids)
+            mask = np.fromiter((m in allowed for m in all_meeting_ids), dtype=bool, count=len(all_meeting_ids))
+            scores[~mask] = -np.inf
+
+        candidates = np.flatnonzero(np.isfinite(scores))
+        if len(candidates) > n:
+            candidates = candidates[np.argpartition(-scores[candidates], n - 1)[:n]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        return [(all_meeting_ids[i], float(scores[i])) for i in candidates]
@@ -0,0 +1,181 @@
+"""
+회의별 컨텍스트 캐시 모듈
+- 단일 회의 챗봇에서 회의 전사/요약 컨텍스트를 한 번만 업로드하고, 이후 질문은 캐시를 참조
+- gemini: Gemini context caching API (caches.create → generate_content(cached_content=...))
+- local: 프로세스 메모리에 컨텍스트를 보관하고 요청마다 프롬프트 앞에 붙이는 대체 구현 (개발/테스트용)
+- 회의 변경 번호가 바뀌면 컨텍스트를 다시 만들고, 내용 해시가 달라졌을 때만 캐시를 새로 생성
+"""
+import hashlib
+import threading
+import time
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiContextCacheBackend:
+    """Gemini context caching API 백엔드"""
+
+    def __init__(self, client, model, ttl):
+        """
+        Args:
+            client (genai.Client): Gemini API 클라이언트
+            model (str): 캐시를 사용할 모델 이름
+            ttl (int): 캐시 유효 시간 (초)
+        """
+        from google.genai import types
+
+        self.client = client
+        self.model = model
+        self.ttl = ttl
+        self._types = types
+
+    def create(self, display_name, system_instruction, context):
+        """컨텍스트 캐시 생성 후 캐시 이름 반환"""
+        cache = self.client.caches.create(
+            model=self.model,
+            config=self._types.CreateCachedContentConfig(
+                display_name=display_name,
+                system_instruction=system_instruction,
+                contents=[context],
+                ttl=f"{self.ttl}s"
+            )
+        )
+        return cache.name
+
+    def delete(self, name):
+        """컨텍스트 캐시 삭제"""
+        self.client.caches.delete(name=name)
+
+    def request(self, name, prompt):
+        """
+        generate_content / generate_content_stream 호출 인자
+
+        Args:
+            name (str): 캐시 이름
+            prompt (str): 질문 프롬프트
+
+        Returns:
+            dict: {'model', 'contents', 'config'}
+        """
+        return {
+            'model': self.model,
+            'contents': prompt,
+            'config': self._types.GenerateContentConfig(cached_content=name)
+        }
+
+
+class LocalContextCacheBackend:
+    """프로세스 메모리 대체 백엔드 (요청마다 컨텍스트를 프롬프트 앞에 붙여 전송)"""
+
+    def __init__(self, model):
+        """
+        Args:
+            model (str): 답변 생성 모델 이름
+        """
+        self.model = model
+        self._contexts = {}    # name -> (system_instruction, context)
+
+    def create(self, display_name, system_instruction, context):
+        name = f"local/{display_name}/{uuid.uuid4().hex[:8]}"
+        self._contexts[name] = (system_instruction, context)
+        return name
+
+    def delete(self, name):
+        self._contexts.pop(name, None)
+
+    def request(self, name, prompt):
+        system_instruction, context = self._contexts[name]
+        return {
+            'model': self.model,
+            'contents': f"{system_instruction}\n\n---\n\n{context}\n\n---\n\n{prompt}"
+        }
+
+
+class MeetingContextCache:
+    """회의별 컨텍스트 캐시 관리 (meeting_id + 내용 버전 기준)"""
+
+    def __init__(self, backend, ttl):
+        """
+        Args:
+            backend (GeminiContextCacheBackend or LocalContextCacheBackend): 캐시 백엔드
+            ttl (int): 캐시 유효 시간 (초) - 만료 직전 캐시는 새로 생성
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self._entries = {}          # meeting_id -> {'name', 'revision', 'content_hash', 'expires_at'}
+        self._locks = {}            # meeting_id -> 생성 중복 방지 락
+        self._lock = threading.Lock()
+
+    def _meeting_lock(self, meeting_id):
+        with self._lock:
+            return self._locks.setdefault(meeting_id, threading.Lock())
+
+    def get_or_create(self, meeting_id, revision, loader):
+        """
+        회의 컨텍스트 캐시 이름 조회 (없거나 만료/변경되었으면 생성)
+
+        Args:
+            meeting_id (str): 회의 ID
+            revision (int): 회의 변경 번호 (같으면 컨텍스트를 다시 만들지 않음)
+            loader (callable): () -> (system_instruction, context) 또는 None (캐시 사용 불가)
+
+        Returns:
+            str or None: 캐시 이름 (캐시를 사용할 수 없으면 None)
+        """
+        with self._meeting_lock(meeting_id):
+            entry = self._entries.get(meeting_id)
+            # 만료 1분 전부터는 새로 생성 (요청 도중 만료 방지)
+            alive = entry is not None and entry['expires_at'] - 60 > time.time()
+            if alive and entry['revision'] == revision:
+                return entry['name']
+
+            loaded = loader()
+            if loaded is None:
+                self._drop(meeting_id)
+                return None
+
+            system_instruction, context = loaded
+            content_hash = hashlib.sha1(f"{system_instruction}\n{context}".encode('utf-8')).hexdigest()
+            if alive and entry['content_hash'] == content_hash:
+                entry['revision'] = revision
+                return entry['name']
+
+            self._drop(meeting_id)
+            name = self.backend.create(f"meeting-{meeting_id}", system_instruction, context)
+            self._entries[meeting_id] = {
+                'name': name,
+                'revision': revision,
+                'content_hash': content_hash,
+                'expires_at': time.time() + self.ttl
+            }
+            logger.info(f"🗂️ 회의 컨텍스트 캐시 생성: {meeting_id} → {name}")
+            return name
+
+    def _drop(self, meeting_id):
+        entry = self._entries.pop(meeting_id, None)
+        if entry is None:
+            return
+        try:
+            self.backend.delete(entry['name'])
+        except Exception as e:
+            # 이미 만료된 캐시 등 - 다음 생성에는 영향 없음
+            logger.warning(f"⚠️ 회의 컨텍스트 캐시 삭제 실패 ({entry['name']}): {e}")
+
+    def invalidate(self, meeting_id=None):
+        """
+        회의 컨텍스트 캐시 삭제
+
+        Args:
+            meeting_id (str, optional): 회의 ID (None이면 전체 삭제)
+        """
+        meeting_ids = [meeting_id] if meeting_id else list(self._entries)
+        for target in meeting_ids:
+            if target in self._entries:
+                with self._meeting_lock(target):
+                    self._drop(target)
+
+    def request(self, name, prompt):
+        """캐시를 참조하는 generate_content 호출 인자"""
+        return self.backend.request(name, prompt)
@@ -0,0 +1,184 @@
+"""
+회의록 생성 프롬프트 입력 조립 모듈
+- 원문은 회의 스크립트 하나만 사용 (청크 텍스트는 같은 내용이므로 함께 보내지 않음)
+- 문단 요약이 스크립트와 거의 같은 내용이면 중복으로 제외
+- 토큰 예산 우선순위: 템플릿(고정) > 문단 요약(예산의 일부까지) > 스크립트
+- 스크립트가 예산을 넘으면 처음/끝/중간 순으로 회의 전체에 고르게 구간을 남기고 나머지는 중략 표시
+  (긴 구간은 미리 길이로 나누고, 남은 예산에 들어가지 않는 구간은 앞부분만 잘라서 포함)
+"""
+import re
+from collections import deque
+
+from utils.context_packer import estimate_tokens, shingles, overlap_ratio
+
+OMISSION_MARKER = "(…중략…)"
+
+_SENTENCE_PATTERN = re.compile(r'(?<=[.!?。])\s+|\n+')
+_SECTION_PATTERN = re.compile(r'\n(?=### )')
+
+# 구간 하나의 최대 글자 수 (문장 부호 없는 긴 스크립트도 고르게 남길 수 있도록 분할)
+MAX_SEGMENT_CHARS = 500
+
+
+def _split_long_segment(segment, max_chars):
+    """max_chars보다 긴 구간을 가능하면 공백 위치에서 나눔"""
+    pieces = []
+    while len(segment) > max_chars:
+        cut = segment.rfind(' ', max_chars // 2, max_chars + 1)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(segment[:cut].strip())
+        segment = segment[cut:].strip()
+    if segment:
+        pieces.append(segment)
+    return pieces
+
+
+def split_transcript(transcript, max_chars=MAX_SEGMENT_CHARS):
+    """
+    스크립트를 잘라낼 수 있는 구간 단위로 분리
+
+    Args:
+        transcript (str or list[str]): 스크립트 문자열 또는 발화 세그먼트 목록
+        max_chars (int): 구간 최대 글자 수 (넘으면 길이로 나눔)
+
+    Returns:
+        list[str]: 빈 구간을 제외한 구간 목록
+    """
+    if isinstance(transcript, str):
+        transcript = _SENTENCE_PATTERN.split(transcript)
+    segments = []
+    for segment in transcript:
+        if segment and segment.strip():
+            segments.extend(_split_long_segment(segment.strip(), max_chars))
+    return segments
+
+
+def _spread_order(count):
+    """처음, 끝, 가운데, 사분점 ... 순서로 인덱스 나열 (앞쪽 일부만 골라도 회의 전체가 고르게 포함되도록)"""
+    if count <= 0:
+        return []
+    order = [0] if count == 1 else [0, count - 1]
+    ranges = deque([(0, count - 1)])
+    while ranges:
+        low, high = ranges.popleft()
+        if high - low < 2:
+            continue
+        middle = (low + high) // 2
+        order.append(middle)
+        ranges.append((low, middle))
+        ranges.append((middle, high))
+    return order
+
+
+def _truncate_to_tokens(text, budget):
+    """텍스트 앞부분을 토큰 예산 안으로 자름 (글자 수 비율로 자른 뒤 넘치면 더 줄임)"""
+    tokens = estimate_tokens(text)
+    if tokens <= budget:
+        return text
+    if budget <= 0:
+        return ""
+    cut = int(len(text) * budget / tokens)
+    while cut > 0 and estimate_tokens(text[:cut]) > budget:
+        cut = int(cut * 0.9)
+    return text[:cut].rstrip()
+
+
+def _trim_summary(summary, budget):
+    """소주제(### 단위)를 앞에서부터 예산만큼 유지 (첫 소주제도 넘치면 앞부분만 자름)"""
+    kept, used = [], 0
+    for section in _SECTION_PATTERN.split(summary):
+        tokens = estimate_tokens(section)
+        if used + tokens > budget:
+            if not kept:
+                kept.append(_truncate_to_tokens(section, budget))
+            break
+        kept.append(section)
+        used += tokens
+    return "\n".join(kept).strip()
+
+
+def _trim_transcript(segments, budget):
+    """회의 전체에 고르게 퍼지도록 구간을 골라 예산 안으로 줄이고 빠진 부분은 중략 표시"""
+    segment_tokens = [estimate_tokens(segment) for segment in segments]
+    marker_tokens = estimate_tokens(OMISSION_MARKER)
+
+    kept, used = {}, 0
+    for index in _spread_order(len(segments)):
+        # 구간마다 중략 표시 하나가 붙을 수 있으므로 함께 계산
+        remaining = budget - used - marker_tokens
+        if remaining <= 0:
+            break
+        if segment_tokens[index] <= remaining:
+            kept[index] = segments[index]
+            used += segment_tokens[index] + marker_tokens
+            continue
+        # 들어가지 않는 구간은 남은 예산만큼 앞부분을 잘라서 포함하고 종료
+        truncated = _truncate_to_tokens(segments[index], remaining)
+        if truncated:
+            kept[index] = truncated
+        break
+
+    parts, omitted = [], False
+    for index in range(len(segments)):
+        if index in kept:
+            parts.append(kept[index])
+            omitted = kept[index] is not segments[index]
+            if omitted:
+                parts.append(OMISSION_MARKER)
+        elif not omitted:
+            parts.append(OMISSION_MARKER)
+            omitted = True
+    return " ".join(parts), len(kept)
+
+
+def pack_minutes_sources(transcript, summary_content, token_budget, summary_max_share=0.3,
+                         dedup_threshold=0.6):
+    """
+    회의록 프롬프트에 들어갈 스크립트와 문단 요약을 토큰 예산 안으로 조립합니다.
+
+    Args:
+        transcript (str or list[str]): 회의 스크립트 (문자열 또는 발화 세그먼트 목록)
+        summary_content (str): 문단 요약 (없으면 빈 문자열)
+        token_budget (int): 스크립트 + 요약에 쓸 토큰 예산 (템플릿 제외)
+        summary_max_share (float): 요약이 쓸 수 있는 최대 예산 비율
+        dedup_threshold (float): 요약과 스크립트의 겹침 비율이 이 값 이상이면 요약 제외
+
+    Returns:
+        tuple: (transcript_text, summary_text, stats)
+               - stats: {'tokens', 'budget', 'transcript_tokens', 'summary_tokens',
+                         'segments', 'kept_segments', 'summary_duplicate', 'summary_trimmed'}
+    """
+    segments = split_transcript(transcript)
+    transcript_text = " ".join(segments)
+    summary_text = (summary_content or "").strip()
+
+    summary_duplicate = bool(summary_text and transcript_text) and overlap_ratio(
+        shingles(summary_text), shingles(transcript_text)
+    ) >= dedup_threshold
+    if summary_duplicate:
+        summary_text = ""
+
+    summary_trimmed = False
+    summary_budget = int(token_budget * summary_max_share)
+    if estimate_tokens(summary_text) > summary_budget:
+        summary_text = _trim_summary(summary_text, summary_budget)
+        summary_trimmed = True
+    summary_tokens = estimate_tokens(summary_text)
+
+    kept_segments = len(segments)
+    transcript_budget = token_budget - summary_tokens
+    if estimate_tokens(transcript_text) > transcript_budget:
+        transcript_text, kept_segments = _trim_transcript(segments, transcript_budget)
+    transcript_tokens = estimate_tokens(transcript_text)
+
+    return transcript_text, summary_text, {
+        'tokens': transcript_tokens + summary_tokens,
+        'budget': token_budget,
+        'transcript_tokens': transcript_tokens,
+        'summary_tokens': summary_tokens,
+        'segments': len(segments),
+        'kept_segments': kept_segments,
+        'summary_duplicate': summary_duplicate,
+        'summary_trimmed': summary_trimmed
+    }
@@ -0,0 +1,73 @@
+"""
+키셋(Keyset) 페이지네이션 유틸리티 모듈
+- 커서 토큰 인코딩/디코딩
+- limit 파라미터 파싱
+"""
+import base64
+import json
+
+
+def encode_cursor(*values):
+    """
+    정렬 키 값들을 URL-safe 커서 토큰으로 인코딩
+
+    Args:
+        *values: 마지막 항목의 정렬 키 값 (예: meeting_date, meeting_id)
+
+    Returns:
+        str: base64url 인코딩된 커서 토큰
+    """
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, size):
+    """
+    커서 토큰을 정렬 키 값 리스트로 디코딩
+
+    Args:
+        token (str): encode_cursor()로 생성된 토큰
+        size (int): 기대하는 키 개수
+
+    Returns:
+        list: 정렬 키 값 리스트
+
+    Raises:
+        ValueError: 토큰 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise ValueError("잘못된 커서 토큰입니다.")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("잘못된 커서 토큰입니다.")
+
+    return values
+
+
+def parse_limit(value, default, maximum):
+    """
+    limit 쿼리 파라미터 파싱 (1 ~ maximum 범위로 보정)
+
+    Args:
+        value (str or None): 요청 파라미터 값
+        default (int): 값이 없을 때 사용할 기본값
+        maximum (int): 허용 최대값
+
+    Returns:
+        int: 보정된 limit 값
+
+    Raises:
+        ValueError: 숫자가 아닌 경우
+    """
+    if value is None or str(value).strip() == "":
+        return default
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("limit은 숫자여야 합니다.")
+
+    return max(1, min(limit, maximum))
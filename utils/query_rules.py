@@ -0,0 +1,115 @@
+"""
+검색 질문 규칙 기반 파싱 모듈
+- 날짜 표현 추출 (2025-11-07, 2025.11.07, 2025년 11월 7일, 11월 7일, 오늘, 어제, 그저께)
+- 따옴표로 묶인 문구 추출 (회의 제목 후보)
+- 답변을 바꾸는 질문 조건(날짜, 숫자, 따옴표 문구) 추출 (시맨틱 답변 캐시 적중 조건)
+- SelfQuery LLM 호출 없이 자주 쓰는 필터 패턴을 처리하기 위해 사용
+"""
+import datetime
+import re
+
+_DATE_PATTERNS = [
+    # 2025-11-07, 2025.11.07, 2025/11/07
+    re.compile(r'(?P<year>\d{4})\s*[-./]\s*(?P<month>\d{1,2})\s*[-./]\s*(?P<day>\d{1,2})'),
+    # 2025년 11월 7일, 11월 7일
+    re.compile(r'(?:(?P<year>\d{4})\s*년\s*)?(?P<month>\d{1,2})\s*월\s*(?P<day>\d{1,2})\s*일'),
+]
+
+_RELATIVE_DAYS = {'오늘': 0, '어제': 1, '그저께': 2, '그제': 2}
+_RELATIVE_PATTERN = re.compile('|'.join(sorted(_RELATIVE_DAYS, key=len, reverse=True)))
+
+_NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+
+_QUOTED_PATTERN = re.compile(r'["“”\'‘’「」『』]([^"“”\'‘’「」『』]{2,50})["“”\'‘’「」『』]')
+
+
+def extract_dates(query, today=None):
+    """
+    질문에서 날짜 표현을 추출합니다.
+
+    Args:
+        query (str): 사용자 질문
+        today (datetime.date, optional): 상대 날짜 기준일 (기본값: 오늘)
+
+    Returns:
+        list[tuple]: [((year or None, month, day), (start, end)), ...] - 날짜와 질문 내 위치
+    """
+    today = today or datetime.date.today()
+    dates = []
+    taken = []
+
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(query):
+            if any(match.start() < end and start < match.end() for start, end in taken):
+                continue
+
+            year = int(match.group('year')) if match.group('year') else None
+            month, day = int(match.group('month')), int(match.group('day'))
+            try:
+                datetime.date(year or 2000, month, day)
+            except ValueError:
+                continue
+
+            dates.append(((year, month, day), match.span()))
+            taken.append(match.span())
+
+    for match in _RELATIVE_PATTERN.finditer(query):
+        date = today - datetime.timedelta(days=_RELATIVE_DAYS[match.group()])
+        dates.append(((date.year, date.month, date.day), match.span()))
+
+    return dates
+
+
+def extract_quoted_phrases(query):
+    """
+    질문에서 따옴표로 묶인 문구를 추출합니다.
+
+    Args:
+        query (str): 사용자 질문
+
+    Returns:
+        list[tuple]: [(phrase, (start, end)), ...]
+    """
+    return [(match.group(1).strip(), match.span()) for match in _QUOTED_PATTERN.finditer(query)]
+
+
+def extract_query_constraints(query, today=None):
+    """
+    답변을 바꾸는 질문 조건을 추출합니다.
+    "3월 회의" / "4월 회의"처럼 날짜, 숫자, 이름만 다른 질문은 임베딩이 거의 같으므로
+    캐시 답변을 재사용하려면 이 값이 정확히 같아야 합니다.
+
+    Args:
+        query (str): 사용자 질문
+        today (datetime.date, optional): 상대 날짜 기준일 (기본값: 오늘)
+
+    Returns:
+        tuple: (dates, numbers, phrases) - 각각 정렬된 튜플 (상대 날짜는 실제 날짜로 변환)
+    """
+    dates = tuple(sorted({date for date, _ in extract_dates(query, today)}, key=str))
+    numbers = tuple(sorted({number.replace(',', '') for number in _NUMBER_PATTERN.findall(query)}))
+    phrases = tuple(sorted({phrase.lower() for phrase, _ in extract_quoted_phrases(query)}))
+    return dates, numbers, phrases
+
+
+def remove_spans(query, spans):
+    """
+    질문에서 필터로 사용한 구간을 제거해 검색용 질문을 만듭니다.
+
+    Args:
+        query (str): 사용자 질문
+        spans (list[tuple]): 제거할 (start, end) 구간 목록
+
+    Returns:
+        str: 구간을 제거하고 공백을 정리한 질문 (남는 내용이 없으면 원래 질문)
+    """
+    parts = []
+    position = 0
+    for start, end in sorted(spans):
+        if start >= position:
+            parts.append(query[position:start])
+            position = end
+    parts.append(query[position:])
+
+    cleaned = re.sub(r'\s+', ' ', ' '.join(parts)).strip()
+    return cleaned or query
@@ -0,0 +1,215 @@
+"""
+챗봇 시맨틱 답변 캐시 모듈
+- 검색 범위(접근 가능한 회의 집합)별로 질문 임베딩과 답변을 저장
+- 새 질문의 임베딩이 저장된 질문과 유사도 임계값 이상이고 질문 조건(날짜, 숫자, 따옴표 문구)이 같으면 저장된 답변 재사용
+- 회의별 변경 번호(revision)로 범위 버전을 계산해, 범위 안의 회의가 수정/재요약/삭제되면 자동 무효화
+"""
+import hashlib
+import threading
+import time
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class MeetingRevisionTracker:
+    """회의별 변경 번호 (Vector DB 저장/수정/삭제 시 증가)"""
+
+    def __init__(self):
+        self._revisions = {}    # meeting_id -> 변경 횟수 (삭제된 회의도 유지해 합계가 줄지 않도록)
+        self._total = 0         # 전체 변경 횟수 (전체 범위 검색용 버전)
+        self._listeners = []    # 변경 시 호출할 함수 (meeting_id, 전체 변경이면 None)
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener):
+        """
+        회의 변경 알림 등록
+
+        Args:
+            listener (callable): listener(meeting_id) - 전체 변경이면 meeting_id=None
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, meeting_id):
+        for listener in self._listeners:
+            try:
+                listener(meeting_id)
+            except Exception as e:
+                logger.warning(f"⚠️ 회의 변경 알림 처리 실패: {e}")
+
+    def bump(self, meeting_id):
+        """회의 변경 기록"""
+        with self._lock:
+            self._revisions[meeting_id] = self._revisions.get(meeting_id, 0) + 1
+            self._total += 1
+        self._notify(meeting_id)
+
+    def bump_all(self):
+        """전체 변경 기록 (컬렉션 전체 삭제, 인덱스 버전 교체 등 회의를 특정할 수 없는 경우)"""
+        with self._lock:
+            self._total += 1
+            self._revisions['*'] = self._revisions.get('*', 0) + 1
+        self._notify(None)
+
+    def get_revision(self, meeting_id):
+        """
+        회의 변경 번호 (전체 변경 포함)
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            int: 변경 번호
+        """
+        return self.scope_version([meeting_id])
+
+    def scope_version(self, meeting_ids=None):
+        """
+        검색 범위 버전 (범위 안의 회의가 하나라도 바뀌면 값이 증가)
+
+        Args:
+            meeting_ids (list, optional): 검색 범위 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            int: 범위 버전
+        """
+        with self._lock:
+            if meeting_ids is None:
+                return self._total
+            # 변경 번호는 증가만 하므로 합계가 같으면 범위 안에 변경이 없었음
+            return self._revisions.get('*', 0) + sum(self._revisions.get(meeting_id, 0) for meeting_id in meeting_ids)
+
+
+class SemanticAnswerCache:
+    """검색 범위별 시맨틱 답변 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize=256, entries_per_scope=64, ttl=86400, threshold=0.95):
+        """
+        Args:
+            maxsize (int): 최대 검색 범위 수 (초과 시 가장 오래 사용하지 않은 범위부터 제거)
+            entries_per_scope (int): 범위별 최대 질문 수
+            ttl (float): 답변 만료 시간 (초)
+            threshold (float): 캐시 적중으로 볼 최소 코사인 유사도
+        """
+        self.maxsize = maxsize
+        self.entries_per_scope = entries_per_scope
+        self.ttl = ttl
+        self.threshold = threshold
+        self._scopes = OrderedDict()    # scope_key -> {'version': int, 'entries': [(unit_vector, expires_at, constraints, value)]}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def scope_key(meeting_ids=None):
+        """
+        검색 범위 키 (meeting_id 순서와 무관)
+
+        Args:
+            meeting_ids (list, optional): 검색 범위 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            str: 범위 키
+        """
+        if meeting_ids is None:
+            return '*'
+        return hashlib.sha1('\n'.join(sorted(set(meeting_ids))).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _normalize(embedding):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self, scope_key, version, embedding, constraints=None):
+        """
+        유사한 질문의 저장된 답변 조회
+
+        Args:
+            scope_key (str): 검색 범위 키
+            version (int): 현재 범위 버전 (저장 시 버전과 다르면 범위 전체 무효화)
+            embedding (list[float]): 질문 임베딩
+            constraints (hashable, optional): 질문 조건 (저장 시 조건과 정확히 같은 답변만 적중)
+
+        Returns:
+            tuple or None: (저장된 값, 유사도), 미스면 None
+        """
+        query_vector = self._normalize(embedding)
+        now = time.monotonic()
+
+        with self._lock:
+            scope = self._scopes.get(scope_key)
+            if scope is not None and scope['version'] != version:
+                del self._scopes[scope_key]
+                scope = None
+
+            if scope is not None:
+                scope['entries'] = [entry for entry in scope['entries'] if entry[1] > now]
+
+            # 날짜, 숫자, 이름만 다른 질문은 임베딩이 거의 같으므로 조건이 같은 답변만 비교
+            candidates = [entry for entry in scope['entries'] if entry[2] == constraints] if scope else []
+            if not candidates:
+                self.misses += 1
+                return None
+
+            self._scopes.move_to_end(scope_key)
+            similarities = np.stack([entry[0] for entry in candidates]) @ query_vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return candidates[best][3], float(similarities[best])
+
+    def set(self, scope_key, version, embedding, value, constraints=None):
+        """
+        답변 저장
+
+        Args:
+            scope_key (str): 검색 범위 키
+            version (int): 답변 생성 전에 읽은 범위 버전 (생성 중 변경이 있었다면 조회 시 무효화됨)
+            embedding (list[float]): 질문 임베딩
+            value: 저장할 답변 (dict 등)
+            constraints (hashable, optional): 질문 조건 (get()과 같은 형식)
+        """
+        entry = (self._normalize(embedding), time.monotonic() + self.ttl, constraints, value)
+
+        with self._lock:
+            scope = self._scopes.get(scope_key)
+            if scope is not None and scope['version'] > version:
+                # 답변 생성 중 범위가 변경됨 → 오래된 답변은 저장하지 않음
+                return
+            if scope is None or scope['version'] != version:
+                scope = {'version': version, 'entries': []}
+                self._scopes[scope_key] = scope
+
+            scope['entries'].append(entry)
+            del scope['entries'][:-self.entries_per_scope]
+            self._scopes.move_to_end(scope_key)
+            while len(self._scopes) > self.maxsize:
+                self._scopes.popitem(last=False)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._scopes.clear()
+
+    def get_stats(self):
+        """
+        캐시 적중률 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'scopes', 'entries'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'scopes': len(self._scopes),
+            'entries': sum(len(scope['entries']) for scope in self._scopes.values())
+        }
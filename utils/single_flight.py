@@ -0,0 +1,145 @@
+"""
+요청 합치기(single-flight) 모듈
+- 같은 키로 동시에 들어온 작업은 먼저 온 요청(leader) 하나만 실행하고, 나머지는 완료를 기다렸다가 같은 결과를 받음
+- 키는 (작업 종류, 회의 ID, 입력 버전) 형태로 구성 → 입력이 바뀌면 다른 작업으로 취급
+- 결과를 캐싱하지 않음 (작업이 끝나면 키를 바로 제거, 이후 요청은 새로 실행)
+- 동기(Flask 스레드)와 비동기(ASGI 이벤트 루프) 호출이 같은 키로 합쳐짐
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+def content_version(*parts):
+    """
+    입력 내용으로 작업 버전 해시 생성
+
+    Args:
+        *parts: 작업 입력 (JSON 직렬화 가능한 값)
+
+    Returns:
+        str: SHA-1 해시
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def file_version(path, block_size=1024 * 1024):
+    """
+    파일 내용으로 작업 버전 해시 생성
+
+    Args:
+        path (str): 파일 경로
+        block_size (int): 읽기 단위 (바이트)
+
+    Returns:
+        str: SHA-1 해시
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """진행 중인 작업을 키별로 공유 (스레드 안전)"""
+
+    def __init__(self):
+        self._calls = {}    # key -> concurrent.futures.Future
+        self._lock = threading.Lock()
+        self._stats = {'executed': 0, 'coalesced': 0}
+
+    def _join(self, key):
+        """진행 중인 작업에 참여 (없으면 새 Future를 등록하고 leader가 됨)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats['coalesced'] += 1
+                logger.info(f"🔗 진행 중인 작업에 합류: {key[:2] if isinstance(key, tuple) else key}")
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self._stats['executed'] += 1
+            return future, True
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key, fn):
+        """
+        동기 작업 실행 (같은 키가 진행 중이면 그 결과를 기다림)
+
+        Args:
+            key (hashable): 작업 키 (작업 종류, 회의 ID, 입력 버전)
+            fn (callable): 인자 없는 작업 함수
+
+        Returns:
+            작업 결과 (leader가 예외로 끝나면 기다린 요청도 같은 예외 발생)
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key, future)
+            future.set_exception(e)
+            raise
+        self._forget(key, future)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key, coro_fn):
+        """
+        비동기 작업 실행 (do()와 같은 키 공간 공유)
+
+        leader 요청이 취소(클라이언트 연결 끊김)되어도 작업은 끝까지 실행되어
+        기다리던 요청들은 결과를 받습니다.
+
+        Args:
+            key (hashable): 작업 키 (작업 종류, 회의 ID, 입력 버전)
+            coro_fn (callable): 인자 없이 코루틴을 반환하는 함수
+
+        Returns:
+            작업 결과
+        """
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(coro_fn())
+
+            def _finish(done):
+                self._forget(key, future)
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    future.set_exception(done.exception())
+                else:
+                    future.set_result(done.result())
+
+            task.add_done_callback(_finish)
+
+        # 대기 중인 요청이 취소되어도 공유 Future는 취소되지 않도록 shield
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def get_stats(self):
+        """
+        통계 조회
+
+        Returns:
+            dict: {'in_flight', 'executed', 'coalesced'}
+        """
+        with self._lock:
+            return {'in_flight': len(self._calls), **self._stats}
+
+
+# 전역 인스턴스 (생성/임베딩/STT 작업 공용)
+single_flight = SingleFlight()
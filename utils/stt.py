@@ -1,10 +1,15 @@
 import os
+import asyncio
+import copy
 import json
 import logging
 from google import genai
 from google.genai import types
 
 from config import config
+from utils.single_flight import single_flight, file_version
+from utils.context_packer import estimate_tokens
+from utils.minutes_prompt import pack_minutes_sources
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +48,27 @@ class STTManager:
         
     
     def transcribe_audio(self, audio_path):
+        """
+        Google Gemini STT API로 음성 인식
+        같은 오디오 파일(내용 기준)의 인식 요청이 동시에 들어오면 한 번만 인식하고 결과를 공유합니다.
+
+        Args:
+            audio_path (str): 오디오 파일 경로
+
+        Returns:
+            list or None: 세그먼트 리스트 (실패 시 None)
+        """
+        try:
+            version = file_version(audio_path)
+        except OSError as e:
+            logger.error(f"❌ 오디오 파일 읽기 실패: {e}")
+            return None
+
+        segments = single_flight.do(('stt', version), lambda: self._transcribe_audio(audio_path))
+        # 호출자가 세그먼트를 수정해도 다른 요청의 결과에 영향이 없도록 복사본 반환
+        return copy.deepcopy(segments)
+
+    def _transcribe_audio(self, audio_path):
         """Google Gemini STT API로 음성 인식"""
         try:
             import threading
@@ -168,7 +194,8 @@ class STTManager:
             logger.error(f"❌ Gemini 오류 발생: {e}")
             return None
 
-    def subtopic_generate(self, title: str, transcript_text: str):
+    def _build_subtopic_prompt(self, title: str, transcript_text: str) -> str:
+        """문단 요약 생성 프롬프트 (동기/비동기 공통)"""
         prompt_text = f"""당신은 제공된 대화 스크립트 내용을 분석하여, 구조화된 주제별 요약본으로 변환하는 AI 어시스턴트입니다.
 
             **입력 파일 형식:**
@@ -201,6 +228,10 @@ class STTManager:
             작업 수행:
             이제 다음 [스크립트 내용]을 분석하여 위의 요구사항을 모두 준수하는 주제별 요약본을 생성해 주십시오.
             {transcript_text}"""
+        return prompt_text
+
+    def subtopic_generate(self, title: str, transcript_text: str):
+        prompt_text = self._build_subtopic_prompt(title, transcript_text)
 
         logger.debug(f"======prompt_text========")
         logger.debug(prompt_text)
@@ -238,18 +269,10 @@ class STTManager:
             logger.error(f"❌ Gemini 요약 생성 중 오류 발생: {e}")
             return None
 
-    def generate_minutes(self, title: str, transcript_text: str, summary_content: str, meeting_date: str):
+    def _build_minutes_prompt(self, title: str, transcript, summary_content: str, meeting_date: str) -> str:
         """
-        문단 요약을 기반으로 정식 회의록을 생성합니다.
-
-        Args:
-            title (str): 회의 제목
-            transcript_text (str): 원본 회의 스크립트
-            summary_content (str): 이미 생성된 문단 요약 내용
-            meeting_date (str): 회의 일시 (YYYY-MM-DD HH:MM:SS 형식)
-
-        Returns:
-            str: 생성된 회의록 내용 (마크다운 형식)
+        회의록 생성 프롬프트 (동기/비동기 공통)
+        스크립트와 문단 요약은 MINUTES_PROMPT_TOKEN_BUDGET 안으로 조립하고, 전송 전에 토큰 수를 기록합니다.
         """
         # 날짜 포맷 변환: 2025-11-08 14:30:25 → 2025년 11월 08일 14시 30분
         from datetime import datetime
@@ -259,6 +282,29 @@ class STTManager:
         except:
             meeting_date_formatted = meeting_date  # 변환 실패 시 원본 사용
 
+        # 템플릿은 항상 포함, 남은 예산을 문단 요약 > 스크립트 순으로 사용
+        template_tokens = estimate_tokens(self._render_minutes_prompt(title, "", "", meeting_date_formatted))
+        transcript_text, summary_text, stats = pack_minutes_sources(
+            transcript,
+            summary_content,
+            config.MINUTES_PROMPT_TOKEN_BUDGET - template_tokens,
+            summary_max_share=config.MINUTES_SUMMARY_MAX_SHARE
+        )
+        prompt_text = self._render_minutes_prompt(title, transcript_text, summary_text, meeting_date_formatted)
+
+        logger.info(
+            f"📏 회의록 프롬프트: 약 {estimate_tokens(prompt_text)} 토큰 "
+            f"(예산 {config.MINUTES_PROMPT_TOKEN_BUDGET}, 템플릿 {template_tokens}, "
+            f"요약 {stats['summary_tokens']}{' - 스크립트와 중복되어 제외' if stats['summary_duplicate'] else ''}"
+            f"{' - 일부 생략' if stats['summary_trimmed'] else ''}, "
+            f"스크립트 {stats['transcript_tokens']} - {stats['kept_segments']}/{stats['segments']}구간)"
+        )
+        return prompt_text
+
+    @staticmethod
+    def _render_minutes_prompt(title: str, transcript_text: str, summary_content: str, meeting_date_formatted: str) -> str:
+        """회의록 생성 프롬프트 본문"""
+        summary_content = summary_content or "(문단 요약 없음 - 회의 스크립트를 참고하세요)"
         prompt_text = f"""당신은 회의록을 전문적으로 작성하는 AI 어시스턴트입니다.
 아래 제공되는 "회의 스크립트"와 "문단 요약"을 분석하여, 주어진 "마크다운 템플릿"의 각 항목을 채워주세요.
 
@@ -327,6 +373,22 @@ class STTManager:
 - {{}}는 실제 내용으로 채워서 표시하지 마세요.
 ##############################
 """
+        return prompt_text
+
+    def generate_minutes(self, title: str, transcript_text, summary_content: str, meeting_date: str):
+        """
+        문단 요약을 기반으로 정식 회의록을 생성합니다.
+
+        Args:
+            title (str): 회의 제목
+            transcript_text (str or list[str]): 원본 회의 스크립트 (문자열 또는 발화 세그먼트 목록)
+            summary_content (str): 이미 생성된 문단 요약 내용
+            meeting_date (str): 회의 일시 (YYYY-MM-DD HH:MM:SS 형식)
+
+        Returns:
+            str: 생성된 회의록 내용 (마크다운 형식)
+        """
+        prompt_text = self._build_minutes_prompt(title, transcript_text, summary_content, meeting_date)
 
         logger.debug(f"======회의록 생성 prompt========")
         logger.debug(prompt_text[:500] + "...")
@@ -360,6 +422,76 @@ class STTManager:
             logger.error(f"❌ Gemini 회의록 생성 중 오류 발생: {e}")
             return None
 
+    def _get_async_client(self):
+        """비동기 Gemini 클라이언트 (연결 풀 재사용을 위해 한 번만 생성)"""
+        if getattr(self, '_aio_client', None) is None:
+            api_key = config.GOOGLE_API_KEY
+            if not api_key:
+                raise ValueError("GOOGLE_API_KEY가 .env 파일에 설정되지 않았습니다.")
+            self._aio_client = genai.Client(api_key=api_key).aio
+        return self._aio_client
+
+    async def _agenerate_text(self, prompt_text: str, model: str = "gemini-2.5-pro"):
+        """비동기 Gemini 호출 (대기 중에 스레드를 점유하지 않음)"""
+        response = await self._get_async_client().models.generate_content(
+            model=model,
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=[
+                        types.Part.from_text(text=prompt_text),
+                    ],
+                ),
+            ],
+        )
+        return response.text.strip()
+
+    async def asubtopic_generate(self, title: str, transcript_text: str):
+        """
+        subtopic_generate의 비동기 버전 (ASGI 엔드포인트용)
+
+        Args:
+            title (str): 회의 제목
+            transcript_text (str): 회의 스크립트
+
+        Returns:
+            str or None: 주제별 요약 (실패 시 None)
+        """
+        logger.info("🤖 Gemini를 통해 요약 생성 중... (async)")
+        try:
+            summary_content = await self._agenerate_text(self._build_subtopic_prompt(title, transcript_text))
+            logger.info("✅ Gemini 요약 생성 완료.")
+            return summary_content
+        except Exception as e:
+            logger.error(f"❌ Gemini 요약 생성 중 오류 발생: {e}", exc_info=True)
+            return None
+
+    async def agenerate_minutes(self, title: str, transcript_text, summary_content: str, meeting_date: str):
+        """
+        generate_minutes의 비동기 버전 (ASGI 엔드포인트용)
+
+        Args:
+            title (str): 회의 제목
+            transcript_text (str or list[str]): 원본 회의 스크립트 (문자열 또는 발화 세그먼트 목록)
+            summary_content (str): 이미 생성된 문단 요약 내용
+            meeting_date (str): 회의 일시 (YYYY-MM-DD HH:MM:SS 형식)
+
+        Returns:
+            str or None: 생성된 회의록 내용 (실패 시 None)
+        """
+        logger.info("🤖 Gemini를 통해 회의록 생성 중... (async)")
+        try:
+            # 긴 스크립트는 프롬프트 조립(중복 판정/예산 맞춤)에 수백 ms가 걸리므로 이벤트 루프 밖에서 실행
+            prompt_text = await asyncio.to_thread(
+                self._build_minutes_prompt, title, transcript_text, summary_content, meeting_date
+            )
+            minutes_content = await self._agenerate_text(prompt_text)
+            logger.info("✅ Gemini 회의록 생성 완료.")
+            return minutes_content
+        except Exception as e:
+            logger.error(f"❌ Gemini 회의록 생성 중 오류 발생: {e}", exc_info=True)
+            return None
+
     @staticmethod
     def parse_script(script_text):
         """
@@ -0,0 +1,91 @@
+"""
+전사 응답 포맷 유틸리티 모듈
+- 컬럼형(compact) 전사 포맷 변환
+- Accept-Encoding에 따른 JSON 응답 압축 (brotli / gzip, 전사 응답은 포맷과 관계없이 기본 적용)
+"""
+import gzip
+import json
+import logging
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 이 크기(바이트)보다 작은 응답은 압축하지 않음
+COMPRESS_MIN_BYTES = 1024
+
+
+def to_compact_transcript(segments):
+    """
+    세그먼트 리스트를 컬럼형 포맷으로 변환합니다.
+    화자 라벨은 사전(speakers)으로 인코딩하고 각 컬럼은 병렬 배열로 반환합니다.
+
+    Args:
+        segments (list): {'segment_id', 'speaker_label', 'start_time', 'segment', 'confidence'} dict 리스트
+
+    Returns:
+        dict: {
+            'speakers': [라벨, ...],
+            'segment_id': [...],
+            'speaker': [speakers 인덱스, ...],
+            'start_time': [...],
+            'confidence': [...],
+            'segment': [...]
+        }
+    """
+    speakers = []
+    speaker_index = {}
+    columns = {
+        'segment_id': [],
+        'speaker': [],
+        'start_time': [],
+        'confidence': [],
+        'segment': []
+    }
+
+    for seg in segments:
+        label = seg['speaker_label']
+        index = speaker_index.get(label)
+        if index is None:
+            index = speaker_index[label] = len(speakers)
+            speakers.append(label)
+
+        columns['segment_id'].append(seg['segment_id'])
+        columns['speaker'].append(index)
+        columns['start_time'].append(seg['start_time'])
+        columns['confidence'].append(seg['confidence'])
+        columns['segment'].append(seg['segment'])
+
+    return {'speakers': speakers, **columns}
+
+
+def compact_json_response(payload, status=200):
+    """
+    공백 없는 JSON 응답을 만들고, 클라이언트가 지원하면 brotli/gzip으로 압축합니다.
+    (brotli 패키지가 설치되지 않은 경우 gzip만 사용)
+
+    Args:
+        payload (dict): 응답 데이터
+        status (int): HTTP 상태 코드
+
+    Returns:
+        Response: JSON 응답
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    headers = {'Vary': 'Accept-Encoding'}
+
+    if len(body) >= COMPRESS_MIN_BYTES:
+        accepted = request.accept_encodings
+        if brotli is not None and accepted['br']:
+            body = brotli.compress(body, quality=5)
+            headers['Content-Encoding'] = 'br'
+        elif accepted['gzip']:
+            body = gzip.compress(body, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+
+    return Response(body, status=status, mimetype='application/json', headers=headers)
@@ -0,0 +1,94 @@
+"""
+TTL(만료 시간) LRU 캐시 모듈
+- 최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 항목별 만료 시간 (조회 시 만료된 항목은 미스 처리)
+- 스레드 안전, 적중률 통계
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """프로세스 내 TTL LRU 캐시"""
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        """
+        Args:
+            maxsize (int): 최대 항목 수
+            ttl (float): 항목 만료 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        캐시 조회 (만료된 항목은 삭제 후 미스 처리)
+
+        Args:
+            key: 캐시 키
+            default: 미스 시 반환할 값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl (float, optional): 이 항목의 만료 시간 (기본값: 캐시 TTL)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """캐시 항목 삭제"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[1] if entry is not None else default
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        캐시 적중률 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'size'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'size': len(self._entries)
+        }
@@ -11,6 +11,7 @@ import sqlite3
 from typing import Optional, Dict, List
 
 from config import config
+from utils.pagination import encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -179,96 +180,160 @@ def can_access_meeting(user_id: int, meeting_id: str) -> bool:
         conn.close()
 
 
-def get_user_meetings(user_id: int) -> List[Dict]:
+def _build_meeting_page(rows, limit: int) -> Dict:
     """
-    사용자가 작성한 회의 목록 조회 (본인 노트만)
+    조회 결과(limit + 1개)를 페이지 응답으로 변환
+
+    Args:
+        rows: meetings 테이블 조회 결과
+        limit: 페이지 크기
+
+    Returns:
+        {'meetings': [...], 'next_cursor': str or None}
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    # 'meeting_date'를 'date'로 키 이름 변경 (템플릿 호환성)
+    result = []
+    for meeting in rows:
+        meeting_dict = dict(meeting)
+        meeting_dict['date'] = meeting_dict.pop('meeting_date', None)
+        result.append(meeting_dict)
+
+    next_cursor = None
+    if has_more and result:
+        last = result[-1]
+        next_cursor = encode_cursor(last['date'], last['meeting_id'])
+
+    return {'meetings': result, 'next_cursor': next_cursor}
+
+
+def _append_meeting_filters(conditions: List[str], params: List, cursor_token: str = None,
+                            date_from: str = None, date_to: str = None, title_prefix: str = None):
+    """
+    meetings 테이블(별칭 m) 조회 조건에 커서/날짜/제목 접두어 필터 추가
+
+    Raises:
+        ValueError: 커서 토큰이 올바르지 않은 경우
+    """
+    if cursor_token:
+        last_date, last_meeting_id = decode_cursor(cursor_token, 2)
+        conditions.append("(m.meeting_date, m.meeting_id) < (?, ?)")
+        params.extend([last_date, last_meeting_id])
+
+    if date_from:
+        conditions.append("m.meeting_date >= ?")
+        params.append(date_from)
+
+    if date_to:
+        conditions.append("m.meeting_date <= ?")
+        params.append(date_to)
+
+    if title_prefix:
+        # LIKE 대신 범위 비교를 사용하여 와일드카드 이스케이프 없이 접두어 검색
+        conditions.append("m.title >= ? AND m.title < ?")
+        params.extend([title_prefix, title_prefix + chr(0x10FFFF)])
+
+
+def get_user_meetings(user_id: int, limit: int = None, cursor_token: str = None,
+                      date_from: str = None, date_to: str = None, title_prefix: str = None) -> Dict:
+    """
+    사용자가 작성한 회의 목록 조회 (본인 노트만, 키셋 페이지네이션)
 
     조건:
     - Admin: 모든 노트
     - User: 본인이 생성한 노트만 (공유받은 노트는 get_shared_meetings()에서 조회)
+
+    정렬: (meeting_date, meeting_id) 내림차순
+
+    Args:
+        user_id: 사용자 ID
+        limit: 페이지 크기 (기본값: config.NOTES_PAGE_SIZE)
+        cursor_token: 이전 페이지 응답의 next_cursor
+        date_from: 시작 일시 ("YYYY-MM-DD HH:MM:SS", 포함)
+        date_to: 종료 일시 ("YYYY-MM-DD HH:MM:SS", 포함)
+        title_prefix: 제목 접두어
+
+    Returns:
+        {'meetings': [...], 'next_cursor': str or None}
+
+    Raises:
+        ValueError: 커서 토큰이 올바르지 않은 경우
     """
+    limit = limit or config.NOTES_PAGE_SIZE
+    conditions = []
+    params = []
+
+    if not is_admin(user_id):
+        conditions.append("m.owner_id = ?")
+        params.append(user_id)
+
+    _append_meeting_filters(conditions, params, cursor_token, date_from, date_to, title_prefix)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
     conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        if is_admin(user_id):
-            # Admin: 모든 노트 (meeting_dialogues에서 고유한 meeting_id 조회)
-            cursor.execute("""
-                SELECT
-                    meeting_id,
-                    title,
-                    MAX(meeting_date) as meeting_date,
-                    (SELECT audio_file FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as audio_file,
-                    (SELECT owner_id FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as owner_id
-                FROM meeting_dialogues md
-                GROUP BY meeting_id
-                ORDER BY meeting_date DESC
-            """)
-        else:
-            # User: 본인이 작성한 노트만
-            cursor.execute("""
-                SELECT
-                    meeting_id,
-                    title,
-                    MAX(meeting_date) as meeting_date,
-                    (SELECT audio_file FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as audio_file,
-                    (SELECT owner_id FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as owner_id
-                FROM meeting_dialogues md
-                WHERE (SELECT owner_id FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) = ?
-                GROUP BY meeting_id
-                ORDER BY meeting_date DESC
-            """, (user_id,))
-
-        meetings = cursor.fetchall()
-        # 'meeting_date'를 'date'로 키 이름 변경 (템플릿 호환성)
-        result = []
-        for meeting in meetings:
-            meeting_dict = dict(meeting)
-            meeting_dict['date'] = meeting_dict.pop('meeting_date', None)
-            result.append(meeting_dict)
-        return result
+        cursor.execute(f"""
+            SELECT m.meeting_id, m.title, m.meeting_date, m.audio_file, m.owner_id,
+                   st.segment_count, st.duration_seconds
+            FROM meetings m
+            LEFT JOIN meeting_stats st ON st.meeting_id = m.meeting_id
+            {where_clause}
+            ORDER BY m.meeting_date DESC, m.meeting_id DESC
+            LIMIT ?
+        """, (*params, limit + 1))
+
+        return _build_meeting_page(cursor.fetchall(), limit)
 
     finally:
         conn.close()
 
 
-def get_shared_meetings(user_id: int) -> List[Dict]:
+def get_shared_meetings(user_id: int, limit: int = None, cursor_token: str = None,
+                        date_from: str = None, date_to: str = None, title_prefix: str = None) -> Dict:
     """
-    사용자가 공유받은 회의 목록만 조회 (본인 노트 제외)
+    사용자가 공유받은 회의 목록만 조회 (본인 노트 제외, 키셋 페이지네이션)
 
     Args:
         user_id: 사용자 ID
+        limit: 페이지 크기 (기본값: config.NOTES_PAGE_SIZE)
+        cursor_token: 이전 페이지 응답의 next_cursor
+        date_from: 시작 일시 ("YYYY-MM-DD HH:MM:SS", 포함)
+        date_to: 종료 일시 ("YYYY-MM-DD HH:MM:SS", 포함)
+        title_prefix: 제목 접두어
 
     Returns:
-        공유받은 회의 목록 (meeting_id, title, meeting_date, audio_file)
+        {'meetings': [...], 'next_cursor': str or None}
+
+    Raises:
+        ValueError: 커서 토큰이 올바르지 않은 경우
     """
+    limit = limit or config.NOTES_PAGE_SIZE
+    conditions = ["s.shared_with_user_id = ?"]
+    params = [user_id]
+
+    _append_meeting_filters(conditions, params, cursor_token, date_from, date_to, title_prefix)
+
     conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        # 공유받은 노트만 조회 (owner_id != user_id)
-        cursor.execute("""
-            SELECT DISTINCT
-                md.meeting_id,
-                md.title,
-                MAX(md.meeting_date) as meeting_date,
-                (SELECT audio_file FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as audio_file,
-                (SELECT owner_id FROM meeting_dialogues WHERE meeting_id = md.meeting_id LIMIT 1) as owner_id
-            FROM meeting_dialogues md
-            INNER JOIN meeting_shares s ON md.meeting_id = s.meeting_id
-            WHERE s.shared_with_user_id = ?
-            GROUP BY md.meeting_id
-            ORDER BY meeting_date DESC
-        """, (user_id,))
-
-        meetings = cursor.fetchall()
-        # 'meeting_date'를 'date'로 키 이름 변경 (템플릿 호환성)
-        result = []
-        for meeting in meetings:
-            meeting_dict = dict(meeting)
-            meeting_dict['date'] = meeting_dict.pop('meeting_date', None)
-            result.append(meeting_dict)
-        return result
+        cursor.execute(f"""
+            SELECT m.meeting_id, m.title, m.meeting_date, m.audio_file, m.owner_id,
+                   st.segment_count, st.duration_seconds
+            FROM meeting_shares s
+            INNER JOIN meetings m ON m.meeting_id = s.meeting_id
+            LEFT JOIN meeting_stats st ON st.meeting_id = m.meeting_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY m.meeting_date DESC, m.meeting_id DESC
+            LIMIT ?
+        """, (*params, limit + 1))
+
+        return _build_meeting_page(cursor.fetchall(), limit)
 
     finally:
         conn.close()
@@ -482,3 +547,62 @@ def can_edit_meeting(user_id: int, meeting_id: str) -> bool:
 
     finally:
         conn.close()
+
+
+def get_user_settings(user_id: int) -> Dict:
+    """
+    사용자별 설정 조회 (저장된 값이 없으면 config 기본값)
+
+    Args:
+        user_id: 사용자 ID
+
+    Returns:
+        {
+            'minutes_precompute': bool,  # 실제 적용되는 값
+            'minutes_precompute_override': bool or None  # 저장된 값 (None이면 서버 기본값을 따름)
+        }
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT minutes_precompute FROM user_settings WHERE user_id = ?", (user_id,))
+        row = cursor.fetchone()
+        stored = row['minutes_precompute'] if row else None
+        override = None if stored is None else bool(stored)
+        return {
+            'minutes_precompute': config.MINUTES_PRECOMPUTE_DEFAULT if override is None else override,
+            'minutes_precompute_override': override
+        }
+    finally:
+        conn.close()
+
+
+def update_user_settings(user_id: int, minutes_precompute: Optional[bool]) -> Dict:
+    """
+    사용자별 설정 저장
+
+    Args:
+        user_id: 사용자 ID
+        minutes_precompute: 업로드 후 회의록 미리 생성 여부 (None이면 config 기본값을 따름)
+
+    Returns:
+        저장 후 설정 (get_user_settings와 같은 형식)
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            INSERT INTO user_settings (user_id, minutes_precompute, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(user_id) DO UPDATE SET
+                minutes_precompute = excluded.minutes_precompute,
+                updated_at = CURRENT_TIMESTAMP
+        """, (user_id, None if minutes_precompute is None else int(minutes_precompute)))
+        conn.commit()
+        logger.info(f"✅ 사용자 설정 저장: user_id={user_id}, minutes_precompute={minutes_precompute}")
+    finally:
+        conn.close()
+
+    return get_user_settings(user_id)
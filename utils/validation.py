@@ -1,8 +1,11 @@
 """
 회의록 입력 검증 및 날짜/시간 처리 모듈
 """
+import re
 import datetime
 
+_CONVERSATION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
 
 def validate_title(title):
     """
@@ -21,6 +24,47 @@ def validate_title(title):
     return True, None
 
 
+def validate_batch_questions(questions, max_questions):
+    """
+    일괄 질문 목록 검증
+
+    Args:
+        questions (list): 요청의 질문 목록
+        max_questions (int): 최대 질문 수
+
+    Returns:
+        tuple: (questions, error_message)
+            - questions (list[str]): 앞뒤 공백을 제거한 질문 목록 (검증 실패 시 None)
+            - error_message (str): 에러 메시지 (검증 실패 시)
+    """
+    if not isinstance(questions, list) or not questions:
+        return None, "질문 목록을 입력해주세요."
+    if len(questions) > max_questions:
+        return None, f"질문은 한 번에 최대 {max_questions}개까지 보낼 수 있습니다."
+
+    cleaned = [question.strip() if isinstance(question, str) else "" for question in questions]
+    if not all(cleaned):
+        return None, "빈 질문이 포함되어 있습니다."
+    return cleaned, None
+
+
+def validate_conversation_id(conversation_id):
+    """
+    챗봇 대화 ID 검증 (클라이언트가 생성한 UUID 등)
+
+    Args:
+        conversation_id (str): 요청의 대화 ID (없으면 대화 기록 없이 처리)
+
+    Returns:
+        tuple: (is_valid, error_message)
+    """
+    if conversation_id is None:
+        return True, None
+    if not isinstance(conversation_id, str) or not _CONVERSATION_ID_PATTERN.match(conversation_id):
+        return False, "대화 ID 형식이 올바르지 않습니다."
+    return True, None
+
+
 def get_current_datetime_string():
     """
     현재 날짜와 시간을 문자열로 반환
@@ -53,3 +97,34 @@ def parse_meeting_date(meeting_date):
     except ValueError:
         # 파싱 실패 시 현재 시간 반환
         return get_current_datetime_string()
+
+
+def parse_date_filter(value, end_of_day=False):
+    """
+    목록 조회용 날짜 필터 파싱
+
+    Args:
+        value (str): "YYYY-MM-DD" 또는 "YYYY-MM-DDTHH:MM[:SS]" 형식의 날짜
+        end_of_day (bool): 날짜만 주어졌을 때 하루의 끝(23:59:59)으로 보정할지 여부
+
+    Returns:
+        str or None: "YYYY-MM-DD HH:MM:SS" 형식 문자열, 입력이 없으면 None
+
+    Raises:
+        ValueError: 날짜 형식이 올바르지 않은 경우
+    """
+    if not value or value.strip() == "":
+        return None
+
+    value = value.strip()
+    try:
+        if len(value) == 10:
+            date = datetime.date.fromisoformat(value)
+            time = datetime.time(23, 59, 59) if end_of_day else datetime.time(0, 0, 0)
+            dt = datetime.datetime.combine(date, time)
+        else:
+            dt = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"잘못된 날짜 형식입니다: {value}")
+
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
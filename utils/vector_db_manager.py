@@ -3,8 +3,12 @@ import chromadb
 import os
 import re
 import logging
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+import threading
+import functools
+import inspect
+from langchain_openai import ChatOpenAI
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 
 from langchain_classic.retrievers.self_query.base import SelfQueryRetriever
 from langchain_classic.chains.query_constructor.base import AttributeInfo
@@ -14,9 +18,46 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 import numpy as np
 
 from config import config
+from utils.embedding_cache import CachedEmbeddings, QueryEmbeddingLRU, normalize_text
+from utils.embedding_backends import create_embedding_backend
+from utils.bm25_index import BM25Index, reciprocal_rank_fusion
+from utils.flat_vector_store import FlatVectorStore
+from utils.meeting_centroid_index import MeetingCentroidIndex, compute_meeting_centroids
+from utils.query_rules import extract_dates, extract_quoted_phrases, remove_spans
+from utils.ttl_cache import TTLCache
+from utils.index_versions import IndexVersionStore, IndexSwapGate
+from utils.assembled_text_cache import AssembledTextCache
+from utils.semantic_answer_cache import MeetingRevisionTracker
+from utils.single_flight import single_flight, content_version
 
 logger = logging.getLogger(__name__)
 
+
+def _index_write(method):
+    """저장/삭제 메서드가 활성 인덱스 교체와 겹치지 않도록 게이트를 적용합니다."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.index_gate.writing():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _coalesced(operation):
+    """같은 회의·같은 내용의 저장 요청이 동시에 들어오면 한 번만 임베딩/저장하고 결과를 공유합니다."""
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            key = (operation, arguments['meeting_id'], content_version(
+                {name: value for name, value in arguments.items() if name != 'self'}
+            ))
+            return single_flight.do(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
 class VectorDBManager:
     _instance = None
     _initialized = False
@@ -24,6 +65,7 @@ class VectorDBManager:
     COLLECTION_NAMES = {
         'chunks': 'meeting_chunks',
         'subtopic': 'meeting_subtopic',
+        'centroids': 'meeting_centroids',
     }
 
     def __new__(cls, *args, **kwargs):
@@ -34,27 +76,81 @@ class VectorDBManager:
     def __init__(self, persist_directory="./database/vector_db", upload_folder="./uploads", db_manager=None):
         if self._initialized:
             return
-        if not config.OPENAI_API_KEY:
+        self.embedding_backend = config.EMBEDDING_BACKEND
+        if self.embedding_backend == 'openai' and not config.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        self.client = chromadb.PersistentClient(path=persist_directory)
-        self.embedding_function = OpenAIEmbeddings()
+        self.embedding_function, self.embedding_backend_id = create_embedding_backend(
+            self.embedding_backend, dim=config.LOCAL_EMBEDDING_DIM
+        )
+        self.document_embedding_cache = None
+        if config.EMBEDDING_CACHE_ENABLED and self.embedding_backend == 'openai':
+            # 동일 텍스트 재임베딩 방지 (요약 재생성, 재인덱싱, 동일 파일 재업로드)
+            self.document_embedding_cache = CachedEmbeddings(
+                self.embedding_function,
+                config.EMBEDDING_CACHE_PATH,
+                dtype=config.EMBEDDING_CACHE_DTYPE
+            )
+            self.embedding_function = self.document_embedding_cache
+
+        # 최근 쿼리 임베딩 LRU (반복 질문, 컬렉션별 검색 시 재임베딩 방지)
+        self.query_embedding_cache = QueryEmbeddingLRU(
+            self.embedding_function, maxsize=config.QUERY_EMBEDDING_CACHE_SIZE
+        )
+        self.embedding_function = self.query_embedding_cache
         self.upload_folder = upload_folder
 
         # DatabaseManager 인스턴스 (외부에서 주입받음, SQLite 삭제를 위해)
         self.db_manager = db_manager
 
-        # Initialize LLM for SelfQueryRetriever
-        self.llm = ChatOpenAI(api_key=config.OPENAI_API_KEY, temperature=0)
-
-        self.vectorstores = {
-            key: Chroma(
-                client=self.client,
-                collection_name=name,
-                embedding_function=self.embedding_function,
+        # Initialize LLM for SelfQueryRetriever (키가 없으면 self_query는 similarity로 폴백)
+        self.llm = ChatOpenAI(api_key=config.OPENAI_API_KEY, temperature=0) if config.OPENAI_API_KEY else None
+
+        # 인덱스 버전 (활성 버전이 없으면 버전 없는 기존 컬렉션 사용)
+        self.index_versions = IndexVersionStore(config.VECTOR_INDEX_STATE_PATH)
+        active_version = self.index_versions.get_active_version(self.embedding_backend)
+        self.index_version = active_version['version'] if active_version else None
+        self.chunking_params = active_version['params'] if active_version else self.get_configured_chunking_params()
+        if active_version and active_version['embedding_backend_id'] != self.embedding_backend_id:
+            logger.warning(
+                f"⚠️ 활성 인덱스 {self.index_version}은(는) '{active_version['embedding_backend_id']}' 임베딩으로 "
+                f"구축되었습니다 (현재: '{self.embedding_backend_id}'). 재인덱싱이 필요합니다."
             )
-            for key, name in self.COLLECTION_NAMES.items()
-        }
+
+        # 재인덱싱 완료 시 활성 버전 교체와 저장/삭제 작업이 겹치지 않도록 하는 게이트
+        self.index_gate = IndexSwapGate()
+
+        # 백엔드/버전별 컬렉션 이름 (벡터 공간이 다른 임베딩이 섞이지 않도록 분리)
+        self.collection_names = self._resolve_collection_names(self.embedding_backend, self.index_version)
+
+        # 벡터 엔진 선택 (chroma: HNSW / flat: 메모리 매핑 NumPy 전수 검색)
+        self.vector_engine = config.VECTOR_ENGINE
+        if self.vector_engine == 'chroma':
+            self.client = chromadb.PersistentClient(path=persist_directory)
+        elif self.vector_engine == 'flat':
+            self.client = None
+        else:
+            raise ValueError(f"지원하지 않는 벡터 엔진입니다: {self.vector_engine}. 'chroma' 또는 'flat'을 선택하세요.")
+        self.vectorstores = self.open_vectorstores(self.collection_names)
+        self._check_collection_backends()
+
+        # 하이브리드 검색용 BM25 인덱스 (첫 hybrid 검색 시 컬렉션에서 구축, 이후 증분 갱신)
+        self.bm25_indexes = {}
+        self._bm25_lock = threading.Lock()
+
+        # 회의별 변경 번호 (챗봇 답변 캐시 무효화용)
+        self.meeting_revisions = MeetingRevisionTracker()
+
+        # 회의별 결합 텍스트 캐시 (요약 탭/회의록 생성 시 Vector DB 조회 없이 응답)
+        self.assembled_text_cache = AssembledTextCache(
+            config.ASSEMBLED_TEXT_CACHE_PATH, maxsize=config.ASSEMBLED_TEXT_CACHE_SIZE
+        )
+
+        # 2단계 검색용 회의 centroid 인덱스 (백그라운드 스레드에서 로드, 이후 증분 갱신)
+        # 로드가 끝나기 전에는 1단계(후보 회의 선택)를 건너뛰고 전체 검색
+        self.centroid_index = None
+        self._centroid_lock = threading.Lock()
+        self._centroid_loading = False
 
         # Define metadata field information for SelfQueryRetriever
         self.metadata_field_infos = {
@@ -99,10 +195,415 @@ class VectorDBManager:
             "subtopic": "회의록의 요약된 하위 주제",
         }
 
-        logger.info(f"✅ VectorDBManager for collections {list(self.COLLECTION_NAMES.values())} initialized.")
+        # SelfQueryRetriever는 컬렉션별로 한 번만 생성, LLM이 만든 구조화 쿼리(검색어 + 필터)는 TTL 캐시
+        self.self_query_retrievers = {}
+        self._self_query_lock = threading.Lock()
+        self.self_query_cache = TTLCache(maxsize=config.SELF_QUERY_CACHE_SIZE, ttl=config.SELF_QUERY_CACHE_TTL)
+
+        logger.info(f"✅ VectorDBManager for collections {list(self.collection_names.values())} initialized (embedding: {self.embedding_backend_id}).")
 
         self._initialized = True
 
+    def _resolve_collection_names(self, backend, version=None):
+        """
+        임베딩 백엔드/인덱스 버전별 컬렉션 이름을 반환합니다.
+        버전이 있으면 'meeting_chunks_v3' 형식, 없으면 기존 이름을 사용합니다
+        (기본 백엔드(openai)는 기존 컬렉션 이름 그대로, 그 외 백엔드는 '__백엔드' 접미사).
+
+        Args:
+            backend (str): 임베딩 백엔드 이름
+            version (str, optional): 인덱스 버전 (예: 'v3')
+
+        Returns:
+            dict: {db_type: collection_name}
+        """
+        if version is not None:
+            # 버전 번호는 백엔드와 무관하게 전역으로 증가하므로 이름이 겹치지 않음
+            return {key: f"{name}_{version}" for key, name in self.COLLECTION_NAMES.items()}
+        if backend == 'openai':
+            return dict(self.COLLECTION_NAMES)
+        return {key: f"{name}__{backend}" for key, name in self.COLLECTION_NAMES.items()}
+
+    def open_vectorstores(self, collection_names):
+        """
+        현재 벡터 엔진으로 컬렉션들을 엽니다 (없으면 생성).
+
+        Args:
+            collection_names (dict): {db_type: collection_name}
+
+        Returns:
+            dict: {db_type: VectorStore}
+        """
+        collection_metadata = {'embedding_backend': self.embedding_backend_id}
+
+        if self.vector_engine == 'chroma':
+            return {
+                key: Chroma(
+                    client=self.client,
+                    collection_name=name,
+                    embedding_function=self.embedding_function,
+                    collection_metadata=collection_metadata,
+                )
+                for key, name in collection_names.items()
+            }
+
+        return {
+            key: FlatVectorStore(
+                config.FLAT_INDEX_FOLDER / name,
+                self.embedding_function,
+                dtype=config.FLAT_INDEX_DTYPE,
+                collection_metadata=collection_metadata,
+                compact_ratio=config.FLAT_INDEX_COMPACT_RATIO,
+            )
+            for key, name in collection_names.items()
+        }
+
+    @staticmethod
+    def get_configured_chunking_params():
+        """
+        설정 파일의 청킹 파라미터 (새 인덱스 버전 생성 시 기록)
+
+        Returns:
+            dict: {'chunk_size', 'chunk_overlap', 'time_gap_threshold'}
+        """
+        return {
+            'chunk_size': config.CHUNK_SIZE,
+            'chunk_overlap': config.CHUNK_OVERLAP,
+            'time_gap_threshold': config.TIME_GAP_THRESHOLD_SECONDS,
+        }
+
+    def swap_index_version(self, version):
+        """
+        활성 인덱스 버전을 교체합니다. 진행 중인 검색은 기존 컬렉션으로 끝나고,
+        이후 검색/저장은 새 버전 컬렉션을 사용합니다 (기존 버전 컬렉션은 롤백용으로 유지).
+
+        Args:
+            version (str): 활성화할 인덱스 버전
+
+        Returns:
+            str or None: 이전 활성 버전
+        """
+        record = self.index_versions.get_version(version)
+        if record is None:
+            raise ValueError(f"존재하지 않는 인덱스 버전입니다: {version}")
+
+        collection_names = self._resolve_collection_names(record['embedding_backend'], version)
+        vectorstores = self.open_vectorstores(collection_names)
+
+        with self.index_gate.exclusive():
+            previous = self.index_versions.activate(version)
+
+            self.collection_names = collection_names
+            self.vectorstores = vectorstores
+            self.index_version = version
+            self.chunking_params = record['params']
+
+            # 컬렉션에 묶인 인덱스/리트리버는 새 버전 기준으로 다시 구축
+            self.bm25_indexes = {}
+            self.centroid_index = None
+            self.self_query_retrievers = {}
+            self.self_query_cache.clear()
+            self.assembled_text_cache.clear()
+            self.meeting_revisions.bump_all()
+
+        logger.info(f"🔀 활성 인덱스 교체: {previous or '(버전 없음)'} → {version} {list(collection_names.values())}")
+        return previous
+
+    def _invalidate_reindex_checkpoint(self, meeting_id):
+        """재인덱싱 중 변경된 회의의 체크포인트를 지워 다시 처리되도록 합니다."""
+        try:
+            building = self.index_versions.get_building_version(self.embedding_backend)
+            if building:
+                self.index_versions.clear_checkpoints(building['version'], [meeting_id])
+        except Exception as e:
+            logger.warning(f"⚠️ 재인덱싱 체크포인트 갱신 실패 (meeting_id: {meeting_id}): {e}")
+
+    def _check_collection_backends(self):
+        """
+        각 컬렉션에 기록된 임베딩 백엔드 태그를 확인합니다.
+        태그가 없는 기존 컬렉션에는 현재 백엔드를 기록하고, 다른 백엔드로 만든 컬렉션이면 경고합니다.
+        """
+        for key, name in self.collection_names.items():
+            try:
+                collection = self.vectorstores[key]._collection
+                metadata = dict(collection.metadata or {})
+                tagged_backend = metadata.get('embedding_backend')
+
+                if tagged_backend is None:
+                    # hnsw:* 설정은 생성 후 변경할 수 없으므로 제외하고 태그만 추가
+                    metadata = {k: v for k, v in metadata.items() if not k.startswith('hnsw:')}
+                    metadata['embedding_backend'] = self.embedding_backend_id
+                    collection.modify(metadata=metadata)
+                elif tagged_backend != self.embedding_backend_id:
+                    logger.warning(
+                        f"⚠️ 컬렉션 '{name}'은(는) '{tagged_backend}' 임베딩으로 생성되었습니다 "
+                        f"(현재: '{self.embedding_backend_id}'). 재인덱싱이 필요합니다."
+                    )
+            except Exception as e:
+                logger.warning(f"⚠️ 컬렉션 '{name}' 임베딩 백엔드 태그 확인 실패: {e}")
+
+    def get_embedding_cache_stats(self):
+        """
+        임베딩 캐시 적중률 통계를 반환합니다.
+
+        Returns:
+            dict: {
+                'documents': CachedEmbeddings.get_stats() 결과 (캐시 비활성화 시 None),
+                'queries': QueryEmbeddingLRU.get_stats() 결과
+            }
+        """
+        return {
+            'documents': self.document_embedding_cache.get_stats() if self.document_embedding_cache else None,
+            'queries': self.query_embedding_cache.get_stats()
+        }
+
+    def embed_query(self, query):
+        """
+        검색 쿼리를 임베딩합니다 (LRU 캐시 적용).
+        여러 컬렉션을 검색할 때 한 번만 임베딩하고 search(query_embedding=...)로 전달합니다.
+
+        Args:
+            query (str): 검색 쿼리
+
+        Returns:
+            list[float]: 쿼리 임베딩 벡터
+        """
+        return self.embedding_function.embed_query(query)
+
+    def embed_queries(self, queries):
+        """
+        여러 검색 쿼리를 임베딩 API 1회 호출로 임베딩합니다 (LRU 적중분 제외).
+        결과가 LRU에 저장되므로 이후 embed_query()로 같은 쿼리를 조회해도 재임베딩하지 않습니다.
+
+        Args:
+            queries (list[str]): 검색 쿼리 목록
+
+        Returns:
+            list[list[float]]: 쿼리 순서와 동일한 임베딩 목록
+        """
+        return self.embedding_function.embed_queries(queries)
+
+    def _get_bm25_index(self, db_type):
+        """
+        컬렉션의 BM25 인덱스를 반환합니다. 아직 없으면 컬렉션 전체 문서로 구축합니다.
+
+        Args:
+            db_type (str): 'chunks' 또는 'subtopic'
+
+        Returns:
+            BM25Index: BM25 인덱스
+        """
+        index = self.bm25_indexes.get(db_type)
+        if index is not None:
+            return index
+
+        with self._bm25_lock:
+            index = self.bm25_indexes.get(db_type)
+            if index is not None:
+                return index
+
+            index = BM25Index()
+            collection = self.vectorstores[db_type]._collection
+            page_size = 5000
+            offset = 0
+
+            while True:
+                page = collection.get(include=["documents", "metadatas"], limit=page_size, offset=offset)
+                ids = page.get('ids') or []
+                if not ids:
+                    break
+
+                index.add_documents(
+                    ids,
+                    page['documents'],
+                    [(meta or {}).get('meeting_id') for meta in page['metadatas']],
+                    merge=False
+                )
+                offset += len(ids)
+
+            index.merge()
+            self.bm25_indexes[db_type] = index
+            logger.info(f"✅ BM25 인덱스 구축 완료: '{self.collection_names[db_type]}' ({len(index)}개 문서)")
+            return index
+
+    def _bm25_add(self, db_type, ids, texts, metadatas):
+        """구축된 BM25 인덱스에 문서를 추가합니다 (미구축 시 다음 구축 때 반영)."""
+        index = self.bm25_indexes.get(db_type)
+        if index is not None:
+            index.add_documents(ids, texts, [meta.get('meeting_id') for meta in metadatas])
+
+    def _bm25_remove_meeting(self, db_type, meeting_id):
+        """구축된 BM25 인덱스에서 회의 문서를 제거합니다."""
+        index = self.bm25_indexes.get(db_type)
+        if index is not None:
+            index.remove_meeting(meeting_id)
+
+    def _get_meeting_embeddings(self, meeting_id, vectorstores):
+        """회의의 청크 + 서브토픽 임베딩을 조회합니다 (청크는 시간 순 정렬)."""
+        embeddings = []
+        for db_type, order_key in (('chunks', 'chunk_index'), ('subtopic', 'summary_index')):
+            result = vectorstores[db_type]._collection.get(
+                where={'meeting_id': meeting_id},
+                include=['embeddings', 'metadatas']
+            )
+            vectors = result.get('embeddings')
+            if vectors is None or len(vectors) == 0:
+                continue
+
+            order = sorted(range(len(vectors)), key=lambda i: (result['metadatas'][i] or {}).get(order_key, 0))
+            embeddings.extend(vectors[i] for i in order)
+
+        return embeddings
+
+    def update_meeting_centroids(self, meeting_id, vectorstores=None):
+        """
+        회의 centroid를 다시 계산해서 centroid 컬렉션과 인덱스에 반영합니다.
+        청크/서브토픽 저장·삭제 후 호출되며, 실패해도 저장 흐름을 막지 않습니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+            vectorstores (dict, optional): 대상 컬렉션 (재인덱싱 중인 버전). 기본값은 활성 컬렉션
+        """
+        is_active = vectorstores is None
+        vectorstores = self.vectorstores if is_active else vectorstores
+        try:
+            centroids = compute_meeting_centroids(
+                self._get_meeting_embeddings(meeting_id, vectorstores),
+                max_centroids=config.MEETING_CENTROIDS_MAX,
+                chunks_per_centroid=config.CHUNKS_PER_CENTROID
+            )
+
+            collection = vectorstores['centroids']._collection
+            collection.delete(where={'meeting_id': meeting_id})
+
+            if centroids is None:
+                if is_active and self.centroid_index is not None:
+                    self.centroid_index.remove_meeting(meeting_id)
+                return
+
+            collection.upsert(
+                ids=[f"{meeting_id}_centroid_{i}" for i in range(len(centroids))],
+                embeddings=centroids.tolist(),
+                metadatas=[{'meeting_id': meeting_id, 'centroid_index': i} for i in range(len(centroids))]
+            )
+            if is_active and self.centroid_index is not None:
+                self.centroid_index.set_meeting(meeting_id, centroids)
+
+            logger.info(f"🎯 회의 centroid {len(centroids)}개 갱신 (meeting_id: {meeting_id})")
+        except Exception as e:
+            logger.warning(f"⚠️ 회의 centroid 갱신 실패 (meeting_id: {meeting_id}): {e}")
+
+    def _remove_meeting_centroids(self, meeting_id):
+        """centroid 컬렉션과 인덱스에서 회의를 제거합니다."""
+        try:
+            self.vectorstores['centroids']._collection.delete(where={'meeting_id': meeting_id})
+        except Exception as e:
+            logger.warning(f"⚠️ 회의 centroid 삭제 실패 (meeting_id: {meeting_id}): {e}")
+        if self.centroid_index is not None:
+            self.centroid_index.remove_meeting(meeting_id)
+
+    def _backfill_meeting_centroids(self, vectorstores):
+        """centroid가 없는 기존 회의의 centroid를 청크/서브토픽 컬렉션에서 계산합니다 (최초 1회)."""
+        meeting_ids = set()
+        for db_type in ('chunks', 'subtopic'):
+            collection = vectorstores[db_type]._collection
+            offset = 0
+            while True:
+                page = collection.get(include=['metadatas'], limit=5000, offset=offset)
+                ids = page.get('ids') or []
+                if not ids:
+                    break
+                meeting_ids.update((meta or {}).get('meeting_id') for meta in page['metadatas'])
+                offset += len(ids)
+
+        meeting_ids.discard(None)
+        logger.info(f"🔄 기존 회의 {len(meeting_ids)}개의 centroid 계산 중...")
+        for meeting_id in meeting_ids:
+            self.update_meeting_centroids(meeting_id, vectorstores=vectorstores)
+
+    def warm_centroid_index(self):
+        """
+        회의 centroid 인덱스 로드를 백그라운드 스레드로 시작합니다.
+        서버 시작 시, 그리고 인덱스가 비워진 뒤 첫 검색 시 호출되며 이미 로드 중이면 무시합니다.
+        """
+        with self._centroid_lock:
+            if self.centroid_index is not None or self._centroid_loading:
+                return
+            self._centroid_loading = True
+
+        threading.Thread(target=self._load_centroid_index, name="centroid-index", daemon=True).start()
+
+    def _load_centroid_index(self):
+        """centroid 컬렉션에서 인덱스를 로드합니다 (컬렉션이 비어 있으면 기존 회의 centroid 백필)."""
+        vectorstores = self.vectorstores
+        try:
+            collection = vectorstores['centroids']._collection
+            if collection.count() == 0 and vectorstores['chunks']._collection.count() > 0:
+                self._backfill_meeting_centroids(vectorstores)
+
+            index = MeetingCentroidIndex()
+            grouped = {}
+            offset = 0
+            while True:
+                page = collection.get(include=['embeddings', 'metadatas'], limit=5000, offset=offset)
+                ids = page.get('ids') or []
+                if not ids:
+                    break
+                for meta, embedding in zip(page['metadatas'], page['embeddings']):
+                    grouped.setdefault((meta or {}).get('meeting_id'), []).append(embedding)
+                offset += len(ids)
+
+            for meeting_id, centroids in grouped.items():
+                index.set_meeting(meeting_id, np.asarray(centroids, dtype=np.float32))
+
+            with self._centroid_lock:
+                # 로드 중에 활성 인덱스 버전이 교체되었으면 이전 버전 인덱스는 버림
+                if self.vectorstores is vectorstores:
+                    self.centroid_index = index
+            logger.info(f"✅ 회의 centroid 인덱스 로드 완료: {len(index)}개 회의")
+        except Exception as e:
+            logger.warning(f"⚠️ 회의 centroid 인덱스 로드 실패: {e}")
+        finally:
+            with self._centroid_lock:
+                self._centroid_loading = False
+
+    def _get_centroid_index(self):
+        """
+        회의 centroid 인덱스를 반환합니다. 아직 로드되지 않았으면 백그라운드 로드를 시작하고 None을 반환합니다.
+
+        Returns:
+            MeetingCentroidIndex or None: 회의 centroid 인덱스 (로드 전이면 None)
+        """
+        index = self.centroid_index
+        if index is None:
+            self.warm_centroid_index()
+        return index
+
+    def select_candidate_meetings(self, query_embedding, n, meeting_ids=None):
+        """
+        2단계 검색의 1단계: 질문과 가까운 회의 top-N을 centroid로 선택합니다.
+
+        Args:
+            query_embedding (list[float]): 쿼리 임베딩
+            n (int): 선택할 회의 수
+            meeting_ids (list, optional): 접근 가능한 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            list or None: 후보 meeting_id 목록 (인덱스를 사용할 수 없거나 로드 전이면 None)
+        """
+        index = self._get_centroid_index()
+        if index is None:
+            logger.info("ℹ️ 회의 centroid 인덱스 로드 중 (전체 검색으로 진행)")
+            return None
+
+        try:
+            ranked = index.top_meetings(query_embedding, n=n, meeting_ids=meeting_ids)
+        except Exception as e:
+            logger.warning(f"⚠️ 후보 회의 선택 실패 (전체 검색으로 진행): {e}")
+            return None
+
+        return [meeting_id for meeting_id, _ in ranked] or None
+
     def _clean_text(self, formatted_text: str) -> str:
         """
         정규표현식을 사용해서 [Speaker X, MM:SS] 형식의 정보를 제거합니다.
@@ -124,10 +625,13 @@ class VectorDBManager:
 
         return cleaned_text.strip()
 
+    @_coalesced('embed_chunks')
+    @_index_write
     def add_meeting_as_chunk(self, meeting_id, title, meeting_date, audio_file, segments):
         """
         회의 대화 내용을 스마트하게 청크로 묶어 DB에 저장합니다.
-        화자 변경, 시간 간격을 고려하여 청킹하며, Gemini를 사용해서 speaker와 시간 정보를 제거합니다.
+        화자 변경, 시간 간격을 고려하여 청킹하며, 정규표현식으로 speaker와 시간 정보를 제거합니다.
+        청킹 파라미터는 활성 인덱스 버전에 기록된 값을 사용합니다.
 
         Args:
             meeting_id (str): 회의 ID
@@ -137,28 +641,59 @@ class VectorDBManager:
             segments (list): 회의 대화 세그먼트 리스트
                 각 세그먼트는 {'speaker_label', 'start_time', 'segment', ...} 포함
         """
-        chunk_vdb = self.vectorstores['chunks']
+        chunk_texts, chunk_metadatas, chunk_ids = self.build_chunk_records(
+            meeting_id, title, meeting_date, audio_file, segments, self.chunking_params
+        )
+
+        # Vector DB에 추가
+        self.vectorstores['chunks'].add_texts(
+            texts=chunk_texts,
+            metadatas=chunk_metadatas,
+            ids=chunk_ids
+        )
+        self._bm25_add('chunks', chunk_ids, chunk_texts, chunk_metadatas)
+        self.assembled_text_cache.invalidate(meeting_id, kinds=('chunks',))
+        self.meeting_revisions.bump(meeting_id)
+
+        logger.info(f"✅ {len(chunk_ids)}개의 청크를 meeting_chunks DB에 저장 완료 (meeting_id: {meeting_id})")
+        self.update_meeting_centroids(meeting_id)
+
+    def build_chunk_records(self, meeting_id, title, meeting_date, audio_file, segments, params):
+        """
+        회의 세그먼트를 청크 텍스트/메타데이터/ID로 변환합니다 (저장과 재인덱싱에서 공통 사용).
+        스마트 청킹에 실패하면 RecursiveCharacterTextSplitter로 폴백합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+            title (str): 회의 제목
+            meeting_date (str): 회의 일시
+            audio_file (str): 오디오 파일명
+            segments (list): 회의 대화 세그먼트 리스트
+            params (dict): 청킹 파라미터 {'chunk_size', 'chunk_overlap', 'time_gap_threshold'}
+
+        Returns:
+            tuple: (chunk_texts, chunk_metadatas, chunk_ids)
+        """
+        # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
+        meeting_date_str = str(meeting_date) if meeting_date else ""
+        chunk_texts = []
+        chunk_metadatas = []
+        chunk_ids = []
 
         try:
             # 1. 스마트 청킹: 화자 변경과 시간 간격을 고려
-            chunks = self._create_smart_chunks(segments, max_chunk_size=1000, time_gap_threshold=60)
+            chunks = self._create_smart_chunks(
+                segments,
+                max_chunk_size=params['chunk_size'],
+                time_gap_threshold=params['time_gap_threshold']
+            )
 
             logger.info(f"📦 스마트 청킹으로 {len(chunks)}개의 청크 생성 완료")
 
             # 2. 정규표현식으로 각 청크의 텍스트 정제 (speaker와 시간 정보 제거)
             logger.info(f"🔧 정규표현식으로 텍스트 정제 중...")
-            for chunk in chunks:
-                chunk['text'] = self._clean_text(chunk['text'])
-
-            # 3. 각 청크를 Vector DB에 저장
-            chunk_texts = []
-            chunk_metadatas = []
-            chunk_ids = []
-
             for i, chunk_info in enumerate(chunks):
-                chunk_texts.append(chunk_info['text'])
-                # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
-                meeting_date_str = str(meeting_date) if meeting_date else ""
+                chunk_texts.append(self._clean_text(chunk_info['text']))
                 chunk_metadatas.append({
                     "meeting_id": meeting_id,
                     "dialogue_id": f"{meeting_id}_chunk_{i}",
@@ -172,71 +707,52 @@ class VectorDBManager:
                 })
                 chunk_ids.append(f"{meeting_id}_chunk_{i}")
 
-            # Vector DB에 추가
-            chunk_vdb.add_texts(
-                texts=chunk_texts,
-                metadatas=chunk_metadatas,
-                ids=chunk_ids
-            )
-
-            logger.info(f"✅ {len(chunks)}개의 스마트 청크를 meeting_chunks DB에 저장 완료 (meeting_id: {meeting_id})")
+            return chunk_texts, chunk_metadatas, chunk_ids
 
         except Exception as e:
             logger.warning(f"⚠️ 스마트 청킹 중 오류 발생: {e}")
             logger.info(f"📝 대신 기본 청킹 방식을 사용합니다.")
 
-            # 에러 발생 시 폴백: RecursiveCharacterTextSplitter 사용
-            formatted_segments = []
-            for seg in segments:
-                speaker = seg.get('speaker_label', 'Unknown')
-                start_time = seg.get('start_time', 0)
-                text = seg.get('segment', '')
-                minutes = int(start_time // 60)
-                seconds = int(start_time % 60)
-                time_str = f"{minutes:02d}:{seconds:02d}"
-                formatted_text = f"[Speaker {speaker}, {time_str}] {text}"
-                formatted_segments.append(formatted_text)
-
-            full_text = "\n".join(formatted_segments)
-
-            # RecursiveCharacterTextSplitter로 청킹
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200,
-                separators=["\n[Speaker", "\n\n", "\n", " ", ""]
-            )
-
-            split_chunks = text_splitter.split_text(full_text)
+        # 에러 발생 시 폴백: RecursiveCharacterTextSplitter 사용
+        chunk_texts, chunk_metadatas, chunk_ids = [], [], []
+        formatted_segments = []
+        for seg in segments:
+            speaker = seg.get('speaker_label', 'Unknown')
+            start_time = seg.get('start_time', 0)
+            text = seg.get('segment', '')
+            minutes = int(start_time // 60)
+            seconds = int(start_time % 60)
+            time_str = f"{minutes:02d}:{seconds:02d}"
+            formatted_text = f"[Speaker {speaker}, {time_str}] {text}"
+            formatted_segments.append(formatted_text)
 
-            # 정규표현식으로 텍스트 정제
-            logger.info(f"🔧 정규표현식으로 폴백 텍스트 정제 중...")
-            cleaned_chunks = [self._clean_text(chunk) for chunk in split_chunks]
+        full_text = "\n".join(formatted_segments)
 
-            chunk_texts = []
-            chunk_metadatas = []
-            chunk_ids = []
+        # RecursiveCharacterTextSplitter로 청킹
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=params['chunk_size'],
+            chunk_overlap=params['chunk_overlap'],
+            separators=["\n[Speaker", "\n\n", "\n", " ", ""]
+        )
 
-            for i, chunk_text in enumerate(cleaned_chunks):
-                chunk_texts.append(chunk_text)
-                # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
-                meeting_date_str = str(meeting_date) if meeting_date else ""
-                chunk_metadatas.append({
-                    "meeting_id": meeting_id,
-                    "dialogue_id": f"{meeting_id}_chunk_{i}",
-                    "chunk_index": i,
-                    "title": title,
-                    "meeting_date": meeting_date_str,
-                    "audio_file": audio_file
-                })
-                chunk_ids.append(f"{meeting_id}_chunk_{i}")
+        split_chunks = text_splitter.split_text(full_text)
 
-            chunk_vdb.add_texts(
-                texts=chunk_texts,
-                metadatas=chunk_metadatas,
-                ids=chunk_ids
-            )
+        # 정규표현식으로 텍스트 정제
+        logger.info(f"🔧 정규표현식으로 폴백 텍스트 정제 중...")
+        for i, chunk_text in enumerate(split_chunks):
+            chunk_texts.append(self._clean_text(chunk_text))
+            chunk_metadatas.append({
+                "meeting_id": meeting_id,
+                "dialogue_id": f"{meeting_id}_chunk_{i}",
+                "chunk_index": i,
+                "title": title,
+                "meeting_date": meeting_date_str,
+                "audio_file": audio_file
+            })
+            chunk_ids.append(f"{meeting_id}_chunk_{i}")
 
-            logger.info(f"✅ {len(split_chunks)}개의 청크를 meeting_chunks DB에 저장 완료 (폴백 모드)")
+        logger.info(f"📝 폴백 모드로 {len(chunk_ids)}개의 청크 생성 완료")
+        return chunk_texts, chunk_metadatas, chunk_ids
 
     def _create_smart_chunks(self, segments, max_chunk_size=1000, time_gap_threshold=60):
         """
@@ -319,6 +835,8 @@ class VectorDBManager:
         return chunks
 
 
+    @_coalesced('embed_subtopics')
+    @_index_write
     def add_meeting_as_subtopic(self, meeting_id, title, meeting_date, audio_file, summary_content):
         """스크립트 전체를 소주제별 청크로 DB에 저장합니다."""
 
@@ -367,7 +885,12 @@ class VectorDBManager:
 
         if chunk_texts:
             subtopic_vdb.add_texts(texts=chunk_texts, metadatas=chunk_metadatas, ids=chunk_ids)
+            self._bm25_add('subtopic', chunk_ids, chunk_texts, chunk_metadatas)
+            self.assembled_text_cache.invalidate(meeting_id, kinds=('subtopic',))
+            self.meeting_revisions.bump(meeting_id)
             logger.info(f"📄 요약 결과 {len(chunk_texts)}개를 Summary_Analysis_DB에 저장했습니다.")
+            self.update_meeting_centroids(meeting_id)
+            self._invalidate_reindex_checkpoint(meeting_id)
             return summary_chunks
         else:
             logger.warning("⚠️ 요약 결과에서 유효한 청크를 찾지 못했습니다.")
@@ -384,7 +907,9 @@ class VectorDBManager:
              filter_criteria: dict = None,
              score_threshold: float = None,  # <-- [수정됨] 점수 임계값 추가
              mmr_fetch_k: int = 20,         # <-- [수정됨] MMR fetch_k 추가
-             mmr_lambda_mult: float = 0.5   # <-- [수정됨] MMR lambda_mult 추가
+             mmr_lambda_mult: float = 0.5,  # <-- [수정됨] MMR lambda_mult 추가
+             meeting_ids: list = None,
+             query_embedding: list = None
              ) -> list:
         """
         지정된 DB에서 쿼리와 필터 조건을 사용하여 문서를 검색합니다.
@@ -394,11 +919,16 @@ class VectorDBManager:
             db_type (str): 검색할 DB 타입 ('chunks', 'subtopic').
             query (str): 검색할 텍스트 쿼리.
             k (int, optional): 반환할 결과의 수. Defaults to 5.
-            retriever_type (str, optional): 사용할 리트리버 타입 ('similarity', 'mmr', 'self_query', 'similarity_score_threshold'). Defaults to "similarity".
+            retriever_type (str, optional): 사용할 리트리버 타입 ('similarity', 'mmr', 'self_query', 'similarity_score_threshold', 'hybrid'). Defaults to "similarity".
+                'hybrid'는 BM25 키워드 검색과 벡터 검색 결과를 RRF로 결합합니다.
             filter_criteria (dict, optional): 메타데이터 필터링 조건 (예: {'meeting_id': '...', 'audio_file': '...'}). Defaults to None.
             score_threshold (float, optional): 유사도 점수 임계값 (0.0~1.0). Defaults to None.
             mmr_fetch_k (int, optional): MMR에서 초기 fetch할 문서 수. Defaults to 20.
             mmr_lambda_mult (float, optional): MMR의 다양성 파라미터 (0.0~1.0). Defaults to 0.5.
+            meeting_ids (list, optional): 검색 대상 meeting_id 목록. Chroma where 필터($in)로 변환됩니다.
+                빈 리스트이면 결과가 없습니다. Defaults to None (제한 없음).
+            query_embedding (list, optional): 미리 계산한 쿼리 임베딩. 'similarity', 'mmr'에서는
+                벡터로 직접 검색합니다. Defaults to None.
 
         Returns:
             list: LangChain Document 객체 리스트.
@@ -408,7 +938,7 @@ class VectorDBManager:
             raise ValueError(f"Unknown db_type: {db_type}. Available types are {list(self.vectorstores.keys())}")
 
         # [수정됨] "similarity_score_threshold"를 유효한 타입으로 허용
-        allowed_types = ["similarity", "mmr", "self_query", "similarity_score_threshold"]
+        allowed_types = ["similarity", "mmr", "self_query", "similarity_score_threshold", "hybrid"]
         if retriever_type not in allowed_types:
             raise ValueError(f"Unsupported retriever_type: {retriever_type}. Choose from {allowed_types}.")
 
@@ -421,6 +951,20 @@ class VectorDBManager:
         vdb = self.vectorstores[db_type]
         results = []
 
+        # meeting_id 제한을 Chroma where 필터로 변환 (검색 후 필터링 대신)
+        if meeting_ids is not None:
+            meeting_ids = list(dict.fromkeys(meeting_ids))
+            if not meeting_ids:
+                return []
+
+            # ID가 너무 많으면 배치별로 검색 후 거리 기준으로 병합
+            if len(meeting_ids) > config.VECTOR_FILTER_MAX_IDS:
+                return self._search_in_batches(db_type, query, k, filter_criteria, meeting_ids,
+                                               query_embedding=query_embedding)
+
+            base_filter = filter_criteria
+            filter_criteria = self._build_where_filter(filter_criteria, meeting_ids)
+
         # 2. Handle 'similarity', 'mmr', 'similarity_score_threshold' retrievers
         if current_retriever_type in ["similarity", "mmr", "similarity_score_threshold"]:
             search_kwargs = {'k': k}
@@ -437,39 +981,51 @@ class VectorDBManager:
                 search_kwargs['fetch_k'] = mmr_fetch_k
                 search_kwargs['lambda_mult'] = mmr_lambda_mult
 
-            retriever = vdb.as_retriever(
-                search_type=current_retriever_type,
-                search_kwargs=search_kwargs
-            )
-            results = retriever.invoke(query)
-
-        # 3. Handle 'self_query' retriever
+            try:
+                if query_embedding is not None and current_retriever_type == "similarity":
+                    # 미리 계산된 임베딩으로 직접 검색 (재임베딩 없음)
+                    results = vdb.similarity_search_by_vector(
+                        query_embedding, k=k, filter=search_kwargs.get('filter')
+                    )
+                elif query_embedding is not None and current_retriever_type == "mmr":
+                    results = vdb.max_marginal_relevance_search_by_vector(
+                        query_embedding,
+                        k=k,
+                        fetch_k=mmr_fetch_k,
+                        lambda_mult=mmr_lambda_mult,
+                        filter=search_kwargs.get('filter')
+                    )
+                else:
+                    retriever = vdb.as_retriever(
+                        search_type=current_retriever_type,
+                        search_kwargs=search_kwargs
+                    )
+                    results = retriever.invoke(query)
+            except Exception as e:
+                if meeting_ids is None:
+                    raise
+                # $in 필터를 처리하지 못하는 경우 meeting_id별 검색으로 폴백
+                logger.warning(f"⚠️ meeting_id $in 필터 검색 실패 (폴백: meeting_id별 검색): {e}")
+                return self._search_in_batches(db_type, query, k, base_filter, meeting_ids, batch_size=1,
+                                               query_embedding=query_embedding)
+
+        # 3. Handle 'hybrid' retriever (BM25 + vector, RRF)
+        elif current_retriever_type == "hybrid":
+            results = self._hybrid_search(db_type, query, k, filter_criteria, meeting_ids, query_embedding)
+
+        # 4. Handle 'self_query' retriever
         elif current_retriever_type == "self_query":
-            # (참고: SelfQueryRetriever는 기본적으로 내부에서 similarity_search를 사용합니다.)
-            # (여기서 점수 기반 필터링을 하려면, SelfQueryRetriever를 커스텀해야 할 수도 있습니다.)
-            metadata_info = self.metadata_field_infos[db_type]
-            doc_description = self.document_content_descriptions[db_type]
-
             try:
-                retriever = SelfQueryRetriever.from_llm(
-                    self.llm,
-                    vdb,
-                    doc_description,
-                    metadata_info,
-                    verbose=True,
-                    base_filter=filter_criteria,
-                    # [개선 아이디어] SelfQueryRetriever가 반환할 k의 개수를 설정할 수 있습니다.
-                    # 다만, invoke 시점이 아닌 생성 시점에 search_kwargs를 넘겨야 할 수 있습니다. (LangChain 버전에 따라 다름)
-                    # enable_limit=True를 사용하고 쿼리에 "top 3 results" 등을 포함시켜야 할 수도 있습니다.
-                )
-                results = retriever.invoke(query)
+                search_query, self_query_filter = self._translate_self_query(db_type, query, meeting_ids)
+
+                # 질문에서 추출한 필터와 기존 필터(meeting_id 범위 등)를 함께 적용
+                where_filter = self._merge_where_filters(filter_criteria, self_query_filter)
+                if search_query == query and query_embedding is not None:
+                    embedding = query_embedding
+                else:
+                    embedding = self.embed_query(search_query)
 
-                # [수정됨] SelfQuery 이후에도 k개만 반환하도록 강제 (필요시)
-                # SelfQueryRetriever는 k를 LLM이 추론하게 하므로, k가 무시될 수 있습니다.
-                # 만약 결과가 너무 많다면, k만큼 잘라냅니다.
-                if len(results) > k:
-                     logger.info(f"ℹ️ SelfQuery found {len(results)} results. Truncating to k={k}.")
-                     results = results[:k]
+                results = vdb.similarity_search_by_vector(embedding, k=k, filter=where_filter)
 
             except Exception as e:
                 # SelfQuery 실패 시 similarity search로 폴백
@@ -490,53 +1046,323 @@ class VectorDBManager:
                 )
                 results = retriever.invoke(query)
 
-        logger.info(f"✅ Found {len(results)} documents from '{self.COLLECTION_NAMES[db_type]}' for query: '{query}'")
+        logger.info(f"✅ Found {len(results)} documents from '{self.collection_names[db_type]}' for query: '{query}'")
         return results
 
     
-    def get_chunks_by_meeting_id(self, meeting_id: str) -> str:
+    def _get_self_query_retriever(self, db_type):
         """
-        meeting_id로 청킹된 문서를 chunk_index 순서대로 가져와서 하나의 문자열로 결합합니다.
+        컬렉션별 SelfQueryRetriever를 반환합니다 (최초 1회 생성 후 재사용).
 
         Args:
-            meeting_id (str): 회의 ID
+            db_type (str): 'chunks' 또는 'subtopic'
 
         Returns:
-            str: chunk_index 순서대로 결합된 전체 청크 텍스트
-                 (청크가 없으면 빈 문자열 반환)
+            SelfQueryRetriever: 쿼리 생성기(LLM)와 필터 변환기를 가진 리트리버
         """
-        try:
-            # meeting_chunks 컬렉션에서 해당 meeting_id의 모든 청크 조회
-            collection = self.client.get_collection(name=self.COLLECTION_NAMES['chunks'])
+        retriever = self.self_query_retrievers.get(db_type)
+        if retriever is not None:
+            return retriever
+
+        if self.llm is None:
+            raise RuntimeError("SelfQuery에 필요한 OPENAI_API_KEY가 설정되지 않았습니다.")
+
+        with self._self_query_lock:
+            retriever = self.self_query_retrievers.get(db_type)
+            if retriever is None:
+                retriever = SelfQueryRetriever.from_llm(
+                    self.llm,
+                    self.vectorstores[db_type],
+                    self.document_content_descriptions[db_type],
+                    self.metadata_field_infos[db_type],
+                )
+                self.self_query_retrievers[db_type] = retriever
+                logger.info(f"✅ SelfQueryRetriever 생성: '{self.collection_names[db_type]}'")
+            return retriever
+
+    def _rule_based_self_query(self, query, meeting_ids=None):
+        """
+        날짜/회의 제목이 들어간 자주 쓰는 질문을 LLM 없이 필터로 변환합니다.
+        날짜와 제목은 SQLite meetings 테이블에서 meeting_id 목록으로 바꿔 적용합니다
+        (meeting_date는 시간까지 포함된 문자열이라 Vector DB 메타데이터로는 날짜 비교가 어려움).
+
+        Args:
+            query (str): 사용자 질문
+            meeting_ids (list, optional): 접근 가능한 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            tuple or None: (검색어, where 필터 또는 None). 규칙에 해당하지 않으면 None
+        """
+        if self.db_manager is None:
+            return None
 
-            # meeting_id로 필터링하여 모든 항목 가져오기
-            results = collection.get(
-                where={"meeting_id": meeting_id},
-                include=["documents", "metadatas"]
+        dates = extract_dates(query)
+        quoted = extract_quoted_phrases(query)
+
+        accessible = None if meeting_ids is None else set(meeting_ids)
+
+        def _accessible_only(rows):
+            # 접근할 수 없는 회의의 제목은 일치 후보에서 먼저 제외 (다른 사용자 제목이 내 제목을 가리지 않도록)
+            return rows if accessible is None else [row for row in rows if row['meeting_id'] in accessible]
+
+        if quoted:
+            title_matches = _accessible_only(
+                [row for phrase, _ in quoted for row in self.db_manager.find_meetings_by_title_keyword(phrase)]
             )
+        else:
+            # 질문에 회의 제목이 그대로 언급된 경우 (가장 긴 제목만 사용해 짧은 제목의 우연한 일치 배제)
+            title_matches = _accessible_only(self.db_manager.find_meetings_by_title_in_text(query, min_length=3))
+            if title_matches:
+                longest = max(len(row['title']) for row in title_matches)
+                title_matches = [row for row in title_matches if len(row['title']) == longest]
+
+        if not dates and not quoted and not title_matches:
+            return None
+
+        matched_ids = None
+        if dates:
+            matched_ids = set()
+            for (year, month, day), _ in dates:
+                matched_ids.update(self.db_manager.find_meeting_ids_by_date(year, month, day))
+        if quoted or title_matches:
+            title_ids = {row['meeting_id'] for row in title_matches}
+            matched_ids = title_ids if matched_ids is None else matched_ids & title_ids
+
+        # 접근할 수 없는 회의는 제외 (다른 사용자의 회의 날짜와 일치해도 필터로 쓰지 않음)
+        if matched_ids and accessible is not None:
+            matched_ids &= accessible
+
+        search_query = remove_spans(query, [span for _, span in dates] + [span for _, span in quoted])
+
+        if not matched_ids:
+            # 패턴은 있지만 접근 가능한 해당 회의가 없으면 필터 없이 원래 질문으로 검색
+            return query, None
+
+        return search_query, self._build_where_filter(None, sorted(matched_ids))
+
+    def _translate_self_query(self, db_type, query, meeting_ids=None):
+        """
+        질문을 (검색어, 메타데이터 필터)로 변환합니다.
+        규칙 기반 변환 → TTL 캐시 → LLM(SelfQuery 쿼리 생성기) 순서로 시도합니다.
+
+        Args:
+            db_type (str): 'chunks' 또는 'subtopic'
+            query (str): 사용자 질문
+            meeting_ids (list, optional): 접근 가능한 meeting_id 목록 (None이면 전체)
+
+        Returns:
+            tuple: (검색어, where 필터 또는 None)
+        """
+        rule_result = self._rule_based_self_query(query, meeting_ids)
+        if rule_result is not None:
+            logger.info(f"⚡ SelfQuery 규칙 기반 변환: {rule_result}")
+            return rule_result
+
+        cache_key = (db_type, normalize_text(query))
+        cached = self.self_query_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️ SelfQuery 캐시 적중: {cached}")
+            return cached
+
+        retriever = self._get_self_query_retriever(db_type)
+        structured_query = retriever.query_constructor.invoke({"query": query})
+        search_query, search_kwargs = retriever.structured_query_translator.visit_structured_query(structured_query)
+
+        result = ((search_query or "").strip() or query, search_kwargs.get('filter'))
+        self.self_query_cache.set(cache_key, result)
+        logger.info(f"🤖 SelfQuery LLM 변환: {result}")
+        return result
+
+    def _merge_where_filters(self, first, second):
+        """
+        두 where 필터를 $and로 결합합니다 (한쪽이 없으면 다른 쪽을 그대로 반환).
+
+        Args:
+            first (dict or None): where 필터
+            second (dict or None): where 필터
+
+        Returns:
+            dict or None: 결합된 where 필터
+        """
+        clauses = []
+        for where in (first, second):
+            if not where:
+                continue
+            if len(where) == 1 or any(key.startswith('$') for key in where):
+                clauses.append(where)
+            else:
+                clauses.extend({key: value} for key, value in where.items())
+
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {'$and': clauses}
+
+    def _hybrid_search(self, db_type, query, k, where_filter, meeting_ids, query_embedding=None):
+        """
+        BM25 키워드 검색과 벡터 유사도 검색 결과를 Reciprocal Rank Fusion으로 결합합니다.
+        (벡터 검색이 놓치는 고유명사, 숫자, 전문용어 보완)
+
+        Args:
+            db_type (str): 검색할 DB 타입
+            query (str): 검색 쿼리
+            k (int): 반환할 결과 수
+            where_filter (dict or None): Chroma where 필터 (meeting_id 조건 포함)
+            meeting_ids (list or None): 검색 대상 meeting_id 목록 (BM25 필터용)
+            query_embedding (list, optional): 미리 계산한 쿼리 임베딩
+
+        Returns:
+            list: LangChain Document 객체 리스트 (RRF 점수 내림차순)
+        """
+        vdb = self.vectorstores[db_type]
+        candidates = max(k, config.HYBRID_CANDIDATES)
+
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
+
+        vector_docs = vdb.similarity_search_by_vector(query_embedding, k=candidates, filter=where_filter)
+        bm25_hits = self._get_bm25_index(db_type).search(query, k=candidates, meeting_ids=meeting_ids)
+
+        docs_by_id = {doc.id: doc for doc in vector_docs if doc.id}
+        fused = reciprocal_rank_fusion(
+            [[doc.id for doc in vector_docs if doc.id], [doc_id for doc_id, _ in bm25_hits]],
+            k=config.HYBRID_RRF_K
+        )
+
+        # BM25에서만 찾은 문서는 Vector DB에서 본문/메타데이터 조회 (where 필터 재적용)
+        top_ids = [doc_id for doc_id, _ in fused[:candidates]]
+        missing = [doc_id for doc_id in top_ids if doc_id not in docs_by_id]
+        if missing:
+            fetched = vdb._collection.get(ids=missing, where=where_filter, include=["documents", "metadatas"])
+            for doc_id, text, metadata in zip(fetched['ids'], fetched['documents'], fetched['metadatas']):
+                docs_by_id[doc_id] = Document(id=doc_id, page_content=text, metadata=metadata or {})
+
+        results = [docs_by_id[doc_id] for doc_id in top_ids if doc_id in docs_by_id][:k]
+
+        logger.info(f"🔀 Hybrid 검색: vector {len(vector_docs)}개 + BM25 {len(bm25_hits)}개 → {len(results)}개")
+        return results
+
+    def _build_where_filter(self, filter_criteria, meeting_ids):
+        """
+        메타데이터 필터와 meeting_id 목록을 하나의 Chroma where 필터로 결합합니다.
+
+        Args:
+            filter_criteria (dict or None): 기존 메타데이터 필터 (예: {'audio_file': '...'})
+            meeting_ids (list): meeting_id 목록
+
+        Returns:
+            dict: Chroma where 필터
+        """
+        if len(meeting_ids) == 1:
+            clauses = [{'meeting_id': meeting_ids[0]}]
+        else:
+            clauses = [{'meeting_id': {'$in': meeting_ids}}]
 
-            if not results or not results.get('documents'):
-                logger.warning(f"⚠️ meeting_id '{meeting_id}'에 대한 청크를 찾을 수 없습니다.")
-                return ""
+        if filter_criteria:
+            if len(filter_criteria) == 1 or any(key.startswith('$') for key in filter_criteria):
+                clauses.append(filter_criteria)
+            else:
+                # 여러 키를 가진 필터는 Chroma에서 $and로 묶어야 함
+                clauses.extend({key: value} for key, value in filter_criteria.items())
+
+        return clauses[0] if len(clauses) == 1 else {'$and': clauses}
+
+    def _search_in_batches(self, db_type, query, k, filter_criteria, meeting_ids, batch_size=None,
+                           query_embedding=None):
+        """
+        meeting_id 목록을 배치로 나누어 유사도 검색 후, 거리 기준으로 상위 k개를 병합합니다.
+        ($in 목록이 너무 크거나 $in 필터를 사용할 수 없을 때의 폴백)
+
+        Args:
+            db_type (str): 검색할 DB 타입
+            query (str): 검색 쿼리
+            k (int): 반환할 결과 수
+            filter_criteria (dict or None): 추가 메타데이터 필터
+            meeting_ids (list): meeting_id 목록
+            batch_size (int, optional): 배치당 meeting_id 수 (기본값: config.VECTOR_FILTER_MAX_IDS)
+            query_embedding (list, optional): 미리 계산한 쿼리 임베딩
+
+        Returns:
+            list: LangChain Document 객체 리스트 (거리 오름차순)
+        """
+        vdb = self.vectorstores[db_type]
+        batch_size = batch_size or config.VECTOR_FILTER_MAX_IDS
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
+
+        scored = []
+        for i in range(0, len(meeting_ids), batch_size):
+            batch = meeting_ids[i:i + batch_size]
+            scored.extend(vdb.similarity_search_by_vector_with_relevance_scores(
+                query_embedding,
+                k=k,
+                filter=self._build_where_filter(filter_criteria, batch)
+            ))
+
+        scored.sort(key=lambda item: item[1])
+        results = [doc for doc, _ in scored[:k]]
+
+        logger.info(f"✅ Found {len(results)} documents from '{self.collection_names[db_type]}' "
+                    f"({len(meeting_ids)} meetings, batch={batch_size})")
+        return results
+
+    def search_meeting_batch(self, meeting_id, query_embeddings, k=5):
+        """
+        한 회의 안에서 여러 질문을 한 번에 검색합니다.
+        컬렉션별로 회의 문서와 임베딩을 한 번만 조회하고, 질문 × 문서 코사인 유사도 행렬로 질문별 top-k를 고릅니다.
+        (회의 하나의 문서 수는 작으므로 전수 비교가 질문별 벡터 검색보다 빠름)
 
-            # documents와 metadatas를 chunk_index 순서로 정렬
-            documents = results['documents']
-            metadatas = results['metadatas']
+        Args:
+            meeting_id (str): 회의 ID
+            query_embeddings (list[list[float]]): 질문 임베딩 목록
+            k (int): 컬렉션별 질문당 반환할 문서 수
 
-            # (chunk_index, document) 튜플 리스트 생성 후 정렬
-            indexed_docs = []
-            for doc, meta in zip(documents, metadatas):
-                chunk_index = meta.get('chunk_index', 0)
-                indexed_docs.append((chunk_index, doc))
+        Returns:
+            dict: {'chunks': [[Document, ...], ...], 'subtopic': [[Document, ...], ...]}
+                  질문 순서와 같은 목록이며, 같은 문서는 질문 간에 같은 Document 객체를 공유합니다.
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        queries /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+
+        results = {}
+        for db_type in ('chunks', 'subtopic'):
+            found = self.vectorstores[db_type]._collection.get(
+                where={'meeting_id': meeting_id},
+                include=['documents', 'metadatas', 'embeddings']
+            )
+            vectors = found.get('embeddings')
+            if vectors is None or len(vectors) == 0:
+                results[db_type] = [[] for _ in range(len(queries))]
+                continue
+
+            docs = [
+                Document(id=doc_id, page_content=text, metadata=metadata or {})
+                for doc_id, text, metadata in zip(found['ids'], found['documents'], found['metadatas'])
+            ]
+            matrix = np.asarray(vectors, dtype=np.float32)
+            matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+
+            top = np.argsort(-(queries @ matrix.T), axis=1)[:, :k]
+            results[db_type] = [[docs[i] for i in row] for row in top]
+
+        logger.info(f"✅ 회의 '{meeting_id}' 일괄 검색: 질문 {len(queries)}개, 컬렉션 조회 2회")
+        return results
 
-            # chunk_index 기준으로 정렬
-            indexed_docs.sort(key=lambda x: x[0])
+    def get_chunks_by_meeting_id(self, meeting_id: str) -> str:
+        """
+        meeting_id로 청킹된 문서를 chunk_index 순서대로 가져와서 하나의 문자열로 결합합니다.
+        결합 결과는 캐시되며, 청크가 저장/삭제되면 무효화됩니다.
 
-            # 문서들을 순서대로 결합 (각 문서 사이에 줄바꿈 2개 추가)
-            full_chunks = "\n\n".join([doc for _, doc in indexed_docs])
+        Args:
+            meeting_id (str): 회의 ID
 
-            logger.info(f"✅ meeting_id '{meeting_id}'에 대한 {len(indexed_docs)}개의 청크를 순서대로 가져왔습니다.")
-            return full_chunks
+        Returns:
+            str: chunk_index 순서대로 결합된 전체 청크 텍스트
+                 (청크가 없으면 빈 문자열 반환)
+        """
+        try:
+            return self.assembled_text_cache.get_or_load(
+                'chunks', meeting_id, lambda: self._assemble_meeting_text('chunks', meeting_id)
+            )
 
         except Exception as e:
             logger.error(f"❌ 청크 조회 중 오류 발생: {e}")
@@ -547,6 +1373,7 @@ class VectorDBManager:
     def get_summary_by_meeting_id(self, meeting_id: str) -> str:
         """
         meeting_id로 문단 요약을 summary_index 순서대로 가져와서 하나의 문자열로 결합합니다.
+        결합 결과는 캐시되며, 문단 요약이 저장/삭제되면 무효화됩니다.
 
         Args:
             meeting_id (str): 회의 ID
@@ -556,44 +1383,52 @@ class VectorDBManager:
                  (요약이 없으면 빈 문자열 반환)
         """
         try:
-            # meeting_subtopic 컬렉션에서 해당 meeting_id의 모든 청크 조회
-            collection = self.client.get_collection(name=self.COLLECTION_NAMES['subtopic'])
-
-            # meeting_id로 필터링하여 모든 항목 가져오기
-            results = collection.get(
-                where={"meeting_id": meeting_id},
-                include=["documents", "metadatas"]
+            return self.assembled_text_cache.get_or_load(
+                'subtopic', meeting_id, lambda: self._assemble_meeting_text('subtopic', meeting_id)
             )
 
-            if not results or not results.get('documents'):
-                logger.warning(f"⚠️ meeting_id '{meeting_id}'에 대한 문단 요약을 찾을 수 없습니다.")
-                return ""
-
-            # documents와 metadatas를 summary_index 순서로 정렬
-            documents = results['documents']
-            metadatas = results['metadatas']
+        except Exception as e:
+            logger.error(f"❌ 문단 요약 조회 중 오류 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return ""
 
-            # (summary_index, document) 튜플 리스트 생성 후 정렬
-            indexed_docs = []
-            for doc, meta in zip(documents, metadatas):
-                summary_index = meta.get('summary_index', 0)
-                indexed_docs.append((summary_index, doc))
+    def _assemble_meeting_text(self, db_type, meeting_id):
+        """
+        컬렉션에서 회의 문서를 모두 가져와 순서대로 결합합니다 (캐시 미스 시 호출).
 
-            # summary_index 기준으로 정렬
-            indexed_docs.sort(key=lambda x: x[0])
+        Args:
+            db_type (str): 'chunks' (chunk_index 순) 또는 'subtopic' (summary_index 순)
+            meeting_id (str): 회의 ID
 
-            # 문서들을 순서대로 결합 (각 문서 사이에 줄바꿈 2개 추가)
-            full_summary = "\n\n".join([doc for _, doc in indexed_docs])
+        Returns:
+            str: 결합된 텍스트 (문서가 없으면 빈 문자열)
+        """
+        order_key = 'chunk_index' if db_type == 'chunks' else 'summary_index'
+        label = '청크' if db_type == 'chunks' else '문단 요약'
 
-            logger.info(f"✅ meeting_id '{meeting_id}'에 대한 {len(indexed_docs)}개의 문단 요약을 순서대로 가져왔습니다.")
-            return full_summary
+        # meeting_id로 필터링하여 모든 항목 가져오기
+        results = self.vectorstores[db_type]._collection.get(
+            where={"meeting_id": meeting_id},
+            include=["documents", "metadatas"]
+        )
 
-        except Exception as e:
-            logger.error(f"❌ 문단 요약 조회 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+        if not results or not results.get('documents'):
+            logger.warning(f"⚠️ meeting_id '{meeting_id}'에 대한 {label}을(를) 찾을 수 없습니다.")
             return ""
 
+        # (index, document) 튜플 리스트 생성 후 index 기준으로 정렬
+        indexed_docs = [
+            (meta.get(order_key, 0), doc)
+            for doc, meta in zip(results['documents'], results['metadatas'])
+        ]
+        indexed_docs.sort(key=lambda x: x[0])
+
+        # 문서들을 순서대로 결합 (각 문서 사이에 줄바꿈 2개 추가)
+        logger.info(f"✅ meeting_id '{meeting_id}'에 대한 {len(indexed_docs)}개의 {label}을(를) 순서대로 가져왔습니다.")
+        return "\n\n".join([doc for _, doc in indexed_docs])
+
+    @_index_write
     def delete_from_collection(self, db_type, meeting_id=None, audio_file=None, title=None):
         """
         지정된 벡터 DB 컬렉션에서 항목을 삭제합니다.
@@ -611,7 +1446,7 @@ class VectorDBManager:
         if db_type not in self.vectorstores:
             raise ValueError(f"Unknown db_type: {db_type}. Must be one of {list(self.COLLECTION_NAMES.keys())}")
 
-        collection = self.client.get_or_create_collection(name=self.COLLECTION_NAMES[db_type])
+        collection = self.vectorstores[db_type]._collection
 
         filters = {}
         if meeting_id:
@@ -632,6 +1467,25 @@ class VectorDBManager:
             collection.delete(where={}) # deletes all items
             logger.info(f"✅ All items deleted from '{db_type}' collection.")
 
+        # BM25 인덱스 / 결합 텍스트 캐시 갱신 (meeting_id 단독 삭제가 아니면 전체 무효화)
+        if list(filters.keys()) == ["meeting_id"]:
+            self._bm25_remove_meeting(db_type, meeting_id)
+            self.assembled_text_cache.invalidate(meeting_id, kinds=(db_type,))
+        else:
+            self.bm25_indexes.pop(db_type, None)
+            self.assembled_text_cache.clear(kinds=(db_type,))
+
+        if meeting_id:
+            self.meeting_revisions.bump(meeting_id)
+        else:
+            self.meeting_revisions.bump_all()
+
+        # 남은 청크/서브토픽으로 회의 centroid 재계산
+        if meeting_id and db_type != 'centroids':
+            self.update_meeting_centroids(meeting_id)
+        elif db_type == 'centroids' or not filters:
+            self.centroid_index = None
+
     def _get_audio_file_from_vector_db(self, meeting_id):
         """
         Vector DB에서 meeting_id로 audio_file을 조회합니다.
@@ -644,24 +1498,15 @@ class VectorDBManager:
             str or None: audio_file 이름 또는 None
         """
         try:
-            import sqlite3
-            conn = sqlite3.connect(os.path.join(os.path.dirname(__file__), '..', 'database', 'vector_db', 'chroma.sqlite3'))
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT string_value
-                FROM embedding_metadata
-                WHERE key = "audio_file" AND id IN (
-                    SELECT DISTINCT id FROM embedding_metadata
-                    WHERE key = "meeting_id" AND string_value = ?
-                )
-                LIMIT 1
-            ''', (meeting_id,))
-
-            result = cursor.fetchone()
-            conn.close()
+            # 벡터 엔진(chroma/flat) 공통 컬렉션 API로 조회
+            result = self.vectorstores['chunks']._collection.get(
+                where={'meeting_id': meeting_id},
+                limit=1,
+                include=['metadatas']
+            )
+            metadatas = result.get('metadatas') or []
 
-            return result[0] if result else None
+            return metadatas[0].get('audio_file') if metadatas else None
         except Exception as e:
             logger.warning(f"⚠️ Vector DB에서 audio_file 조회 실패: {e}")
             return None
@@ -735,6 +1580,7 @@ class VectorDBManager:
 
                 # 삭제 실행
                 chunks_collection.delete(where={"meeting_id": meeting_id})
+                self._bm25_remove_meeting('chunks', meeting_id)
                 logger.info(f"[삭제 수행] meeting_chunk: {before_chunks_count}개 삭제 시도")
                 deleted_chunks_count = before_chunks_count
 
@@ -780,6 +1626,7 @@ class VectorDBManager:
 
                 # 삭제 실행
                 subtopic_collection.delete(where={"meeting_id": meeting_id})
+                self._bm25_remove_meeting('subtopic', meeting_id)
                 logger.info(f"[삭제 수행] meeting_subtopic: {before_subtopic_count}개 삭제 시도")
                 deleted_subtopic_count = before_subtopic_count
 
@@ -805,6 +1652,11 @@ class VectorDBManager:
             import traceback
             traceback.print_exc()
 
+        # 회의 centroid / 결합 텍스트 캐시 삭제
+        self._remove_meeting_centroids(meeting_id)
+        self.assembled_text_cache.invalidate(meeting_id)
+        self.meeting_revisions.bump(meeting_id)
+
         # 5. 미디어 파일 삭제 (오디오 또는 비디오)
         logger.info(f"\n📊 [미디어 파일 삭제 검증 시작] meeting_id = {meeting_id}")
         logger.info("=" * 70)
@@ -865,6 +1717,7 @@ class VectorDBManager:
             }
         }
 
+    @_index_write
     def update_metadata_title(self, meeting_id, new_title):
         """
         ChromaDB의 meeting_chunk와 meeting_subtopic 컬렉션에서
@@ -877,6 +1730,7 @@ class VectorDBManager:
         Returns:
             dict: 업데이트 결과 {'success': bool, 'updated_chunks': int, 'updated_subtopics': int}
         """
+        self._invalidate_reindex_checkpoint(meeting_id)
         logger.info(f"\n📊 [ChromaDB 메타데이터 업데이트 시작] meeting_id = {meeting_id}")
         logger.info("=" * 70)
 
@@ -887,8 +1741,8 @@ class VectorDBManager:
             # 1. meeting_chunk 컬렉션 업데이트
             logger.info(f"[1/2] meeting_chunk 컬렉션 업데이트 중...")
 
-            # ChromaDB 네이티브 컬렉션 가져오기
-            chunk_collection = self.client.get_collection(name=self.COLLECTION_NAMES['chunks'])
+            # 벡터 엔진의 네이티브 컬렉션 가져오기
+            chunk_collection = self.vectorstores['chunks']._collection
 
             # meeting_id로 문서 조회
             chunk_results = chunk_collection.get(
@@ -918,8 +1772,8 @@ class VectorDBManager:
             # 2. meeting_subtopic 컬렉션 업데이트
             logger.info(f"[2/2] meeting_subtopic 컬렉션 업데이트 중...")
 
-            # ChromaDB 네이티브 컬렉션 가져오기
-            subtopic_collection = self.client.get_collection(name=self.COLLECTION_NAMES['subtopic'])
+            # 벡터 엔진의 네이티브 컬렉션 가져오기
+            subtopic_collection = self.vectorstores['subtopic']._collection
 
             # meeting_id로 문서 조회
             subtopic_results = subtopic_collection.get(
@@ -946,6 +1800,7 @@ class VectorDBManager:
             else:
                 logger.info(f"   ℹ️ meeting_subtopic: 업데이트할 문서 없음")
 
+            self.meeting_revisions.bump(meeting_id)
             logger.info("-" * 70)
             logger.info(f"✅ ChromaDB 메타데이터 업데이트 완료")
             logger.info(f"   • meeting_chunk: {updated_chunks}개")
@@ -960,6 +1815,7 @@ class VectorDBManager:
 
         except Exception as e:
             logger.error(f"❌ ChromaDB 메타데이터 업데이트 실패: {e}")
+            self.meeting_revisions.bump(meeting_id)
             logger.info("=" * 70 + "\n")
             return {
                 'success': False,
@@ -968,6 +1824,7 @@ class VectorDBManager:
                 'updated_subtopics': updated_subtopics
             }
 
+    @_index_write
     def update_metadata_date(self, meeting_id, new_date):
         """
         ChromaDB의 meeting_chunk와 meeting_subtopic 컬렉션에서
@@ -980,6 +1837,7 @@ class VectorDBManager:
         Returns:
             dict: 업데이트 결과 {'success': bool, 'updated_chunks': int, 'updated_subtopics': int}
         """
+        self._invalidate_reindex_checkpoint(meeting_id)
         logger.info(f"\n📊 [ChromaDB 날짜 메타데이터 업데이트 시작] meeting_id = {meeting_id}")
         logger.info("=" * 70)
 
@@ -990,8 +1848,8 @@ class VectorDBManager:
             # 1. meeting_chunk 컬렉션 업데이트
             logger.info(f"[1/2] meeting_chunk 컬렉션 업데이트 중...")
 
-            # ChromaDB 네이티브 컬렉션 가져오기
-            chunk_collection = self.client.get_collection(name=self.COLLECTION_NAMES['chunks'])
+            # 벡터 엔진의 네이티브 컬렉션 가져오기
+            chunk_collection = self.vectorstores['chunks']._collection
 
             # meeting_id로 문서 조회
             chunk_results = chunk_collection.get(
@@ -1021,8 +1879,8 @@ class VectorDBManager:
             # 2. meeting_subtopic 컬렉션 업데이트
             logger.info(f"[2/2] meeting_subtopic 컬렉션 업데이트 중...")
 
-            # ChromaDB 네이티브 컬렉션 가져오기
-            subtopic_collection = self.client.get_collection(name=self.COLLECTION_NAMES['subtopic'])
+            # 벡터 엔진의 네이티브 컬렉션 가져오기
+            subtopic_collection = self.vectorstores['subtopic']._collection
 
             # meeting_id로 문서 조회
             subtopic_results = subtopic_collection.get(
@@ -1049,6 +1907,7 @@ class VectorDBManager:
             else:
                 logger.info(f"   ℹ️ meeting_subtopic: 업데이트할 문서 없음")
 
+            self.meeting_revisions.bump(meeting_id)
             logger.info("-" * 70)
             logger.info(f"✅ ChromaDB 날짜 메타데이터 업데이트 완료")
             logger.info(f"   • meeting_chunk: {updated_chunks}개")
@@ -1063,6 +1922,7 @@ class VectorDBManager:
 
         except Exception as e:
             logger.error(f"❌ ChromaDB 날짜 메타데이터 업데이트 실패: {e}")
+            self.meeting_revisions.bump(meeting_id)
             logger.info("=" * 70 + "\n")
             return {
                 'success': False,